@@ -0,0 +1,31 @@
+"""
+Shared helpers for the data-insight tasks.
+
+Tasks live in hyphenated folders under `tasks/` and cannot import each other,
+so code that several tasks need (table encoding, schema profiling, ...) lives
+in this package.
+"""
+
+from .table_codec import (
+    TABLE_FORMATS,
+    clear_table_cache,
+    configure_table_cache,
+    decode_table,
+    encode_table,
+    table_columns,
+    table_head_records,
+    table_row_count,
+)
+from .schema_profiler import profile_schema
+
+__all__ = [
+    "TABLE_FORMATS",
+    "clear_table_cache",
+    "configure_table_cache",
+    "decode_table",
+    "encode_table",
+    "profile_schema",
+    "table_columns",
+    "table_head_records",
+    "table_row_count",
+]
@@ -0,0 +1,170 @@
+"""
+Write a stream of DataFrame chunks into a Parquet snapshot under the session
+directory without holding the whole table in memory.
+
+Each chunk becomes a Parquet part; the parts are merged (in order) into one
+file named by content hash. Chunks are sketched as they stream past, so the
+schema (with quantiles and top values) needs no second pass over the file;
+when a column changes kind between chunks the file is profiled out-of-core
+with DuckDB instead.
+"""
+
+import hashlib
+import os
+import shutil
+import uuid
+from typing import Callable, Iterable
+
+import duckdb
+import pandas as pd
+
+from .schema_profiler import profile_parquet_file, profile_sketch
+from .sketches import TableSketch, column_kind
+from .table_codec import (
+    TABLES_SUBDIR,
+    build_reference_table,
+    content_hash_of,
+    escape_sql_string,
+    write_parquet_file,
+)
+
+
+def ingest_chunks(
+    chunks: Iterable[pd.DataFrame],
+    session_dir: str,
+    on_chunk: Callable[[int], None] | None = None
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Stream DataFrame chunks into a Parquet snapshot.
+
+    Args:
+        chunks: Iterable of DataFrames sharing the same columns
+        session_dir: Session directory that receives the Parquet file
+        on_chunk: Called with the running row count after each chunk is written
+
+    Returns:
+        (first chunk, reference data_table) - the first chunk is meant for previews
+    """
+    tables_dir = os.path.join(session_dir, TABLES_SUBDIR)
+    parts_dir = os.path.join(tables_dir, f"parts-{uuid.uuid4().hex}")
+    os.makedirs(parts_dir)
+
+    digest = hashlib.blake2b(digest_size=32)
+    sketch = TableSketch()
+    first_chunk = None
+    row_count = 0
+
+    try:
+        for index, chunk in enumerate(chunks):
+            if chunk.empty:
+                continue
+            if first_chunk is None:
+                first_chunk = chunk
+
+            digest.update(content_hash_of(chunk).encode())
+            write_parquet_file(chunk, os.path.join(parts_dir, f"part-{index:06d}.parquet"))
+            row_count += len(chunk)
+            if sketch is not None:
+                try:
+                    sketch.update(chunk)
+                except ValueError:
+                    sketch = None
+
+            if on_chunk:
+                on_chunk(row_count)
+
+        if first_chunk is None:
+            raise ValueError("Loaded data is empty")
+
+        content_hash = digest.hexdigest()
+        output_path = os.path.join(tables_dir, f"{content_hash[:32]}.parquet")
+        if not os.path.exists(output_path):
+            merge_parquet_parts(parts_dir, output_path)
+    finally:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
+    sample = merged_sample(first_chunk, output_path)
+    schema = sketch_schema(sketch, sample) if sketch is not None else None
+    if schema is None:
+        schema = profile_parquet_file(output_path, sample)
+    data_table = build_reference_table(
+        output_path,
+        "parquet",
+        content_hash,
+        sample.columns.tolist(),
+        row_count,
+        {col: str(sample[col].dtype) for col in sample.columns},
+        schema
+    )
+
+    return first_chunk, data_table
+
+
+def sketch_schema(sketch: TableSketch, sample: pd.DataFrame) -> dict | None:
+    """
+    Profile the streamed chunks from their sketch, with the merged file's dtypes.
+
+    Returns None when a merged column's kind differs from the kind it was
+    sketched as (for example integers that only turned into strings in the
+    merged schema), in which case the file has to be profiled directly.
+    """
+    for col in sample.columns:
+        col_sketch = sketch.columns.get(col)
+        if col_sketch is None or col_sketch.kind != column_kind(sample[col]):
+            return None
+    return profile_sketch(sketch, {col: str(sample[col].dtype) for col in sample.columns})
+
+
+def merged_sample(first_chunk: pd.DataFrame, output_path: str) -> pd.DataFrame:
+    """
+    Return the first chunk with the columns and types of the merged file.
+
+    Later chunks may add columns or widen types (an integer column that
+    turns out to hold floats), so the merged file is authoritative. Columns
+    whose type kind did not change keep the richer pandas dtype of the
+    first chunk (categoricals, nullable integers).
+    """
+    conn = duckdb.connect(":memory:")
+    try:
+        merged = conn.execute(
+            f"SELECT * FROM read_parquet('{escape_sql_string(output_path)}') LIMIT {len(first_chunk)}"
+        ).df()
+    finally:
+        conn.close()
+
+    for col in merged.columns:
+        if col in first_chunk.columns and same_kind(first_chunk[col].dtype, merged[col].dtype):
+            merged[col] = first_chunk[col].iloc[:len(merged)].to_numpy()
+            merged[col] = merged[col].astype(first_chunk[col].dtype)
+    return merged
+
+
+def same_kind(left, right) -> bool:
+    """Check whether two dtypes hold the same kind of values (int, float, string, ...)"""
+    checks = (
+        pd.api.types.is_bool_dtype,
+        pd.api.types.is_integer_dtype,
+        pd.api.types.is_float_dtype,
+        pd.api.types.is_datetime64_any_dtype,
+    )
+    for check in checks:
+        if check(left) or check(right):
+            return check(left) and check(right)
+    return True
+
+
+def merge_parquet_parts(parts_dir: str, output_path: str) -> None:
+    """Merge the Parquet parts of a directory (in name order) into one file"""
+    parts_glob = escape_sql_string(os.path.join(parts_dir, "*.parquet"))
+    tmp_path = f"{output_path}.{uuid.uuid4().hex}.tmp"
+
+    conn = duckdb.connect(":memory:")
+    try:
+        conn.execute(
+            f"COPY (SELECT * FROM read_parquet('{parts_glob}', union_by_name = true)) "
+            f"TO '{escape_sql_string(tmp_path)}' (FORMAT PARQUET)"
+        )
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, output_path)
@@ -0,0 +1,114 @@
+"""
+Compressed text inputs (CSV, JSON, JSON Lines) for data-loader.
+
+Compression is detected from the file's magic bytes, so misnamed or
+extension-less exports work too. Files are decompressed as a stream while
+they are parsed; the expanded data is never written to disk or held in
+memory as a whole. Zstandard needs the optional `zstandard` package.
+
+Zip archives may hold several members; each member is parsed on its own.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+import zipfile
+from typing import IO, Callable
+
+import pandas as pd
+
+
+# Leading bytes of each supported container
+COMPRESSION_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"\xfd7zXZ\x00": "xz",
+    b"PK\x03\x04": "zip",
+}
+
+COMPRESSED_SOURCE_TYPES = ("csv", "json", "jsonl")
+
+# Zip members are parsed by extension; other members are skipped
+MEMBER_SOURCE_TYPES = {
+    ".csv": "csv",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+def detect_compression(path: str) -> str | None:
+    """Return the compression of a file ("gzip", "bz2", "zstd", "xz", "zip") or None"""
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, compression in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_decompressed(handle: IO[bytes], compression: str) -> IO[bytes]:
+    """Wrap a binary file handle in a streaming decompressor"""
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=handle)
+    if compression == "bz2":
+        return bz2.BZ2File(handle)
+    if compression == "xz":
+        return lzma.LZMAFile(handle)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Zstandard-compressed files require zstandard (pip install zstandard)") from e
+        return zstandard.ZstdDecompressor().stream_reader(handle, closefd=False)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def zip_member_names(archive: zipfile.ZipFile) -> list[str]:
+    """Return the data members of a zip archive (skipping folders and macOS metadata)"""
+    return [
+        info.filename for info in archive.infolist()
+        if not info.is_dir() and not info.filename.startswith("__MACOSX/")
+        and not os.path.basename(info.filename).startswith(".")
+    ]
+
+
+def member_source_type(name: str, default: str) -> str | None:
+    """Return the source type of a zip member from its extension"""
+    extension = os.path.splitext(name)[1].lower()
+    if not extension:
+        return default
+    return MEMBER_SOURCE_TYPES.get(extension)
+
+
+def read_zip_members(
+    path: str,
+    default_source_type: str,
+    read_member: Callable[[IO[bytes], str], pd.DataFrame]
+) -> dict[str, pd.DataFrame]:
+    """
+    Parse every data member of a zip archive.
+
+    Args:
+        path: Zip archive path
+        default_source_type: Source type of members without an extension
+        read_member: Called with an open (streaming) member handle and its
+            source type; returns the parsed DataFrame
+
+    Returns:
+        Member name -> DataFrame, in archive order
+    """
+    frames = {}
+    with zipfile.ZipFile(path) as archive:
+        for name in zip_member_names(archive):
+            source_type = member_source_type(name, default_source_type)
+            if source_type is None:
+                continue
+            with archive.open(name) as member:
+                frames[name] = read_member(member, source_type)
+
+    if not frames:
+        raise ValueError(f"No CSV/JSON members found in zip archive: {path}")
+    return frames
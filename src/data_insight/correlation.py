@@ -0,0 +1,288 @@
+"""
+Correlation matrices with p-values for many columns at once.
+
+Every method is computed for all column pairs with a few matrix products
+instead of a Python loop over pairs. Missing values are handled pairwise:
+each pair uses the rows where both columns are present, and the number of
+such rows is returned alongside the coefficients.
+
+- Pearson: centered sums over pair-complete rows; t-test p-values
+- Spearman: Pearson over ranks; t-test p-values. Columns sharing one
+  missing-value pattern are ranked once and correlated together; pairs of
+  columns with different patterns are re-ranked over the pair's complete
+  rows, as `scipy.stats.spearmanr(..., nan_policy="omit")` does
+- Kendall tau-b: concordance from sign products of row pairs; normal
+  approximation p-values. Tables longer than `kendall_max_rows`
+  (KENDALL_MAX_ROWS by default) are estimated on a seeded row sample,
+  since the cost grows with rows squared; the result is then flagged as
+  sampled and its pair counts and p-values are those of the sample
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .multiple_testing import adjust_p_values
+
+
+CORRELATION_METHODS = ("pearson", "spearman", "kendall")
+
+KENDALL_MAX_ROWS = 1000
+
+# Row pairs per block of the Kendall sign matrices. Each block holds a few
+# float32 matrices of KENDALL_PAIR_BLOCK * columns * 4 bytes (32 MB each at
+# 400 columns, at most five alive at once)
+KENDALL_PAIR_BLOCK = 20_000
+
+
+def correlation_matrices(
+    df: pd.DataFrame,
+    methods=CORRELATION_METHODS,
+    seed: int | None = 0,
+    kendall_max_rows: int | None = KENDALL_MAX_ROWS
+) -> dict:
+    """
+    Compute correlation, p-value and pair-count matrices.
+
+    Args:
+        df: Numeric columns to correlate
+        methods: Any of "pearson", "spearman", "kendall"
+        seed: Row sample seed for Kendall on long tables
+        kendall_max_rows: Estimate Kendall on a sample of this many rows
+            when the table is longer (None: always use every row)
+
+    Returns:
+        {method: {"r": DataFrame, "p": DataFrame, "n": DataFrame}}. A
+        sampled Kendall result also carries "sampled": True, "rows_used"
+        and "total_rows"; its "n" and "p" come from the sample
+    """
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    columns = df.columns
+
+    results = {}
+    for method in methods:
+        if method == "pearson":
+            r, n = pearson_pairwise(values)
+            p = t_test_p_values(r, n)
+            extra = {}
+        elif method == "spearman":
+            r, n = spearman_pairwise(values)
+            p = t_test_p_values(r, n)
+            extra = {}
+        elif method == "kendall":
+            sample = values
+            if kendall_max_rows and len(values) > kendall_max_rows:
+                rng = np.random.default_rng(seed)
+                sample = values[np.sort(rng.choice(len(values), int(kendall_max_rows), replace=False))]
+            r, n = kendall_pairwise(sample)
+            p = kendall_p_values(r, n)
+            extra = {}
+            if len(sample) < len(values):
+                extra = {"sampled": True, "rows_used": int(len(sample)), "total_rows": int(len(values))}
+        else:
+            raise ValueError(
+                f"Unsupported correlation method: {method} (supported: {', '.join(CORRELATION_METHODS)})"
+            )
+
+        results[method] = {
+            "r": pd.DataFrame(r, index=columns, columns=columns),
+            "p": pd.DataFrame(p, index=columns, columns=columns),
+            "n": pd.DataFrame(n.astype(np.int64), index=columns, columns=columns),
+            **extra,
+        }
+    return results
+
+
+def pearson_pairwise(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pearson coefficients and pair-complete row counts of every column pair"""
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+    # Centering on the column means keeps the sums small (the coefficient is
+    # shift-invariant, so pairwise means are not needed)
+    with np.errstate(invalid="ignore"):
+        centered = np.where(present, values - np.nanmean(values, axis=0), 0.0)
+
+    if present.all():
+        # Complete data: one cross product (pairwise sums equal column sums)
+        n = np.full((values.shape[1],) * 2, float(len(values)))
+        products = centered.T @ centered
+        scale = np.sqrt(np.diag(products))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.clip(products / np.outer(scale, scale), -1.0, 1.0)
+        np.fill_diagonal(r, np.where(scale > 0, 1.0, np.nan))
+        return r, n
+
+    n = mask.T @ mask
+    sums = centered.T @ mask            # sums[i, j]: sum of column i over rows where j is present
+    squares = (centered ** 2).T @ mask
+    products = centered.T @ centered
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = products - sums * sums.T / n
+        variance_x = squares - sums ** 2 / n
+        r = covariance / np.sqrt(variance_x * variance_x.T)
+    r = np.clip(r, -1.0, 1.0)
+    np.fill_diagonal(r, np.where(np.diag(variance_x) > 0, 1.0, np.nan))
+    return r, n
+
+
+def spearman_pairwise(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Spearman coefficients and pair-complete row counts of every column pair.
+
+    Ranking each column over its own present values is only right for pairs
+    whose columns miss the same rows. Those pairs come from one Pearson over
+    per-column ranks; the other pairs are re-ranked over their complete rows.
+    """
+    ranks = rank_columns(values)
+    r, n = pearson_pairwise(ranks)
+    present = ~np.isnan(values)
+    if present.all():
+        return r, n
+
+    _, pattern = np.unique(present, axis=1, return_inverse=True)
+    pattern = pattern.ravel()
+    first, second = np.triu_indices(values.shape[1], k=1)
+    for i, j in zip(first, second):
+        if pattern[i] == pattern[j]:
+            continue
+        rows = present[:, i] & present[:, j]
+        pair_r, _ = pearson_pairwise(rank_columns(values[rows][:, [i, j]]))
+        r[i, j] = r[j, i] = pair_r[0, 1]
+    return r, n
+
+
+def rank_columns(values: np.ndarray) -> np.ndarray:
+    """
+    Average ranks of each column's present values (NaN stays NaN).
+
+    Columns without ties (most continuous data) are ranked by inverting one
+    argsort; only tied columns pay for average-rank bookkeeping.
+    """
+    ranks = np.full(values.shape, np.nan)
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        present = ~np.isnan(column)
+        x = column[present]
+        order = np.argsort(x)
+        ordered = x[order]
+        if np.any(ordered[1:] == ordered[:-1]):
+            column_ranks = stats.rankdata(x)
+        else:
+            column_ranks = np.empty(len(x))
+            column_ranks[order] = np.arange(1, len(x) + 1)
+        ranks[present, j] = column_ranks
+    return ranks
+
+
+def t_test_p_values(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Two-sided p-values of Pearson/Spearman coefficients (t with n - 2 df)"""
+    dof = n - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt(dof / np.maximum(1.0 - r ** 2, 1e-300))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+    p[dof <= 0] = np.nan
+    return p
+
+
+def kendall_pairwise(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Kendall tau-b coefficients and pair-complete row counts of every column pair.
+
+    For each row pair (a, b) the sign of x_a - x_b is 0 for ties and missing
+    values, so S^T S sums concordant minus discordant pairs over pairs where
+    both columns are present. The tau-b denominators count the untied pairs
+    of each column among the row pairs where the other column is present.
+    """
+    rows, cols = values.shape
+    present = ~np.isnan(values)
+    # Tau only depends on the order of the values, so the signs are taken
+    # over ranks, which float32 holds exactly (unlike the raw values)
+    ranks = np.where(present, rank_columns(values), 0.0).astype(np.float32)
+    complete = present.all()
+
+    concordance = np.zeros((cols, cols))
+    untied = np.zeros((cols, cols))
+    first, second = np.triu_indices(rows, k=1)
+    for start in range(0, len(first), KENDALL_PAIR_BLOCK):
+        a = first[start:start + KENDALL_PAIR_BLOCK]
+        b = second[start:start + KENDALL_PAIR_BLOCK]
+        signs = ranks[a] - ranks[b]
+        np.sign(signs, out=signs)
+        if complete:
+            # Every row pair counts for every column: untied pairs are per column
+            concordance += signs.T @ signs
+            untied += np.abs(signs).sum(axis=0)[:, None]
+        else:
+            both = (present[a] & present[b]).astype(np.float32)
+            signs *= both
+            concordance += signs.T @ signs
+            untied += np.abs(signs).T @ both
+
+    n = present.T.astype(np.float64) @ present.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau = concordance / np.sqrt(untied * untied.T)
+    tau = np.clip(tau, -1.0, 1.0)
+    np.fill_diagonal(tau, np.where(np.diag(untied) > 0, 1.0, np.nan))
+    return tau, n
+
+
+def kendall_p_values(tau: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Two-sided p-values of Kendall coefficients (normal approximation)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = 3 * tau * np.sqrt(n * (n - 1)) / np.sqrt(2 * (2 * n + 5))
+        p = 2 * stats.norm.sf(np.abs(z))
+    p[n < 3] = np.nan
+    return p
+
+
+def significant_pairs(
+    matrices: dict,
+    alpha: float = 0.05,
+    p_adjust: str = "fdr_bh"
+) -> tuple[list, dict]:
+    """
+    Select significant column pairs after correcting each method's p-values.
+
+    The family of each method is its upper-triangle pairs. Returns (pairs
+    sorted by |r|, {method: adjusted p-value DataFrame}).
+    """
+    pairs = []
+    adjusted_matrices = {}
+    for method, matrix in matrices.items():
+        # Pairs of a sampled result (Kendall on long tables) say so
+        sampled = {"sampled": True, "rows_used": matrix["rows_used"]} if matrix.get("sampled") else {}
+        r = matrix["r"].to_numpy()
+        columns = matrix["r"].columns
+        upper = np.triu(np.ones(r.shape, dtype=bool), k=1)
+
+        adjusted = np.full(r.shape, np.nan)
+        adjusted[upper] = adjust_p_values(matrix["p"].to_numpy()[upper], p_adjust)
+        adjusted_matrices[method] = pd.DataFrame(adjusted, index=columns, columns=columns)
+
+        with np.errstate(invalid="ignore"):
+            first, second = np.nonzero(upper & (adjusted < alpha))
+        p = matrix["p"].to_numpy()
+        n = matrix["n"].to_numpy()
+        pairs.extend(
+            {
+                "var1": columns[i],
+                "var2": columns[j],
+                "method": method,
+                "correlation": float(r[i, j]),
+                "p_value": float(p[i, j]),
+                "adjusted_p_value": float(adjusted[i, j]),
+                "n": int(n[i, j]),
+                "strength": correlation_strength(r[i, j]),
+                **sampled,
+            }
+            for i, j in zip(first, second)
+        )
+
+    pairs.sort(key=lambda pair: abs(pair["correlation"]), reverse=True)
+    return pairs, adjusted_matrices
+
+
+def correlation_strength(r: float) -> str:
+    """Label of |r| used in the significant-pair output"""
+    return "strong" if abs(r) >= 0.7 else "moderate"
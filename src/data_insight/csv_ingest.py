@@ -0,0 +1,145 @@
+"""
+Fast and chunked CSV ingestion for data-loader.
+
+`read_csv_fast` parses a whole file with the multi-threaded pyarrow engine
+(when pyarrow is installed), an explicit or sample-inferred dtype map,
+categorical low-cardinality strings and lossless numeric downcasting.
+
+`ingest_csv_chunked` streams files that do not fit in memory into a Parquet
+snapshot (see `chunked_ingest`).
+
+Both accept compressed files (see `compressed_input`), which are
+decompressed while they are parsed.
+"""
+
+import os
+from typing import Callable
+
+import pandas as pd
+
+from .chunked_ingest import ingest_chunks
+from .compressed_input import open_decompressed
+from .dtype_optimizer import (
+    DEFAULT_CATEGORY_RATIO,
+    downcast_numeric_columns,
+    is_low_cardinality_string,
+)
+from .table_codec import has_pyarrow
+
+
+DEFAULT_SAMPLE_ROWS = 10000
+
+
+def read_csv_fast(
+    path: str,
+    dtypes: dict | None = None,
+    infer_dtypes: bool = False,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    category_ratio: float = DEFAULT_CATEGORY_RATIO,
+    downcast: bool = False,
+    fast_parse: bool = False,
+    columns: list | None = None,
+    compression: str | None = None
+) -> pd.DataFrame:
+    """
+    Read a CSV file into memory.
+
+    With every option left at its default this is a plain `pd.read_csv`.
+
+    Args:
+        path: CSV file path
+        dtypes: Explicit column -> dtype map passed to the parser
+        infer_dtypes: Infer categorical columns from the first `sample_rows` rows
+        sample_rows: Number of rows used for dtype inference
+        category_ratio: Max distinct/total ratio for a string column to become categorical
+        downcast: Downcast numeric columns to the narrowest lossless type
+        fast_parse: Use the multi-threaded pyarrow parser when it is installed
+        columns: Only read these columns
+        compression: Compression of the file (inferred from the extension when None)
+    """
+    dtype_map = resolve_csv_dtypes(
+        path, dtypes, infer_dtypes, sample_rows, category_ratio, compression
+    )
+    engine = "pyarrow" if fast_parse and has_pyarrow() else "c"
+
+    df = pd.read_csv(
+        path,
+        dtype=dtype_map or None,
+        usecols=columns,
+        engine=engine,
+        compression=compression or "infer"
+    )
+
+    if downcast:
+        df = downcast_numeric_columns(df)
+
+    return df
+
+
+def resolve_csv_dtypes(
+    path: str,
+    dtypes: dict | None,
+    infer_dtypes: bool,
+    sample_rows: int,
+    category_ratio: float,
+    compression: str | None = None
+) -> dict:
+    """
+    Build the dtype map used to parse a CSV file.
+
+    Low-cardinality string columns found in a sample become "category";
+    explicit `dtypes` always take precedence over inferred ones.
+    """
+    dtype_map = {}
+
+    if infer_dtypes:
+        sample = pd.read_csv(path, nrows=sample_rows, compression=compression or "infer")
+        for col in sample.columns:
+            if is_low_cardinality_string(sample[col], category_ratio):
+                dtype_map[col] = "category"
+
+    dtype_map.update(dtypes or {})
+    return dtype_map
+
+
+def ingest_csv_chunked(
+    path: str,
+    session_dir: str,
+    chunk_size: int,
+    dtypes: dict | None = None,
+    infer_dtypes: bool = False,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    category_ratio: float = DEFAULT_CATEGORY_RATIO,
+    columns: list | None = None,
+    on_progress: Callable[[float], None] | None = None,
+    compression: str | None = None
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Stream a CSV file into a Parquet snapshot without loading it into memory.
+
+    Args:
+        path: CSV file path
+        session_dir: Session directory that receives the Parquet file
+        chunk_size: Rows per chunk
+        dtypes, infer_dtypes, sample_rows, category_ratio: See `read_csv_fast`
+        columns: Only read these columns
+        on_progress: Called with the fraction of the file read after each chunk
+        compression: Compression of the file (progress follows the compressed offset)
+
+    Returns:
+        (first chunk, reference data_table) - the first chunk is meant for previews
+    """
+    dtype_map = resolve_csv_dtypes(
+        path, dtypes, infer_dtypes, sample_rows, category_ratio, compression
+    )
+    file_size = os.path.getsize(path) or 1
+
+    with open(path, "rb") as handle:
+        source = open_decompressed(handle, compression) if compression else handle
+        reader = pd.read_csv(
+            source, dtype=dtype_map or None, usecols=columns, chunksize=chunk_size
+        )
+        on_chunk = None
+        if on_progress:
+            on_chunk = lambda _: on_progress(min(handle.tell() / file_size, 1.0))
+        return ingest_chunks(reader, session_dir, on_chunk)
@@ -0,0 +1,216 @@
+"""
+Process-wide registry of pooled SQLAlchemy engines for database sources.
+
+Creating an engine per query means a fresh TCP/TLS handshake and login on
+every flow run. Engines are instead cached by connection URL and pool
+settings, so repeated runs in the same process reuse warm connections.
+Connections are pre-pinged before use, engines idle for longer than
+`idle_timeout` are disposed, and the registry keeps the summed pool capacity
+(`pool_size + max_overflow` per engine) under `max_connections` by disposing
+the least recently used engines.
+"""
+
+import atexit
+import threading
+import time
+from collections import OrderedDict
+
+import sqlalchemy
+from sqlalchemy.engine import URL, Engine
+
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 5
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_IDLE_TIMEOUT_SECONDS = 600
+DEFAULT_MAX_CONNECTIONS = 50
+
+DEFAULT_PORTS = {"mysql": 3306, "postgresql": 5432}
+DRIVERS = {"mysql": "mysql+pymysql", "postgresql": "postgresql+psycopg2"}
+
+
+class EngineRegistry:
+    """
+    Thread-safe LRU registry of pooled engines.
+
+    Each entry is keyed by the rendered connection URL and pool settings and
+    remembers when it was last handed out. Evicted engines are disposed,
+    which closes their idle pooled connections.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS
+    ):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._engines: OrderedDict[tuple, tuple[Engine, int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    @property
+    def total_connections(self) -> int:
+        """Upper bound on connections the registered engines may open"""
+        return sum(capacity for _, capacity, _ in self._engines.values())
+
+    def get_engine(
+        self,
+        url: URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle: int = DEFAULT_POOL_RECYCLE_SECONDS
+    ) -> Engine:
+        """Return the cached engine for a URL and pool settings, creating it if needed"""
+        key = (url.render_as_string(hide_password=False), pool_size, max_overflow, pool_recycle)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_idle(now)
+
+            entry = self._engines.get(key)
+            if entry is not None:
+                engine, capacity, _ = entry
+                self._engines[key] = (engine, capacity, now)
+                self._engines.move_to_end(key)
+                return engine
+
+            engine, capacity = create_pooled_engine(url, pool_size, max_overflow, pool_recycle)
+            self._engines[key] = (engine, capacity, now)
+            self._evict_over_capacity()
+            return engine
+
+    def configure(
+        self,
+        max_connections: int | None = None,
+        idle_timeout: float | None = None
+    ) -> None:
+        """Change the connection cap or idle timeout, evicting engines if needed"""
+        with self._lock:
+            if max_connections is not None:
+                self.max_connections = max_connections
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+            self._evict_idle(time.monotonic())
+            self._evict_over_capacity()
+
+    def dispose_all(self) -> None:
+        """Dispose every registered engine"""
+        with self._lock:
+            while self._engines:
+                _, (engine, _, _) = self._engines.popitem(last=False)
+                engine.dispose()
+
+    def _evict_idle(self, now: float) -> None:
+        for key in [
+            key for key, (_, _, last_used) in self._engines.items()
+            if now - last_used > self.idle_timeout
+        ]:
+            engine, _, _ = self._engines.pop(key)
+            engine.dispose()
+
+    def _evict_over_capacity(self) -> None:
+        # The most recently used engine is always kept, even if it alone exceeds the cap
+        while len(self._engines) > 1 and self.total_connections > self.max_connections:
+            _, (engine, _, _) = self._engines.popitem(last=False)
+            engine.dispose()
+
+
+_engine_registry = EngineRegistry()
+atexit.register(_engine_registry.dispose_all)
+
+
+def create_pooled_engine(
+    url: URL,
+    pool_size: int,
+    max_overflow: int,
+    pool_recycle: int
+) -> tuple[Engine, int]:
+    """
+    Create an engine with a pre-pinged connection pool.
+
+    Returns:
+        (engine, maximum number of connections it may open)
+    """
+    if url.get_backend_name() == "sqlite":
+        # SQLite pools are chosen by SQLAlchemy (file vs :memory:) and do not
+        # accept QueuePool sizing; connections are local and cheap
+        engine = sqlalchemy.create_engine(url, pool_pre_ping=True)
+        return engine, 1
+
+    engine = sqlalchemy.create_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True
+    )
+    return engine, pool_size + max_overflow
+
+
+def build_connection_url(db_type: str, config: dict) -> URL:
+    """
+    Build the SQLAlchemy URL for a database_config.
+
+    Args:
+        db_type: Database type (mysql, postgresql, sqlite)
+        config: Database configuration with host, port, database, username, password
+    """
+    if db_type == "sqlite":
+        # SQLite uses file path
+        return URL.create("sqlite", database=config.get("database") or ":memory:")
+
+    if db_type not in DRIVERS:
+        raise ValueError(f"Unsupported database type: {db_type}")
+
+    database = config.get("database")
+    username = config.get("username")
+
+    # Validate required fields
+    if not all([database, username]):
+        raise ValueError(f"Database name and username are required for {db_type}")
+
+    return URL.create(
+        DRIVERS[db_type],
+        username=username,
+        password=config.get("password"),
+        host=config.get("host") or "localhost",
+        port=int(config.get("port") or DEFAULT_PORTS[db_type]),
+        database=database
+    )
+
+
+def get_engine(db_type: str, config: dict) -> Engine:
+    """
+    Return a pooled engine for a database_config.
+
+    Optional pool settings are read from the config: `pool_size`,
+    `max_overflow` and `pool_recycle` (seconds).
+    """
+    return _engine_registry.get_engine(
+        build_connection_url(db_type, config),
+        pool_size=int(config_value(config, "pool_size", DEFAULT_POOL_SIZE)),
+        max_overflow=int(config_value(config, "max_overflow", DEFAULT_MAX_OVERFLOW)),
+        pool_recycle=int(config_value(config, "pool_recycle", DEFAULT_POOL_RECYCLE_SECONDS))
+    )
+
+
+def config_value(config: dict, key: str, default):
+    """Read an optional setting, keeping explicit zeros"""
+    value = config.get(key)
+    return default if value is None or value == "" else value
+
+
+def configure_engine_registry(
+    max_connections: int | None = None,
+    idle_timeout: float | None = None
+) -> None:
+    """Set the process-wide connection cap and idle timeout (seconds)"""
+    _engine_registry.configure(max_connections, idle_timeout)
+
+
+def dispose_engines() -> None:
+    """Dispose every pooled engine (closing their connections)"""
+    _engine_registry.dispose_all()
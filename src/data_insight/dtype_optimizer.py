@@ -0,0 +1,173 @@
+"""
+Shrink the in-memory footprint of loaded DataFrames without losing data.
+
+`optimize_dtypes` runs the whole pass column by column, largest first:
+
+- float columns holding whole numbers and nulls become masked nullable
+  integers (Int8 ... Int64), object columns of booleans and nulls become
+  the masked "boolean" dtype
+- numeric columns are downcast to the narrowest lossless type
+- low-cardinality string columns are dictionary-encoded as categoricals
+
+With a memory budget the pass stops as soon as the frame fits, so only the
+largest columns pay for the conversion.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# String columns whose distinct/total ratio is at or below this become categoricals
+DEFAULT_CATEGORY_RATIO = 0.5
+
+
+def optimize_dtypes(
+    df: pd.DataFrame,
+    memory_budget: int | None = None,
+    category_ratio: float = DEFAULT_CATEGORY_RATIO
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Convert columns to compact lossless dtypes, largest column first.
+
+    Args:
+        df: Frame to optimize
+        memory_budget: Stop once the frame uses at most this many bytes
+            (None optimizes every column)
+        category_ratio: Max distinct/total ratio for dictionary-encoded strings
+
+    Returns:
+        (optimized frame, report) where the report holds "bytes_before",
+        "bytes_after", "bytes_saved", "memory_budget", "budget_met", "stopped_early" and
+        per-column "columns": {col: {"from", "to", "bytes_saved"}} for
+        every converted column
+    """
+    column_bytes = df.memory_usage(index=False, deep=True)
+    bytes_before = int(df.memory_usage(index=True, deep=True).sum())
+    total = bytes_before
+
+    converted = {}
+    optimized = {}
+    stopped_early = False
+    for col in sorted(df.columns, key=lambda col: column_bytes[col], reverse=True):
+        if memory_budget is not None and total <= memory_budget:
+            stopped_early = True
+            break
+        series = optimize_column(df[col], category_ratio)
+        if series.dtype == df[col].dtype:
+            continue
+        saved = int(column_bytes[col]) - int(series.memory_usage(index=False, deep=True))
+        if saved <= 0:
+            continue
+        optimized[col] = series
+        converted[col] = {"from": str(df[col].dtype), "to": str(series.dtype), "bytes_saved": saved}
+        total -= saved
+
+    if optimized:
+        df = df.assign(**optimized)
+    bytes_after = int(df.memory_usage(index=True, deep=True).sum())
+
+    return df, {
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "memory_budget": memory_budget,
+        "budget_met": memory_budget is None or bytes_after <= memory_budget,
+        "stopped_early": stopped_early,
+        "columns": converted,
+    }
+
+
+def optimize_column(series: pd.Series, category_ratio: float = DEFAULT_CATEGORY_RATIO) -> pd.Series:
+    """Apply the masked-null, downcast and dictionary-encoding steps to one column"""
+    series = downcast_numeric(to_masked(series))
+    if is_low_cardinality_string(series, category_ratio):
+        series = series.astype("category")
+    return series
+
+
+def to_masked(series: pd.Series) -> pd.Series:
+    """
+    Move nullable columns to masked arrays where that is lossless.
+
+    Floats that only hold whole numbers (NaN marking the gaps) become Int64;
+    object columns of booleans and nulls become "boolean".
+    """
+    dtype = series.dtype
+    if not series.hasnans:
+        return series
+
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        values = series.dropna().to_numpy()
+        if len(values) and np.array_equal(values, np.trunc(values)) and np.abs(values).max() < 2 ** 53:
+            return series.astype("Int64")
+        return series
+
+    if dtype == object:
+        values = series.dropna()
+        if len(values) and values.map(type).isin([bool, np.bool_]).all():
+            return series.astype("boolean")
+
+    return series
+
+
+def downcast_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast numeric columns to the narrowest type that holds every value exactly.
+
+    Integers are narrowed by range. Floats become float32 only when every
+    value survives the round trip unchanged.
+    """
+    for col in df.columns:
+        df[col] = downcast_numeric(df[col])
+    return df
+
+
+def downcast_numeric(series: pd.Series) -> pd.Series:
+    """Downcast a single numeric column losslessly (other columns are returned as-is)"""
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(dtype):
+        downcast = "unsigned" if len(series) and series.min() >= 0 else "integer"
+        return pd.to_numeric(series, downcast=downcast)
+
+    if pd.api.types.is_float_dtype(dtype) and dtype != np.float32:
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        narrowed = values.astype(np.float32)
+        with np.errstate(over="ignore", invalid="ignore"):
+            exact = (narrowed.astype(np.float64) == values) | np.isnan(values)
+        if exact.all():
+            return series.astype(np.float32)
+
+    return series
+
+
+def categorize_strings(df: pd.DataFrame, max_ratio: float = DEFAULT_CATEGORY_RATIO) -> pd.DataFrame:
+    """Store low-cardinality string columns as categoricals"""
+    for col in df.columns:
+        if is_low_cardinality_string(df[col], max_ratio):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def is_low_cardinality_string(series: pd.Series, max_ratio: float) -> bool:
+    """
+    Check whether a column holds strings with few distinct values.
+
+    Object columns only qualify when every non-null value is a string; mixed
+    objects (numbers, dates, containers) are left alone.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype) or len(series) == 0:
+        return False
+    if not pd.api.types.is_string_dtype(series.dtype):
+        return False
+    if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return False
+    try:
+        unique_count = series.nunique()
+    except TypeError:
+        # Unhashable values (lists, dicts) cannot be dictionary-encoded
+        return False
+    return unique_count / len(series) <= max_ratio
@@ -0,0 +1,159 @@
+"""
+DuckDB scans of file sources with projection and filter pushdown.
+
+The requested columns and the row filter are compiled into a single
+`SELECT ... FROM read_csv/read_parquet/read_json(...) WHERE ...` query, so
+DuckDB only decodes the needed columns (and, for Parquet, skips row groups
+whose statistics exclude the filter) and pandas only ever sees the rows that
+match.
+"""
+
+from typing import Iterator
+
+import duckdb
+import pandas as pd
+
+from .file_readers import select_list
+from .table_codec import escape_sql_string, has_pyarrow
+
+
+SCAN_SOURCE_TYPES = ("csv", "json", "jsonl", "parquet", "feather", "arrow_ipc")
+
+# Compressions DuckDB decompresses natively while scanning text files
+DUCKDB_COMPRESSIONS = ("gzip", "zstd")
+
+# DuckDB hands results to pandas in vectors of this many rows
+DUCKDB_VECTOR_SIZE = 2048
+
+
+def scan_file(
+    path: str | list[str],
+    source_type: str,
+    columns: list | None = None,
+    filter_expr: str | None = None,
+    compression: str | None = None
+) -> pd.DataFrame:
+    """
+    Load a file through DuckDB, materializing only the matching rows and columns.
+
+    Args:
+        path: File path, or a list of shards read as one table (columns are
+            unioned by name and Hive `key=value` folders become columns)
+        source_type: One of SCAN_SOURCE_TYPES
+        columns: Only read these columns
+        filter_expr: SQL boolean expression over the file's columns, e.g.
+            "region = 'North' AND sales > 100"
+        compression: Compression of a text file ("gzip" or "zstd")
+    """
+    conn = duckdb.connect(":memory:")
+    try:
+        query = scan_query(conn, path, source_type, columns, filter_expr, compression)
+        return conn.execute(query).df()
+    finally:
+        conn.close()
+
+
+def iter_scan_file(
+    path: str | list[str],
+    source_type: str,
+    chunk_rows: int,
+    columns: list | None = None,
+    filter_expr: str | None = None,
+    compression: str | None = None
+) -> Iterator[pd.DataFrame]:
+    """Yield the result of a pushed-down scan in chunks of about `chunk_rows` rows"""
+    vectors_per_chunk = max(1, chunk_rows // DUCKDB_VECTOR_SIZE)
+
+    conn = duckdb.connect(":memory:")
+    try:
+        result = conn.execute(
+            scan_query(conn, path, source_type, columns, filter_expr, compression)
+        )
+        while True:
+            chunk = result.fetch_df_chunk(vectors_per_chunk)
+            if chunk.empty:
+                break
+            yield chunk
+    finally:
+        conn.close()
+
+
+def scan_query(
+    conn: duckdb.DuckDBPyConnection,
+    path: str | list[str],
+    source_type: str,
+    columns: list | None,
+    filter_expr: str | None,
+    compression: str | None = None
+) -> str:
+    """Build the pushed-down SELECT for a file (registering Arrow sources on `conn`)"""
+    source = scan_source(conn, path, source_type, compression)
+    query = f"SELECT {select_list(columns)} FROM {source}"
+    if filter_expr:
+        query += f" WHERE {validate_filter(filter_expr)}"
+    return query
+
+
+def scan_source(
+    conn: duckdb.DuckDBPyConnection,
+    path: str | list[str],
+    source_type: str,
+    compression: str | None = None
+) -> str:
+    """Return the DuckDB table function (or registered view) that reads a file or file list"""
+    options = ""
+    if isinstance(path, list):
+        escaped = "[" + ", ".join(f"'{escape_sql_string(p)}'" for p in path) + "]"
+        options = ", union_by_name = true, hive_partitioning = true"
+    else:
+        escaped = f"'{escape_sql_string(path)}'"
+
+    if compression:
+        if compression not in DUCKDB_COMPRESSIONS:
+            raise ValueError(
+                f"DuckDB scans support gzip and zstd compressed files, not {compression}"
+            )
+        options += f", compression = '{compression}'"
+
+    if source_type == "csv":
+        return f"read_csv({escaped}{options})"
+    if source_type == "parquet":
+        return f"read_parquet({escaped}{options})"
+    if source_type == "json":
+        return f"read_json({escaped}, format = 'array'{options})"
+    if source_type == "jsonl":
+        return f"read_json({escaped}, format = 'newline_delimited'{options})"
+    if source_type in ("feather", "arrow_ipc"):
+        if not has_pyarrow():
+            raise ImportError("Feather/Arrow IPC sources require pyarrow (pip install pyarrow)")
+        import pyarrow.dataset as ds
+
+        # Arrow datasets are scanned lazily, so projection and filters still push down
+        conn.register(
+            "arrow_source",
+            ds.dataset(path, format="ipc", partitioning="hive" if isinstance(path, list) else None)
+        )
+        return "arrow_source"
+
+    raise ValueError(
+        f"DuckDB scans are not supported for {source_type} sources "
+        f"(supported: {', '.join(SCAN_SOURCE_TYPES)})"
+    )
+
+
+def validate_filter(filter_expr: str) -> str:
+    """
+    Check that a filter is a single SQL expression.
+
+    The expression is embedded in a SELECT, so statement separators and
+    trailing clauses must not turn it into a second statement.
+    """
+    try:
+        statements = duckdb.extract_statements(f"SELECT 1 WHERE {filter_expr}")
+    except duckdb.Error as e:
+        raise ValueError(f"Invalid filter expression: {e}") from e
+
+    if len(statements) != 1:
+        raise ValueError("Filter must be a single SQL expression")
+
+    return filter_expr
@@ -0,0 +1,109 @@
+"""
+Fast reads of the first rows of a file source.
+
+data-loader publishes a preview and an estimated schema from these rows
+before the full parse starts. Every reader stops after the first block of
+the file, so a peek costs about the same for a 1 MB and a 50 GB file.
+"""
+
+import io
+import itertools
+import zipfile
+
+import duckdb
+import pandas as pd
+
+from .compressed_input import (
+    COMPRESSED_SOURCE_TYPES,
+    detect_compression,
+    member_source_type,
+    open_decompressed,
+    zip_member_names,
+)
+from .excel_ingest import excel_engine
+from .file_readers import select_list
+from .multi_file import expand_file_paths, is_multi_file_path
+from .table_codec import escape_sql_string, has_pyarrow
+
+
+DEFAULT_PEEK_ROWS = 1000
+
+
+def peek_file(
+    path: str,
+    source_type: str,
+    n_rows: int = DEFAULT_PEEK_ROWS,
+    columns: list | None = None,
+    compression: str | None = None,
+    sheet: str | int = 0
+) -> pd.DataFrame | None:
+    """
+    Read the first `n_rows` rows of a file (the first shard of a glob/directory).
+
+    Args:
+        path: File path, glob pattern or directory
+        source_type: data-loader source type
+        n_rows: Rows to read
+        columns: Only read these columns
+        compression: Detected compression of a text file
+        sheet: Excel sheet name or index
+
+    Returns:
+        The first rows, or None when the format cannot be read partially
+        (JSON arrays must be parsed whole)
+    """
+    if is_multi_file_path(path):
+        # The first shard stands in for the whole dataset
+        shard = expand_file_paths(path, source_type)[0]
+        shard_compression = detect_compression(shard) if source_type in COMPRESSED_SOURCE_TYPES else None
+        return peek_file(shard, source_type, n_rows, columns, shard_compression, sheet)
+
+    if compression == "zip":
+        with zipfile.ZipFile(path) as archive:
+            for name in zip_member_names(archive):
+                member_type = member_source_type(name, source_type)
+                if member_type in ("csv", "jsonl"):
+                    with archive.open(name) as member:
+                        return peek_text(member, member_type, n_rows, columns)
+        return None
+
+    if source_type in ("csv", "jsonl"):
+        with open(path, "rb") as raw:
+            handle = open_decompressed(raw, compression) if compression else raw
+            return peek_text(handle, source_type, n_rows, columns)
+
+    if source_type == "parquet":
+        conn = duckdb.connect(":memory:")
+        try:
+            return conn.execute(
+                f"SELECT {select_list(columns)} FROM read_parquet('{escape_sql_string(path)}') LIMIT {int(n_rows)}"
+            ).df()
+        finally:
+            conn.close()
+
+    if source_type in ("feather", "arrow_ipc") and has_pyarrow():
+        import pyarrow as pa
+
+        with pa.memory_map(path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            if reader.num_record_batches == 0:
+                return None
+            batch = reader.get_batch(0).slice(0, n_rows)
+            if columns:
+                batch = batch.select(columns)
+            return batch.to_pandas()
+
+    if source_type == "excel":
+        return pd.read_excel(path, sheet_name=sheet, nrows=n_rows, usecols=columns, engine=excel_engine())
+
+    return None
+
+
+def peek_text(handle, source_type: str, n_rows: int, columns: list | None) -> pd.DataFrame:
+    """Parse the first rows of an open CSV / JSON Lines byte stream"""
+    if source_type == "csv":
+        return pd.read_csv(handle, nrows=n_rows, usecols=columns)
+
+    lines = b"".join(itertools.islice(handle, n_rows))
+    df = pd.read_json(io.BytesIO(lines), lines=True)
+    return df.reindex(columns=columns) if columns else df
@@ -0,0 +1,163 @@
+"""
+Readers for columnar and line-delimited file sources of data-loader.
+
+- Parquet: column projection and row-group selection (pyarrow), with a
+  DuckDB fallback for plain projected reads when pyarrow is missing
+- Feather / Arrow IPC: column projection, memory-mapped (requires pyarrow)
+- JSON Lines: parsed line by line in fixed-size chunks, so only one chunk of
+  raw records is held in memory at a time
+
+Every reader also has an `iter_*` variant yielding DataFrame chunks for the
+chunked snapshot path (`chunked_ingest.ingest_chunks`).
+"""
+
+from typing import Iterator
+
+import duckdb
+import pandas as pd
+
+from .schema_profiler import quote_identifier
+from .table_codec import escape_sql_string, has_pyarrow
+
+
+DEFAULT_JSONL_CHUNK_ROWS = 50000
+
+
+def read_parquet_file(
+    path: str,
+    columns: list | None = None,
+    row_groups: list | None = None
+) -> pd.DataFrame:
+    """
+    Read a Parquet file.
+
+    Args:
+        path: Parquet file path
+        columns: Only read these columns
+        row_groups: Only read these row groups (indices)
+    """
+    if has_pyarrow():
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path, memory_map=True)
+        if row_groups:
+            arrow_table = parquet_file.read_row_groups(
+                [int(group) for group in row_groups], columns=columns
+            )
+        else:
+            arrow_table = parquet_file.read(columns=columns)
+        return arrow_table.to_pandas()
+
+    if row_groups:
+        raise ImportError("Reading selected Parquet row groups requires pyarrow")
+
+    conn = duckdb.connect(":memory:")
+    try:
+        return conn.execute(
+            f"SELECT {select_list(columns)} FROM read_parquet('{escape_sql_string(path)}')"
+        ).df()
+    finally:
+        conn.close()
+
+
+def iter_parquet_file(
+    path: str,
+    batch_rows: int,
+    columns: list | None = None,
+    row_groups: list | None = None
+) -> Iterator[pd.DataFrame]:
+    """Yield a Parquet file in batches of at most `batch_rows` rows"""
+    require_pyarrow("Chunked Parquet reads")
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    batches = parquet_file.iter_batches(
+        batch_size=batch_rows,
+        row_groups=[int(group) for group in row_groups] if row_groups else None,
+        columns=columns
+    )
+    for batch in batches:
+        yield batch.to_pandas()
+
+
+def read_arrow_ipc_file(path: str, columns: list | None = None) -> pd.DataFrame:
+    """Read a Feather v2 / Arrow IPC file (memory-mapped)"""
+    require_pyarrow("Feather/Arrow IPC sources")
+    import pyarrow.feather as feather
+
+    return feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+
+
+def iter_arrow_ipc_file(path: str, columns: list | None = None) -> Iterator[pd.DataFrame]:
+    """Yield a Feather v2 / Arrow IPC file one record batch at a time"""
+    require_pyarrow("Feather/Arrow IPC sources")
+    import pyarrow as pa
+
+    with pa.memory_map(path, "r") as source:
+        reader = pa.ipc.open_file(source)
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            if columns:
+                batch = batch.select(columns)
+            yield batch.to_pandas()
+
+
+def read_jsonl_file(
+    path: str,
+    columns: list | None = None,
+    chunk_rows: int = DEFAULT_JSONL_CHUNK_ROWS,
+    compression: str | None = None
+) -> pd.DataFrame:
+    """Read a JSON Lines file chunk by chunk, keeping only the projected columns"""
+    chunks = list(iter_jsonl_file(path, chunk_rows, columns, compression))
+    if not chunks:
+        return pd.DataFrame(columns=columns or [])
+    return pd.concat(chunks, ignore_index=True)
+
+
+def iter_jsonl_file(
+    path: str,
+    chunk_rows: int = DEFAULT_JSONL_CHUNK_ROWS,
+    columns: list | None = None,
+    compression: str | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a JSON Lines file (or open binary handle) in chunks of `chunk_rows` records.
+
+    Compressed files are decompressed as they are read (`compression`
+    is inferred from the extension when None). Records may omit keys, so a
+    projected column only has to appear in some chunk; a column found in no
+    record raises a ValueError once the file has been read.
+    """
+    seen = set()
+    with pd.read_json(
+        path, lines=True, chunksize=chunk_rows, compression=compression or "infer"
+    ) as reader:
+        for chunk in reader:
+            if columns:
+                seen.update(chunk.columns)
+                chunk = chunk.reindex(columns=columns)
+            yield chunk
+
+    if seen:
+        require_columns(seen, columns)
+
+
+def require_columns(available, columns: list | None) -> None:
+    """Raise a ValueError naming the requested columns missing from `available`"""
+    missing = [col for col in columns or [] if col not in available]
+    if missing:
+        raise ValueError(f"Columns not found: {', '.join(map(str, missing))}")
+
+
+def select_list(columns: list | None) -> str:
+    """Build a SQL select list for optional column projection"""
+    if not columns:
+        return "*"
+    return ", ".join(quote_identifier(col) for col in columns)
+
+
+def require_pyarrow(feature: str) -> None:
+    """Raise a clear error when an optional pyarrow feature is used without pyarrow"""
+    if not has_pyarrow():
+        raise ImportError(f"{feature} require pyarrow (pip install pyarrow)")
@@ -0,0 +1,184 @@
+"""
+Group comparison tests computed from per-group summaries.
+
+Every test here needs only per-group counts, means and variances (or rank
+sums), which one `groupby` aggregation yields in a single pass over the
+rows. The cost is therefore linear in the row count regardless of how many
+groups there are; only the pairwise post-hoc step grows with the number of
+groups (k * (k - 1) / 2 pairs, vectorized).
+
+- One-way ANOVA (equal variances) and Welch's ANOVA (unequal variances)
+- Kruskal-Wallis H test (rank-based, tie-corrected)
+- Post-hoc: pairwise Welch t-tests or Dunn's test, with Holm or FDR
+  adjusted p-values
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .multiple_testing import adjust_p_values
+
+
+POST_HOC_METHODS = ("welch_t", "dunn")
+
+
+def group_summaries(df: pd.DataFrame, value_col: str, group_col: str, ranks: bool = False) -> pd.DataFrame:
+    """
+    Count, mean and variance of `value_col` per group in one aggregation.
+
+    Rows with a missing value or group are skipped. Groups keep their order
+    of first appearance. With `ranks`, the mean rank of each group over all
+    kept rows (average ranks for ties) is added as "mean_rank".
+    """
+    data = df[[group_col, value_col]].dropna()
+    grouped = data.groupby(group_col, sort=False, observed=True)[value_col]
+    summary = grouped.agg(["count", "mean", "var"])
+    if ranks:
+        ranked = data[value_col].rank(method="average")
+        summary["mean_rank"] = ranked.groupby(data[group_col], sort=False, observed=True).mean()
+    return summary
+
+
+def one_way_anova(summary: pd.DataFrame) -> dict:
+    """Classic one-way ANOVA F test from group summaries"""
+    n = summary["count"].to_numpy(dtype=float)
+    means = summary["mean"].to_numpy(dtype=float)
+    variances = np.nan_to_num(summary["var"].to_numpy(dtype=float))
+    total, k = n.sum(), len(n)
+
+    grand_mean = np.sum(n * means) / total
+    between = np.sum(n * (means - grand_mean) ** 2)
+    within = np.sum((n - 1) * variances)
+    df_between, df_within = k - 1, total - k
+
+    f_statistic = (between / df_between) / (within / df_within) if within > 0 else np.inf
+    return {
+        "test": "One-Way ANOVA",
+        "f_statistic": float(f_statistic),
+        "df_between": int(df_between),
+        "df_within": int(df_within),
+        "p_value": float(stats.f.sf(f_statistic, df_between, df_within)),
+        # Share of the variance explained by the groups
+        "eta_squared": float(between / (between + within)) if between + within > 0 else 0.0,
+    }
+
+
+def welch_anova(summary: pd.DataFrame) -> dict:
+    """Welch's ANOVA (no equal-variance assumption) from group summaries"""
+    n = summary["count"].to_numpy(dtype=float)
+    means = summary["mean"].to_numpy(dtype=float)
+    variances = summary["var"].to_numpy(dtype=float)
+    k = len(n)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = n / variances
+        weighted_mean = np.sum(weights * means) / np.sum(weights)
+        numerator = np.sum(weights * (means - weighted_mean) ** 2) / (k - 1)
+        tail = np.sum((1 - weights / np.sum(weights)) ** 2 / (n - 1))
+        denominator = 1 + 2 * (k - 2) / (k ** 2 - 1) * tail
+        f_statistic = numerator / denominator
+        df_within = (k ** 2 - 1) / (3 * tail)
+
+    return {
+        "test": "Welch's ANOVA",
+        "f_statistic": float(f_statistic),
+        "df_between": int(k - 1),
+        "df_within": float(df_within),
+        "p_value": float(stats.f.sf(f_statistic, k - 1, df_within)),
+    }
+
+
+def kruskal_wallis(summary: pd.DataFrame, values: pd.Series) -> dict:
+    """
+    Kruskal-Wallis H test from per-group mean ranks.
+
+    `values` are the values the ranks were taken over; their tie counts give
+    the tie correction.
+    """
+    n = summary["count"].to_numpy(dtype=float)
+    mean_ranks = summary["mean_rank"].to_numpy(dtype=float)
+    total, k = n.sum(), len(n)
+
+    h = 12 / (total * (total + 1)) * np.sum(n * mean_ranks ** 2) - 3 * (total + 1)
+    correction = tie_correction(values)
+    h = h / correction if correction > 0 else np.nan
+
+    return {
+        "test": "Kruskal-Wallis H Test",
+        "h_statistic": float(h),
+        "df": int(k - 1),
+        "p_value": float(stats.chi2.sf(h, k - 1)),
+        # Rank-based effect size
+        "epsilon_squared": float(h / (total - 1)) if total > 1 else 0.0,
+    }
+
+
+def tie_correction(values: pd.Series) -> float:
+    """1 - sum(t^3 - t) / (N^3 - N) over the sizes t of groups of tied values"""
+    ties = values.value_counts().to_numpy(dtype=float)
+    total = ties.sum()
+    return 1 - np.sum(ties ** 3 - ties) / (total ** 3 - total) if total > 1 else 1.0
+
+
+def pairwise_tests(
+    summary: pd.DataFrame,
+    method: str = "welch_t",
+    p_adjust: str = "holm",
+    values: pd.Series | None = None
+) -> list:
+    """
+    Post-hoc comparisons of every pair of groups.
+
+    Args:
+        summary: Output of `group_summaries` (with ranks for "dunn")
+        method: "welch_t" (pairwise Welch t-tests) or "dunn" (Dunn's test
+            on mean ranks, the usual follow-up to Kruskal-Wallis)
+        p_adjust: "holm" or "fdr_bh" over all pairs
+        values: Values the ranks were taken over (tie correction for "dunn")
+
+    Returns:
+        One entry per pair with both group names, the mean (or mean rank)
+        difference, statistic, raw and adjusted p-values
+    """
+    names = summary.index.tolist()
+    first, second = np.triu_indices(len(names), k=1)
+    n = summary["count"].to_numpy(dtype=float)
+
+    if method == "welch_t":
+        means = summary["mean"].to_numpy(dtype=float)
+        std = np.sqrt(summary["var"].to_numpy(dtype=float))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            statistic, p_value = stats.ttest_ind_from_stats(
+                means[first], std[first], n[first],
+                means[second], std[second], n[second],
+                equal_var=False
+            )
+        difference = means[first] - means[second]
+    elif method == "dunn":
+        if values is None:
+            raise ValueError("Dunn's test needs the ranked values for its tie correction")
+        mean_ranks = summary["mean_rank"].to_numpy(dtype=float)
+        total = n.sum()
+        ties = values.value_counts().to_numpy(dtype=float)
+        variance = total * (total + 1) / 12 - np.sum(ties ** 3 - ties) / (12 * (total - 1))
+        difference = mean_ranks[first] - mean_ranks[second]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            statistic = difference / np.sqrt(variance * (1 / n[first] + 1 / n[second]))
+        p_value = 2 * stats.norm.sf(np.abs(statistic))
+    else:
+        raise ValueError(f"Unsupported post-hoc method: {method} (supported: {', '.join(POST_HOC_METHODS)})")
+
+    p_value = np.atleast_1d(p_value)
+    adjusted = adjust_p_values(p_value, p_adjust)
+    return [
+        {
+            "group1": str(names[i]),
+            "group2": str(names[j]),
+            "difference": float(difference[pair]),
+            "statistic": float(np.atleast_1d(statistic)[pair]),
+            "p_value": float(p_value[pair]),
+            "adjusted_p_value": float(adjusted[pair]),
+        }
+        for pair, (i, j) in enumerate(zip(first, second))
+    ]
@@ -0,0 +1,334 @@
+"""
+Incremental (watermark-based) loading of append-only sources.
+
+A source's rows are kept in a snapshot directory of Parquet parts together
+with a watermark that records how far the source has been read:
+
+- CSV / JSON Lines: the byte offset after the last complete line (plus a
+  hash of the bytes before it, so rewritten or truncated files reload fully)
+- Parquet: the number of rows already read (plus a fingerprint of those
+  rows, so rewritten files reload fully)
+- databases: the largest value of a monotonic column
+
+Each run reads only what lies past the watermark, appends it as a new part
+and returns the whole snapshot.
+"""
+
+import glob
+import hashlib
+import io
+import itertools
+import json
+import os
+import shutil
+import uuid
+
+import duckdb
+import pandas as pd
+import sqlalchemy
+from sqlalchemy.engine import Engine
+
+from .chunked_ingest import same_kind
+from .file_readers import require_columns
+from .schema_profiler import quote_identifier
+from .table_codec import content_hash_of, escape_sql_string, restore_dtypes, write_parquet_file
+
+
+BYTE_OFFSET_SOURCE_TYPES = ("csv", "jsonl")
+ROW_COUNT_SOURCE_TYPES = ("parquet",)
+INCREMENTAL_FILE_SOURCE_TYPES = BYTE_OFFSET_SOURCE_TYPES + ROW_COUNT_SOURCE_TYPES
+
+# Bytes before the watermark that are hashed to detect rewritten files
+PREFIX_HASH_BYTES = 64 * 1024
+
+STATE_FILE = "state.json"
+
+
+class IncrementalSnapshot:
+    """
+    Parquet parts plus watermark state of one incrementally loaded source.
+
+    The state file is replaced atomically after each part is written, so an
+    interrupted run at worst leaves an unreferenced part behind.
+    """
+
+    def __init__(self, state_dir: str, key: str):
+        self.path = os.path.join(state_dir, key)
+
+    def load_state(self) -> dict | None:
+        """Return the stored state, or None before the first load"""
+        try:
+            with open(os.path.join(self.path, STATE_FILE), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def append(self, df: pd.DataFrame, watermark: dict, replace: bool = False) -> dict:
+        """Store new rows and advance the watermark (`replace` drops previous parts first)"""
+        state = None if replace else self.load_state()
+        if state is None:
+            self.reset()
+            state = {"parts": [], "row_count": 0, "dtypes": {}}
+
+        os.makedirs(self.path, exist_ok=True)
+        if len(df):
+            part = f"part-{len(state['parts']):06d}-{uuid.uuid4().hex[:8]}.parquet"
+            write_parquet_file(df, os.path.join(self.path, part))
+            state["parts"].append(part)
+            state["row_count"] += len(df)
+            if not state["dtypes"]:
+                state["dtypes"] = {col: str(df[col].dtype) for col in df.columns}
+
+        state["watermark"] = watermark
+        self._write_state(state)
+        return state
+
+    def read(self) -> pd.DataFrame:
+        """Read every stored row, in load order"""
+        state = self.load_state()
+        if not state or not state["parts"]:
+            return pd.DataFrame()
+
+        paths = [escape_sql_string(os.path.join(self.path, part)) for part in state["parts"]]
+        file_list = "[" + ", ".join(f"'{path}'" for path in paths) + "]"
+        conn = duckdb.connect(":memory:")
+        try:
+            df = conn.execute(
+                f"SELECT * FROM read_parquet({file_list}, union_by_name = true)"
+            ).df()
+        finally:
+            conn.close()
+        # Later parts may have widened a column (ints that turned into floats)
+        dtypes = {
+            col: dtype for col, dtype in state["dtypes"].items()
+            if col in df.columns and same_kind(pd.api.types.pandas_dtype(dtype), df[col].dtype)
+        }
+        return restore_dtypes(df, dtypes)
+
+    def reset(self) -> None:
+        """Forget the watermark and every stored row"""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _write_state(self, state: dict) -> None:
+        path = os.path.join(self.path, STATE_FILE)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, default=str)
+        os.replace(tmp_path, path)
+
+        # Drop parts left behind by interrupted runs
+        referenced = set(state["parts"])
+        for part in glob.glob(os.path.join(self.path, "part-*.parquet")):
+            if os.path.basename(part) not in referenced:
+                os.remove(part)
+
+
+def read_new_file_rows(
+    path: str,
+    source_type: str,
+    watermark: dict | None,
+    columns: list | None = None
+) -> tuple[pd.DataFrame, dict, bool]:
+    """
+    Read the rows of a file that lie past its watermark.
+
+    Returns:
+        (new rows, new watermark, full reload) - full reload is True when the
+        file was read from the start (first load, or the file was rewritten)
+    """
+    if source_type in BYTE_OFFSET_SOURCE_TYPES:
+        return read_new_text_rows(path, source_type, watermark, columns)
+    if source_type in ROW_COUNT_SOURCE_TYPES:
+        return read_new_parquet_rows(path, watermark, columns)
+    raise ValueError(
+        f"Incremental loading is not supported for {source_type} files "
+        f"(supported: {', '.join(INCREMENTAL_FILE_SOURCE_TYPES)})"
+    )
+
+
+def read_new_text_rows(
+    path: str,
+    source_type: str,
+    watermark: dict | None,
+    columns: list | None
+) -> tuple[pd.DataFrame, dict, bool]:
+    """
+    Read complete lines appended to a CSV / JSON Lines file since the last run.
+
+    Only newline-terminated lines are consumed; a partially written last line
+    is picked up by the next run.
+    """
+    offset = 0
+    if watermark and watermark.get("kind") == "byte_offset":
+        if (
+            os.path.getsize(path) >= watermark["offset"]
+            and prefix_hash(path, watermark["offset"]) == watermark["prefix_hash"]
+        ):
+            offset = watermark["offset"]
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    complete = data[:data.rfind(b"\n") + 1]
+    new_offset = offset + len(complete)
+
+    header = watermark.get("header") if offset and watermark else None
+    if not complete.strip():
+        df = pd.DataFrame(columns=columns or header or [])
+    elif source_type == "csv":
+        if offset:
+            df = pd.read_csv(io.BytesIO(complete), header=None, names=header, usecols=columns)
+        else:
+            df = pd.read_csv(io.BytesIO(complete), usecols=columns)
+            header = pd.read_csv(io.BytesIO(complete), nrows=0).columns.tolist()
+    else:
+        df = pd.read_json(io.BytesIO(complete), lines=True)
+        if columns:
+            require_columns(df.columns, columns)
+            df = df.reindex(columns=columns)
+
+    new_watermark = {
+        "kind": "byte_offset",
+        "offset": new_offset,
+        "prefix_hash": prefix_hash(path, new_offset),
+        "header": header,
+    }
+    return df, new_watermark, offset == 0
+
+
+def read_new_parquet_rows(
+    path: str,
+    watermark: dict | None,
+    columns: list | None
+) -> tuple[pd.DataFrame, dict, bool]:
+    """
+    Read the rows of a Parquet file beyond the row count already loaded.
+
+    The rows already loaded must still be the file's leading rows (same
+    prefix fingerprint); otherwise the file was rewritten and is reloaded
+    from the start.
+    """
+    conn = duckdb.connect(":memory:")
+    try:
+        source = f"read_parquet('{escape_sql_string(path)}')"
+        total = conn.execute(f"SELECT COUNT(*) FROM {source}").fetchone()[0]
+
+        loaded = 0
+        if (
+            watermark
+            and watermark.get("kind") == "row_count"
+            and watermark["rows"] <= total
+            and watermark.get("prefix_fingerprint")
+            and parquet_prefix_fingerprint(
+                conn, path, watermark["rows"], watermark["prefix_fingerprint"]["tail_start"]
+            ) == watermark["prefix_fingerprint"]
+        ):
+            loaded = watermark["rows"]
+
+        select = ", ".join(quote_identifier(col) for col in columns) if columns else "*"
+        df = conn.execute(f"SELECT {select} FROM {source} OFFSET {int(loaded)}").df()
+        fingerprint = parquet_prefix_fingerprint(conn, path, total)
+    finally:
+        conn.close()
+
+    return df, {"kind": "row_count", "rows": int(total), "prefix_fingerprint": fingerprint}, loaded == 0
+
+
+def parquet_prefix_fingerprint(
+    conn: duckdb.DuckDBPyConnection,
+    path: str,
+    rows: int,
+    tail_start: int | None = None
+) -> dict | None:
+    """
+    Fingerprint of the first `rows` rows of a Parquet file.
+
+    Row groups before `tail_start` contribute their footer metadata (row
+    count, column types, min / max / null statistics, compressed size); the
+    rows from `tail_start` on are hashed directly. By default the tail is
+    the last row group holding any of the rows, the one a writer extends
+    when rows are appended, so at most one row group is read. Passing the
+    `tail_start` of a stored fingerprint makes the two comparable; None is
+    returned when no row group starts there.
+    """
+    escaped = escape_sql_string(path)
+    metadata = conn.execute(
+        "SELECT row_group_id, row_group_num_rows, path_in_schema, type, stats_min_value, "
+        "stats_max_value, stats_null_count, total_compressed_size "
+        f"FROM parquet_metadata('{escaped}') ORDER BY row_group_id, column_id"
+    ).fetchall()
+    groups = [[column[1:] for column in group] for _, group in itertools.groupby(metadata, key=lambda c: c[0])]
+
+    if tail_start is None:
+        tail_start = 0
+        for group in groups:
+            if tail_start + group[0][0] >= rows:
+                break
+            tail_start += group[0][0]
+
+    digest = hashlib.blake2b(digest_size=16)
+    start = 0
+    for group in groups:
+        if start >= tail_start:
+            break
+        digest.update(repr(group).encode())
+        start += group[0][0]
+    if start != tail_start:
+        return None
+
+    tail = conn.execute(
+        f"SELECT * FROM read_parquet('{escaped}') OFFSET {int(tail_start)} LIMIT {int(rows - tail_start)}"
+    ).df()
+    return {"groups_hash": digest.hexdigest(), "tail_start": int(tail_start), "tail_hash": content_hash_of(tail)}
+
+
+def read_new_database_rows(
+    engine: Engine,
+    query: str,
+    watermark_column: str,
+    watermark: dict | None
+) -> tuple[pd.DataFrame, dict, bool]:
+    """
+    Read the rows of a query whose `watermark_column` exceeds the stored watermark.
+
+    The column must increase monotonically for appended rows (an id or an
+    insertion timestamp).
+    """
+    column = engine.dialect.identifier_preparer.quote(watermark_column)
+    source = f"({query.strip().rstrip(';')}) AS incremental_source"
+
+    last_value = watermark.get("value") if watermark and watermark.get("column") == watermark_column else None
+    if last_value is None:
+        df = pd.read_sql(sqlalchemy.text(f"SELECT * FROM {source}"), engine)
+    else:
+        df = pd.read_sql(
+            sqlalchemy.text(f"SELECT * FROM {source} WHERE {column} > :watermark"),
+            engine,
+            params={"watermark": last_value}
+        )
+
+    if watermark_column not in df.columns:
+        raise ValueError(f"Watermark column not found in query result: {watermark_column}")
+
+    new_value = last_value
+    if df[watermark_column].notna().any():
+        new_value = to_state_value(df[watermark_column].max())
+
+    return df, {"kind": "column", "column": watermark_column, "value": new_value}, last_value is None
+
+
+def to_state_value(value):
+    """Convert a watermark value to something JSON can store and SQL can compare"""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def prefix_hash(path: str, length: int) -> str:
+    """Hash up to PREFIX_HASH_BYTES bytes ending at `length`"""
+    start = max(0, length - PREFIX_HASH_BYTES)
+    with open(path, "rb") as f:
+        f.seek(start)
+        return hashlib.blake2b(f.read(length - start), digest_size=16).hexdigest()
@@ -0,0 +1,212 @@
+"""
+Persistent snapshot cache for data-loader.
+
+Parsed sources are stored as columnar snapshots (the same files used by
+reference tables) together with their schema, so re-running a flow on an
+unchanged file skips both parsing and profiling.
+
+Cache keys are built from everything that determines the loaded table:
+
+- files: absolute path, size, mtime and (optionally) a content hash, plus
+  the load parameters (columns, filter, dtype options, ...); multi-file
+  loads fingerprint every shard
+- databases: connection target (without password) and query
+
+The cache directory holds an `index.json` mapping keys to snapshots. Total
+snapshot size is bounded; least recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+from .table_codec import TABLE_FILE_ERRORS, read_table_reference, write_table_reference
+
+
+DEFAULT_LOAD_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+INDEX_FILE = "index.json"
+
+# Files are hashed in blocks of this size when a content hash is requested
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+class LoadCache:
+    """
+    Size-bounded LRU cache of loaded tables backed by a directory.
+
+    The index is rewritten atomically after every change. Concurrent
+    processes sharing a directory may lose each other's recency updates,
+    which only affects eviction order.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_LOAD_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[pd.DataFrame, dict] | None:
+        """Return (DataFrame, schema) for a cached load, or None on a miss"""
+        with self._lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+
+            table = entry["table"]
+            try:
+                df = read_table_reference(table)
+            except TABLE_FILE_ERRORS:
+                # Snapshot removed behind our back, truncated or corrupt: drop
+                # the stale entry (and the file, unless another entry shares it)
+                index.pop(key)
+                self._remove_unreferenced(table["path"], index)
+                self._write_index(index)
+                return None
+
+            entry["last_used"] = time.time()
+            self._write_index(index)
+            return df, table["schema"]
+
+    def put(self, key: str, df: pd.DataFrame, schema: dict) -> None:
+        """
+        Snapshot a loaded table under `key`, evicting old entries to respect the size cap.
+
+        Caching is best-effort: a table the snapshot format cannot hold
+        (mixed-type object columns) or a failing write is simply not cached.
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            table = write_table_reference(df, schema, self.cache_dir)
+            size = os.path.getsize(table["path"])
+        except TABLE_FILE_ERRORS:
+            return
+
+        with self._lock:
+            index = self._read_index()
+            if size > self.max_bytes:
+                self._remove_unreferenced(table["path"], index)
+                return
+            index[key] = {"table": table, "bytes": size, "last_used": time.time()}
+            self._evict(index)
+            self._write_index(index)
+
+    def clear(self) -> None:
+        """Remove every cached snapshot"""
+        with self._lock:
+            index = self._read_index()
+            for entry in index.values():
+                self._remove_file(entry["table"]["path"])
+            self._write_index({})
+
+    def _evict(self, index: dict) -> None:
+        # Entries with identical content share one snapshot file
+        snapshot_bytes = {entry["table"]["path"]: entry["bytes"] for entry in index.values()}
+        total = sum(snapshot_bytes.values())
+
+        for key in sorted(index, key=lambda k: index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            path = index.pop(key)["table"]["path"]
+            if self._remove_unreferenced(path, index):
+                total -= snapshot_bytes[path]
+
+    def _remove_unreferenced(self, path: str, index: dict) -> bool:
+        if any(entry["table"]["path"] == path for entry in index.values()):
+            return False
+        self._remove_file(path)
+        return True
+
+    def _remove_file(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _read_index(self) -> dict:
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILE), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_index(self, index: dict) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, INDEX_FILE)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, default=str)
+        os.replace(tmp_path, path)
+
+
+_load_caches: dict[str, LoadCache] = {}
+_load_caches_lock = threading.Lock()
+
+
+def get_load_cache(cache_dir: str, max_bytes: int = DEFAULT_LOAD_CACHE_MAX_BYTES) -> LoadCache:
+    """Return the process-wide LoadCache of a directory (updating its size cap)"""
+    cache_dir = os.path.abspath(cache_dir)
+    with _load_caches_lock:
+        cache = _load_caches.get(cache_dir)
+        if cache is None:
+            cache = _load_caches[cache_dir] = LoadCache(cache_dir, max_bytes)
+        cache.max_bytes = max_bytes
+        return cache
+
+
+def file_cache_key(path: str, params: dict, content_hash: bool = False) -> str:
+    """
+    Build the cache key of a file load.
+
+    Args:
+        path: Source file path
+        params: Every load parameter that changes the result (JSON-serializable)
+        content_hash: Also hash the file content, for sources whose mtime is unreliable
+    """
+    return cache_key({"kind": "file", **file_identity(path, content_hash), "params": params})
+
+
+def file_set_cache_key(paths: list[str], params: dict, content_hash: bool = False) -> str:
+    """Build the cache key of a multi-file load (any added, removed or changed shard misses)"""
+    return cache_key({
+        "kind": "file_set",
+        "files": [file_identity(path, content_hash) for path in paths],
+        "params": params,
+    })
+
+
+def file_identity(path: str, content_hash: bool = False) -> dict:
+    """Fingerprint of one file: absolute path, size, mtime and optionally a content hash"""
+    stat = os.stat(path)
+    identity = {
+        "path": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    if content_hash:
+        identity["content"] = file_content_hash(path)
+    return identity
+
+
+def database_cache_key(target: str, query: str, params: dict) -> str:
+    """Build the cache key of a database load (`target` must not contain the password)"""
+    return cache_key({"kind": "database", "target": target, "query": query, "params": params})
+
+
+def cache_key(identity: dict) -> str:
+    """Hash a JSON-serializable identity into a cache key"""
+    encoded = json.dumps(identity, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def file_content_hash(path: str) -> str:
+    """Hash a file's content in blocks"""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
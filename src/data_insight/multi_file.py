@@ -0,0 +1,221 @@
+"""
+Multi-file (glob / directory) datasets for data-loader.
+
+A file path containing glob characters, or naming a directory, selects a set
+of shards of one source type. Shards are parsed in parallel worker processes
+and combined into one table:
+
+- columns are the union over all shards (missing columns become nulls)
+- columns whose dtype differs between shards are cast to a common dtype
+  (a common numeric type, otherwise strings)
+- Hive-style `key=value` folders between the dataset root and a shard
+  become columns, typed numeric when every value is numeric
+"""
+
+import glob
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from .compressed_input import COMPRESSED_SOURCE_TYPES, detect_compression
+from .csv_ingest import read_csv_fast
+from .file_readers import read_arrow_ipc_file, read_jsonl_file, read_parquet_file
+
+
+MULTI_FILE_SOURCE_TYPES = ("csv", "json", "jsonl", "parquet", "feather", "arrow_ipc")
+
+# Shard extensions picked up when a directory is given (compressed variants included)
+SHARD_EXTENSIONS = {
+    "csv": (".csv",),
+    "json": (".json",),
+    "jsonl": (".jsonl", ".ndjson"),
+    "parquet": (".parquet", ".parq"),
+    "feather": (".feather", ".arrow", ".ipc"),
+    "arrow_ipc": (".arrow", ".ipc", ".feather"),
+}
+COMPRESSED_SUFFIXES = ("", ".gz", ".bz2", ".xz", ".zst", ".zip")
+
+GLOB_CHARACTERS = "*?["
+
+
+def is_multi_file_path(path: str) -> bool:
+    """Check whether a file path selects several shards (glob pattern or directory)"""
+    return os.path.isdir(path) or any(char in path for char in GLOB_CHARACTERS)
+
+
+def dataset_root(path: str) -> str:
+    """Return the directory that Hive partition folders are relative to"""
+    if os.path.isdir(path):
+        return path
+    parts = []
+    for part in path.split(os.sep):
+        if any(char in part for char in GLOB_CHARACTERS):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or "."
+
+
+def expand_file_paths(path: str, source_type: str) -> list[str]:
+    """
+    List the shards selected by a glob pattern or directory, in sorted order.
+
+    Directories are searched recursively for files with the source type's
+    extensions; hidden files and folders (".", "_" prefixes) are skipped.
+    """
+    if os.path.isdir(path):
+        suffixes = tuple(
+            extension + compressed
+            for extension in SHARD_EXTENSIONS[source_type]
+            for compressed in COMPRESSED_SUFFIXES
+        )
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = [name for name in dirnames if not name.startswith((".", "_"))]
+            paths.extend(
+                os.path.join(dirpath, name) for name in filenames
+                if name.lower().endswith(suffixes) and not name.startswith((".", "_"))
+            )
+    else:
+        paths = [match for match in glob.glob(path, recursive=True) if os.path.isfile(match)]
+
+    if not paths:
+        raise FileNotFoundError(f"No {source_type} files match: {path}")
+    return sorted(paths)
+
+
+def hive_partitions(path: str, root: str) -> dict[str, str]:
+    """Return the `key=value` folders between `root` and a shard"""
+    relative_dir = os.path.dirname(os.path.relpath(path, root))
+    partitions = {}
+    for part in relative_dir.split(os.sep):
+        key, sep, value = part.partition("=")
+        if sep and key:
+            partitions[key] = value
+    return partitions
+
+
+def read_shard(path: str, source_type: str, columns: list | None, root: str) -> pd.DataFrame:
+    """Read one shard and append its Hive partition columns (runs in a worker process)"""
+    compression = None
+    if source_type in COMPRESSED_SOURCE_TYPES:
+        compression = detect_compression(path)
+
+    partitions = hive_partitions(path, root)
+    # Partition columns are not stored in the shard itself
+    file_columns = [col for col in columns if col not in partitions] if columns else None
+
+    if source_type == "csv":
+        df = read_csv_fast(path, columns=file_columns, compression=compression)
+    elif source_type == "jsonl":
+        df = read_jsonl_file(path, file_columns, compression=compression)
+    elif source_type == "json":
+        df = pd.read_json(path, compression=compression or "infer")
+        if file_columns:
+            df = df.reindex(columns=file_columns)
+    elif source_type == "parquet":
+        df = read_parquet_file(path, file_columns)
+    elif source_type in ("feather", "arrow_ipc"):
+        df = read_arrow_ipc_file(path, file_columns)
+    else:
+        raise ValueError(f"Multi-file loading is not supported for {source_type} sources")
+
+    for key, value in partitions.items():
+        if not columns or key in columns:
+            df[key] = value
+    return df
+
+
+def iter_file_set(
+    paths: list[str],
+    source_type: str,
+    columns: list | None = None,
+    root: str = ".",
+    max_workers: int | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield shards in path order, parsed in parallel worker processes.
+
+    At most two shards per worker are in flight, so memory stays bounded
+    when the consumer writes shards out as they arrive.
+    """
+    if len(paths) == 1:
+        yield read_shard(paths[0], source_type, columns, root)
+        return
+
+    workers = min(len(paths), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        remaining = iter(paths)
+        for path in remaining:
+            pending.append(executor.submit(read_shard, path, source_type, columns, root))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            yield pending.popleft().result()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append(executor.submit(read_shard, next_path, source_type, columns, root))
+
+
+def read_file_set(
+    paths: list[str],
+    source_type: str,
+    columns: list | None = None,
+    root: str = ".",
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    """Read every shard in parallel and combine them into one reconciled table"""
+    frames = list(iter_file_set(paths, source_type, columns, root, max_workers))
+    partition_keys = set()
+    for path in paths:
+        partition_keys.update(hive_partitions(path, root))
+    return combine_shards(frames, sorted(partition_keys))
+
+
+def combine_shards(frames: list[pd.DataFrame], partition_keys: list | None = None) -> pd.DataFrame:
+    """Concatenate shards over the union of their columns with reconciled dtypes"""
+    frames = reconcile_dtypes([frame for frame in frames if len(frame.columns)])
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True)
+
+    # Partition values are parsed from folder names, so type them afterwards
+    for key in partition_keys or []:
+        if key in df.columns:
+            numeric = pd.to_numeric(df[key], errors="coerce")
+            if numeric.notna().sum() == df[key].notna().sum():
+                df[key] = numeric
+    return df
+
+
+def reconcile_dtypes(frames: list[pd.DataFrame]) -> list[pd.DataFrame]:
+    """Cast each column to one dtype across all shards before concatenation"""
+    dtypes = {}
+    for frame in frames:
+        for col in frame.columns:
+            dtypes.setdefault(col, set()).add(frame[col].dtype)
+
+    targets = {}
+    for col, seen in dtypes.items():
+        if len(seen) == 1:
+            continue
+        if all(pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) for dtype in seen):
+            targets[col] = np.result_type(*[np.dtype(str(dtype).lower()) for dtype in seen])
+        elif not all(pd.api.types.is_datetime64_any_dtype(dtype) for dtype in seen):
+            targets[col] = "str"
+
+    if not targets:
+        return frames
+
+    reconciled = []
+    for frame in frames:
+        casts = {col: dtype for col, dtype in targets.items() if col in frame.columns}
+        if casts:
+            frame = frame.astype(casts)
+        reconciled.append(frame)
+    return reconciled
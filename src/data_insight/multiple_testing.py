@@ -0,0 +1,51 @@
+"""
+Multiple-comparison corrections for families of p-values.
+
+Both corrections take p-values of any shape and return adjusted p-values of
+the same shape; NaN p-values (untestable pairs) stay NaN and do not count
+towards the family size.
+"""
+
+import numpy as np
+
+
+P_ADJUST_METHODS = ("fdr_bh", "holm")
+
+
+def adjust_p_values(p_values, method: str = "fdr_bh") -> np.ndarray:
+    """
+    Adjust p-values for multiple comparisons.
+
+    Args:
+        p_values: Array-like of raw p-values
+        method: "fdr_bh" (Benjamini-Hochberg false discovery rate) or
+            "holm" (Holm-Bonferroni family-wise error rate)
+
+    Returns:
+        Adjusted p-values (q-values for "fdr_bh"), capped at 1
+    """
+    p = np.asarray(p_values, dtype=np.float64)
+    adjusted = np.full(p.shape, np.nan)
+    valid = ~np.isnan(p)
+    flat = p[valid]
+    m = len(flat)
+    if m == 0:
+        return adjusted
+
+    order = np.argsort(flat)
+    ranked = flat[order]
+    if method == "fdr_bh":
+        # q_(i) = min over j >= i of p_(j) * m / j
+        scaled = ranked * m / np.arange(1, m + 1)
+        ranked_adjusted = np.minimum.accumulate(scaled[::-1])[::-1]
+    elif method == "holm":
+        # p_(i) * (m - i + 1), made monotone from the smallest p-value up
+        scaled = ranked * (m - np.arange(m))
+        ranked_adjusted = np.maximum.accumulate(scaled)
+    else:
+        raise ValueError(f"Unsupported p-value adjustment: {method} (supported: {', '.join(P_ADJUST_METHODS)})")
+
+    result = np.empty(m)
+    result[order] = np.minimum(ranked_adjusted, 1.0)
+    adjusted[valid] = result
+    return adjusted
@@ -0,0 +1,164 @@
+"""
+Descriptive statistics accumulated over record batches in constant memory.
+
+`OnlineStats` consumes DataFrame batches one at a time and keeps, per
+numeric column, the count, Welford mean / sum of squared deviations,
+min, max and a KLL quantile sketch. Partial accumulators over disjoint
+batches merge exactly (Chan et al. for the moments, sketch merge for the
+quantiles), so batches can be spread over parallel workers.
+
+`describe()` returns the same frame as `DataFrame.describe()` on the
+numeric columns; only the quartiles are approximate (within the KLL rank
+error).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .sketches import KLLSketch
+
+
+DESCRIBE_QUANTILES = (0.25, 0.5, 0.75)
+
+
+class OnlineStats:
+    """Mergeable count / mean / std / min / max / quartiles per numeric column"""
+
+    def __init__(self, seed: int | None = 0):
+        self.seed = seed
+        self.columns: list = []
+        self.count = np.zeros(0)
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.min = np.zeros(0)
+        self.max = np.zeros(0)
+        self.sketches: list[KLLSketch] = []
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error of the quartiles"""
+        return self.sketches[0].rank_error if self.sketches else 0.0
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Add a batch of rows (non-numeric columns are ignored)"""
+        numeric = batch.select_dtypes(include=[np.number])
+        for col in numeric.columns:
+            if col not in self.columns:
+                self._add_column(col)
+        if numeric.empty:
+            return
+
+        indices = [self.columns.index(col) for col in numeric.columns]
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        count = present.sum(axis=0).astype(np.float64)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(present, values, 0.0).sum(axis=0) / count
+            deviations = np.where(present, values - mean, 0.0)
+        m2 = np.einsum("ij,ij->j", deviations, deviations)
+        with np.errstate(invalid="ignore"):
+            low = np.where(present, values, np.inf).min(axis=0)
+            high = np.where(present, values, -np.inf).max(axis=0)
+
+        self._combine(indices, count, mean, m2, low, high)
+        for position, index in enumerate(indices):
+            if count[position]:
+                self.sketches[index].update(values[present[:, position], position])
+
+    def merge(self, other: "OnlineStats") -> None:
+        """Fold in an accumulator built over other rows"""
+        for col in other.columns:
+            if col not in self.columns:
+                self._add_column(col)
+        if not other.columns:
+            return
+
+        indices = [self.columns.index(col) for col in other.columns]
+        self._combine(indices, other.count, other.mean, other.m2, other.min, other.max)
+        for position, index in enumerate(indices):
+            self.sketches[index].merge(other.sketches[position])
+
+    def describe(self) -> pd.DataFrame:
+        """Statistics in the layout of `DataFrame.describe()`"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(self.m2 / (self.count - 1))
+        std[self.count < 2] = np.nan
+        empty = self.count == 0
+
+        rows = {
+            "count": self.count,
+            "mean": np.where(empty, np.nan, self.mean),
+            "std": std,
+            "min": np.where(empty, np.nan, self.min),
+        }
+        quartiles = np.array([
+            [np.nan if value is None else value for value in sketch.quantiles(DESCRIBE_QUANTILES)]
+            for sketch in self.sketches
+        ]).reshape(len(self.columns), len(DESCRIBE_QUANTILES))
+        for position, fraction in enumerate(DESCRIBE_QUANTILES):
+            rows[f"{fraction:.0%}"] = quartiles[:, position]
+        rows["max"] = np.where(empty, np.nan, self.max)
+
+        return pd.DataFrame(rows, index=self.columns).T
+
+    def _add_column(self, col) -> None:
+        self.columns.append(col)
+        self.count = np.append(self.count, 0.0)
+        self.mean = np.append(self.mean, 0.0)
+        self.m2 = np.append(self.m2, 0.0)
+        self.min = np.append(self.min, np.inf)
+        self.max = np.append(self.max, -np.inf)
+        self.sketches.append(KLLSketch(seed=self.seed))
+
+    def _combine(self, indices: list, count, mean, m2, low, high) -> None:
+        """Chan's parallel update of the moments for the given columns"""
+        n_a = self.count[indices]
+        total = n_a + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = np.nan_to_num(mean) - self.mean[indices]
+            weight = np.where(total > 0, count / total, 0.0)
+            self.mean[indices] = self.mean[indices] + delta * weight
+            self.m2[indices] = self.m2[indices] + np.nan_to_num(m2) + delta ** 2 * n_a * weight
+        self.count[indices] = total
+        self.min[indices] = np.minimum(self.min[indices], low)
+        self.max[indices] = np.maximum(self.max[indices], high)
+
+
+def summarize_batches(batches: Iterable[pd.DataFrame], workers: int = 1, seed: int | None = 0) -> OnlineStats:
+    """
+    Accumulate statistics over record batches.
+
+    With several workers each thread pulls batches from the shared iterator
+    into its own accumulator (NumPy releases the GIL for the heavy work) and
+    the partial results are merged at the end.
+    """
+    if workers <= 1:
+        stats = OnlineStats(seed)
+        for batch in batches:
+            stats.update(batch)
+        return stats
+
+    iterator = iter(batches)
+    lock = threading.Lock()
+
+    def work(worker: int) -> OnlineStats:
+        partial = OnlineStats(None if seed is None else seed + worker)
+        while True:
+            with lock:
+                batch = next(iterator, None)
+            if batch is None:
+                return partial
+            partial.update(batch)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        partials = list(pool.map(work, range(workers)))
+
+    stats = partials[0]
+    for partial in partials[1:]:
+        stats.merge(partial)
+    return stats
@@ -0,0 +1,282 @@
+"""
+Row sampling for approximate analysis, with metadata that travels with the table.
+
+data-loader can replace a large table by a sample and records how it was
+drawn under the table's "sampling" key:
+
+    {
+        "method": "stratified",            # reservoir | stratified | first_n
+        "fraction": 0.01,                  # sample rows / population rows
+        "population_row_count": 50000000,
+        "sample_row_count": 500000,
+        "stratify_by": "region",           # stratified only
+        "strata": {"North": {"population": 20000000, "sample": 200000}, ...},
+        "seed": 42,
+        "approximate": True
+    }
+
+Downstream tasks use `table_sampling` to detect sampled input,
+`row_weights` / `scale_count` to estimate population counts and
+`sampling_note` to label their results as approximate.
+"""
+
+import contextlib
+import math
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from .schema_profiler import quote_identifier
+from .table_codec import escape_sql_string, restore_dtypes
+
+
+SAMPLING_METHODS = ("reservoir", "stratified", "first_n")
+
+# Row position column added by read_parquet(..., file_row_number = true)
+ROW_NUMBER_COLUMN = "file_row_number"
+
+
+def sample_frame(
+    df: pd.DataFrame,
+    method: str,
+    size: int | None = None,
+    fraction: float | None = None,
+    stratify_by: str | None = None,
+    seed: int | None = None
+) -> tuple[pd.DataFrame, dict | None]:
+    """
+    Sample an in-memory table.
+
+    Args:
+        df: Table to sample
+        method: "reservoir" (uniform), "stratified" (proportional per value of
+            `stratify_by`) or "first_n"
+        size: Target number of sample rows
+        fraction: Target fraction of rows (used when `size` is not given)
+        stratify_by: Column whose values define the strata
+        seed: Random seed for reproducible samples
+
+    Returns:
+        (sample, sampling metadata) - the table itself and None when the
+        target size covers every row
+    """
+    population = len(df)
+    target = target_sample_size(population, size, fraction)
+    if target >= population:
+        return df, None
+
+    if method == "first_n":
+        sample = df.head(target)
+        strata = None
+    elif method == "reservoir":
+        sample = df.sample(n=target, random_state=seed).sort_index()
+        strata = None
+    elif method == "stratified":
+        if not stratify_by or stratify_by not in df.columns:
+            raise ValueError(f"Stratified sampling requires an existing stratify_by column, got: {stratify_by}")
+        sample_fraction = target / population
+        groups = df.groupby(stratify_by, dropna=False, sort=False, observed=True)
+        sample = groups.sample(frac=sample_fraction, random_state=seed).sort_index()
+        population_counts = df[stratify_by].map(stratum_key).value_counts()
+        sample_counts = sample[stratify_by].map(stratum_key).value_counts()
+        strata = {
+            key: {"population": int(count), "sample": int(sample_counts.get(key, 0))}
+            for key, count in population_counts.items()
+        }
+    else:
+        raise ValueError(f"Unsupported sampling method: {method} (supported: {', '.join(SAMPLING_METHODS)})")
+
+    sample = sample.reset_index(drop=True)
+    return sample, sampling_metadata(method, population, len(sample), stratify_by, strata, seed)
+
+
+def sample_reference_table(
+    table: dict,
+    method: str,
+    size: int | None = None,
+    fraction: float | None = None,
+    stratify_by: str | None = None,
+    seed: int | None = None
+) -> tuple[pd.DataFrame, dict | None]:
+    """
+    Sample a reference table out-of-core with DuckDB.
+
+    Only the sample is materialized, so this works for tables far larger than
+    memory (for example chunked loads). Arguments are as for `sample_frame`.
+    """
+    with contextlib.ExitStack() as stack:
+        conn = duckdb.connect(":memory:")
+        stack.callback(conn.close)
+
+        if table.get("file_format") == "arrow":
+            import pyarrow as pa
+
+            # Memory-mapped, so DuckDB scans the file without loading it
+            source_file = stack.enter_context(pa.memory_map(table["path"], "r"))
+            arrow_table = pa.ipc.open_file(source_file).read_all()
+            conn.register("sample_source", arrow_table)
+            source = "sample_source"
+        else:
+            source = f"read_parquet('{escape_sql_string(table['path'])}')"
+
+        population = conn.execute(f"SELECT COUNT(*) FROM {source}").fetchone()[0]
+        target = target_sample_size(population, size, fraction)
+        if target >= population:
+            return restore_dtypes(conn.execute(f"SELECT * FROM {source}").df(), table.get("dtypes", {})), None
+
+        strata = None
+        if method == "first_n":
+            sample = conn.execute(f"SELECT * FROM {source} LIMIT {target}").df()
+        elif method == "reservoir":
+            repeatable = f" REPEATABLE ({int(seed)})" if seed is not None else ""
+            sample = conn.execute(
+                f"SELECT * FROM {source} USING SAMPLE reservoir({target} ROWS){repeatable}"
+            ).df()
+        elif method == "stratified":
+            if not stratify_by or stratify_by not in table.get("columns", []):
+                raise ValueError(f"Stratified sampling requires an existing stratify_by column, got: {stratify_by}")
+            column = quote_identifier(stratify_by)
+
+            # Rows are shuffled by a hash of their position in the file and the
+            # seed: unlike random(), the order does not depend on how DuckDB
+            # splits the scan over threads
+            if table.get("file_format") == "arrow":
+                conn.register("numbered_source", arrow_table.append_column(
+                    ROW_NUMBER_COLUMN, pa.array(np.arange(arrow_table.num_rows, dtype=np.int64))
+                ))
+                numbered = "numbered_source"
+            else:
+                numbered = f"read_parquet('{escape_sql_string(table['path'])}', file_row_number = true)"
+            shuffle = f"hash({ROW_NUMBER_COLUMN}, {int(seed)})" if seed is not None else "random()"
+
+            # Proportional allocation: the first ceil(fraction * n) rows of each
+            # stratum in shuffled order
+            sample = conn.execute(
+                f"""
+                SELECT * EXCLUDE (sample_rank, stratum_rows, {ROW_NUMBER_COLUMN}) FROM (
+                    SELECT *,
+                        row_number() OVER (
+                            PARTITION BY {column} ORDER BY {shuffle}, {ROW_NUMBER_COLUMN}
+                        ) AS sample_rank,
+                        COUNT(*) OVER (PARTITION BY {column}) AS stratum_rows
+                    FROM {numbered}
+                ) WHERE sample_rank <= CEIL(stratum_rows * {target / population})
+                ORDER BY {ROW_NUMBER_COLUMN}
+                """
+            ).df()
+            counts = conn.execute(
+                f"SELECT {column}, COUNT(*) FROM {source} GROUP BY {column}"
+            ).fetchall()
+            sample_counts = sample[stratify_by].map(stratum_key).value_counts()
+            strata = {
+                stratum_key(value): {
+                    "population": int(count),
+                    "sample": int(sample_counts.get(stratum_key(value), 0)),
+                }
+                for value, count in counts
+            }
+        else:
+            raise ValueError(f"Unsupported sampling method: {method} (supported: {', '.join(SAMPLING_METHODS)})")
+
+    sample = restore_dtypes(sample, table.get("dtypes", {}))
+    return sample, sampling_metadata(method, population, len(sample), stratify_by, strata, seed)
+
+
+def target_sample_size(population: int, size: int | None, fraction: float | None) -> int:
+    """Resolve the requested sample size (an explicit size wins over a fraction)"""
+    if size:
+        return min(population, int(size))
+    if fraction:
+        if not 0 < fraction <= 1:
+            raise ValueError(f"Sample fraction must be in (0, 1], got {fraction}")
+        return min(population, max(1, math.ceil(population * fraction)))
+    raise ValueError("Sampling requires a sample size or fraction")
+
+
+def sampling_metadata(
+    method: str,
+    population: int,
+    sample_size: int,
+    stratify_by: str | None,
+    strata: dict | None,
+    seed: int | None
+) -> dict:
+    """Assemble the "sampling" metadata of a sampled table"""
+    metadata = {
+        "method": method,
+        "fraction": sample_size / population if population else 1.0,
+        "population_row_count": int(population),
+        "sample_row_count": int(sample_size),
+        "seed": seed,
+        "approximate": True,
+    }
+    if method == "stratified":
+        metadata["stratify_by"] = stratify_by
+        metadata["strata"] = strata
+    return metadata
+
+
+def stratum_key(value) -> str:
+    """JSON key of a stratum value (missing values share one stratum)"""
+    return "null" if pd.isna(value) else str(value)
+
+
+def table_sampling(table: dict) -> dict | None:
+    """Return the sampling metadata of a data_table, or None for complete tables"""
+    sampling = table.get("sampling") if isinstance(table, dict) else None
+    return sampling or None
+
+
+def row_weights(df: pd.DataFrame, sampling: dict | None) -> np.ndarray:
+    """
+    Population rows represented by each sample row.
+
+    Uniform samples weigh every row by population / sample size; stratified
+    samples weigh each row by its stratum's ratio. Complete tables (and
+    first-N samples, which cannot be extrapolated) weigh 1.
+    """
+    if not sampling or sampling.get("method") == "first_n":
+        return np.ones(len(df))
+
+    if sampling.get("method") == "stratified" and sampling.get("stratify_by") in df.columns:
+        ratios = {
+            key: stratum["population"] / stratum["sample"]
+            for key, stratum in sampling["strata"].items() if stratum["sample"]
+        }
+        keys = df[sampling["stratify_by"]].map(stratum_key)
+        return keys.map(ratios).fillna(1.0).to_numpy(dtype=float)
+
+    return np.full(len(df), scale_factor(sampling))
+
+
+def scale_factor(sampling: dict | None) -> float:
+    """Overall population / sample ratio (1 for complete tables and first-N samples)"""
+    if not sampling or sampling.get("method") == "first_n" or not sampling.get("sample_row_count"):
+        return 1.0
+    return sampling["population_row_count"] / sampling["sample_row_count"]
+
+
+def scale_count(count: int, sampling: dict | None) -> int:
+    """Estimate a population count from a count over a uniform sample"""
+    return int(round(count * scale_factor(sampling)))
+
+
+def sampling_note(sampling: dict | None) -> str:
+    """One-line description of how approximate results were computed ("" for complete tables)"""
+    if not sampling:
+        return ""
+
+    method = {
+        "reservoir": "uniform random",
+        "stratified": f"stratified (by {sampling.get('stratify_by')})",
+        "first_n": "first-N",
+    }.get(sampling.get("method"), sampling.get("method"))
+    note = (
+        f"Approximate: computed on a {method} sample of "
+        f"{sampling['sample_row_count']:,} of {sampling['population_row_count']:,} rows "
+        f"({sampling['fraction']:.2%})"
+    )
+    if sampling.get("method") == "first_n":
+        note += "; first-N samples may not represent the whole table"
+    return note
@@ -0,0 +1,382 @@
+"""
+Vectorized column profiling that produces the canonical table schema.
+
+Every task that emits a `data_table` uses `profile_schema`. Each column entry
+keeps both historical key styles so existing consumers keep working:
+
+    {
+        "name": "sales",
+        "type": "quantitative",            # semantic type (nominal/ordinal/quantitative/temporal)
+        "semantic_type": "quantitative",   # same value, data-loader key style
+        "dtype": "int64",                  # pandas dtype
+        "nullable": False,
+        "null_count": 0,
+        "unique_count": 12,
+        "min": 100.0, "max": 900.0, "mean": 450.0,             # flat stats
+        "stats": {"min": 100.0, "max": 900.0, "mean": 450.0},  # nested stats
+        "unique_values": [...],            # nominal columns with <= 10 values
+        "sample_values": [...]             # nominal columns, first 3 values
+    }
+
+Statistics are computed per dtype block rather than per column: one null
+count over the frame, one sort of each numeric block (which yields min, max
+and distinct counts for every column at once) and one hash-based distinct
+count over the remaining columns.
+
+Frames of SKETCH_PROFILE_MIN_ROWS rows or more are profiled from mergeable
+sketches instead (see `sketches`), in one bounded-memory pass. Sketched
+entries carry their error bounds:
+
+    {
+        ...,
+        "unique_count_approximate": True,
+        "unique_count_error": 0.008,       # relative standard error
+        "quantiles": {"0.01": ..., "0.25": ..., "0.5": ..., "0.75": ..., "0.99": ...},
+        "quantile_rank_error": 0.013,      # normalized rank error
+        "top_values": [{"value": "North", "count": 120000}, ...],
+        "top_values_max_error": 0          # counts are low by at most this
+    }
+"""
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from .sketches import (
+    SCHEMA_QUANTILES,
+    SKETCH_PROFILE_MIN_ROWS,
+    TableSketch,
+    sketch_frame,
+)
+from .table_codec import escape_sql_string
+
+
+# Numeric columns with fewer distinct values than this are treated as ordinal
+ORDINAL_MAX_UNIQUE = 20
+
+# Nominal columns with at most this many distinct values list them all
+UNIQUE_VALUES_LIMIT = 10
+
+SAMPLE_VALUES_COUNT = 3
+
+# Numeric columns are profiled in blocks of this many columns to bound the
+# size of the temporary sorted copy on very wide tables
+NUMERIC_BLOCK_COLUMNS = 64
+
+
+def profile_schema(df: pd.DataFrame) -> dict:
+    """
+    Infer the canonical schema of a DataFrame.
+
+    Returns a dictionary mapping column names to their types and statistics.
+    """
+    if len(df) >= SKETCH_PROFILE_MIN_ROWS:
+        return profile_sketch(sketch_frame(df))
+
+    row_count = len(df)
+    null_counts = df.isna().sum()
+
+    numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+    temporal_cols = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
+    typed_cols = set(numeric_cols) | set(temporal_cols)
+    other_cols = [col for col in df.columns if col not in typed_cols]
+
+    numeric_stats = profile_numeric_columns(df, numeric_cols)
+    temporal_stats = profile_temporal_columns(df, temporal_cols)
+    nominal_stats = profile_nominal_columns(df, other_cols)
+
+    schema = {}
+    for col in df.columns:
+        if col in numeric_stats:
+            stats = numeric_stats[col]
+            unique_count = stats.pop("unique_count")
+            semantic_type = numeric_semantic_type(unique_count, row_count)
+            extra = {}
+        elif col in temporal_stats:
+            stats = temporal_stats[col]
+            unique_count = stats.pop("unique_count")
+            semantic_type = "temporal"
+            extra = {}
+        else:
+            stats = None
+            extra = dict(nominal_stats[col])
+            unique_count = extra.pop("unique_count")
+            semantic_type = "nominal"
+
+        schema[col] = column_schema(
+            col, str(df[col].dtype), semantic_type,
+            int(null_counts[col]), unique_count, stats, extra
+        )
+
+    return schema
+
+
+def numeric_semantic_type(unique_count: int, row_count: int) -> str:
+    """Numeric columns with few distinct values are ordinal, the rest quantitative"""
+    if unique_count < ORDINAL_MAX_UNIQUE and unique_count < row_count * 0.5:
+        return "ordinal"
+    return "quantitative"
+
+
+def column_schema(
+    name: str,
+    dtype: str,
+    semantic_type: str,
+    null_count: int,
+    unique_count: int,
+    stats: dict | None,
+    extra: dict
+) -> dict:
+    """Assemble one canonical column entry (both key styles, flat and nested stats)"""
+    col_info = {
+        "name": name,
+        "dtype": dtype,
+        "nullable": null_count > 0,
+        "null_count": null_count,
+        "type": semantic_type,
+        "semantic_type": semantic_type,
+        "unique_count": unique_count,
+    }
+    if stats is not None:
+        col_info.update(stats)
+        col_info["stats"] = dict(stats)
+    col_info.update(extra)
+    return col_info
+
+
+def profile_numeric_columns(df: pd.DataFrame, columns: list) -> dict:
+    """
+    Compute min, max, mean and distinct count for numeric columns.
+
+    Each block of columns is copied into one float matrix (one contiguous row
+    per column) and sorted once. NaNs sort to the end, so for every column
+    the first value is the minimum, the last valid value is the maximum and
+    the number of value changes gives the distinct count.
+    """
+    results = {}
+
+    for start in range(0, len(columns), NUMERIC_BLOCK_COLUMNS):
+        block_cols = columns[start:start + NUMERIC_BLOCK_COLUMNS]
+        values = np.ascontiguousarray(
+            df[block_cols].to_numpy(dtype="float64", na_value=np.nan).T
+        )
+        if not values.flags.writeable:
+            values = values.copy()
+
+        valid_mask = ~np.isnan(values)
+        valid_counts = valid_mask.sum(axis=1)
+        sums = np.sum(values, axis=1, where=valid_mask)
+        values.sort(axis=1)
+
+        # Value changes between neighbours, ignoring the NaN tail
+        changes = values[:, 1:] != values[:, :-1]
+        changes &= valid_counts[:, None] > np.arange(1, values.shape[1])
+        unique_counts = changes.sum(axis=1) + (valid_counts > 0)
+
+        for i, col in enumerate(block_cols):
+            valid = int(valid_counts[i])
+            if valid == 0:
+                results[col] = {"min": None, "max": None, "mean": None, "unique_count": 0}
+                continue
+            results[col] = {
+                "min": float(values[i, 0]),
+                "max": float(values[i, valid - 1]),
+                "mean": float(sums[i] / valid),
+                "unique_count": int(unique_counts[i]),
+            }
+
+    return results
+
+
+def profile_temporal_columns(df: pd.DataFrame, columns: list) -> dict:
+    """Compute min, max and distinct count for datetime columns"""
+    if not columns:
+        return {}
+
+    subset = df[columns]
+    mins = subset.min()
+    maxs = subset.max()
+    unique_counts = subset.nunique()
+
+    return {
+        col: {
+            "min": None if pd.isna(mins[col]) else str(mins[col]),
+            "max": None if pd.isna(maxs[col]) else str(maxs[col]),
+            "unique_count": int(unique_counts[col]),
+        }
+        for col in columns
+    }
+
+
+def profile_nominal_columns(df: pd.DataFrame, columns: list) -> dict:
+    """Compute distinct counts and example values for nominal columns"""
+    if not columns:
+        return {}
+
+    subset = df[columns]
+    try:
+        unique_counts = subset.nunique()
+    except TypeError:
+        # Unhashable cell values (lists, dicts) are counted by their string form
+        unique_counts = subset.astype(str).where(subset.notna()).nunique()
+
+    results = {}
+    for col in columns:
+        unique_count = int(unique_counts[col])
+        non_null = subset[col].dropna()
+        col_stats = {
+            "unique_count": unique_count,
+            "sample_values": to_json_values(non_null.head(SAMPLE_VALUES_COUNT).tolist()),
+        }
+        if unique_count <= UNIQUE_VALUES_LIMIT:
+            try:
+                unique_values = non_null.unique().tolist()
+            except TypeError:
+                unique_values = non_null.astype(str).unique().tolist()
+            col_stats["unique_values"] = to_json_values(unique_values)
+        results[col] = col_stats
+
+    return results
+
+
+def to_json_values(values: list) -> list:
+    """Convert values that JSON cannot represent (timestamps, objects) to strings"""
+    return [
+        value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+        for value in values
+    ]
+
+
+def profile_sketch(sketch: TableSketch, dtypes: dict | None = None) -> dict:
+    """
+    Build the canonical schema from a table sketch.
+
+    Args:
+        sketch: Sketch of every row of the table
+        dtypes: Final pandas dtypes by column (defaults to the dtype each
+            column had when the sketch first saw it)
+    """
+    schema = {}
+    for col, col_sketch in sketch.columns.items():
+        dtype = (dtypes or {}).get(col, col_sketch.dtype)
+        unique_count, approximate = col_sketch.distinct_count()
+        extra = {"unique_count_approximate": approximate}
+        if approximate:
+            extra["unique_count_error"] = round(col_sketch.distinct.relative_error, 4)
+
+        if col_sketch.kind == "nominal":
+            stats = None
+            semantic_type = "nominal"
+            extra["sample_values"] = to_json_values(col_sketch.sample_values)
+            top = col_sketch.frequent.top(UNIQUE_VALUES_LIMIT)
+            top_values = to_json_values([value for value, _ in top])
+            if unique_count <= UNIQUE_VALUES_LIMIT and not approximate:
+                extra["unique_values"] = top_values
+            extra["top_values"] = [
+                {"value": value, "count": int(count)} for value, (_, count) in zip(top_values, top)
+            ]
+            extra["top_values_max_error"] = int(col_sketch.frequent.max_error)
+        else:
+            kll = col_sketch.quantile_sketch
+            quantiles = kll.quantiles(SCHEMA_QUANTILES)
+            if col_sketch.kind == "temporal":
+                tz = getattr(pd.api.types.pandas_dtype(dtype), "tz", None)
+                stats = {
+                    "min": timestamp_text(kll.min, tz) if kll.count else None,
+                    "max": timestamp_text(kll.max, tz) if kll.count else None,
+                }
+                extra["quantiles"] = {
+                    str(q): timestamp_text(v, tz) for q, v in zip(SCHEMA_QUANTILES, quantiles)
+                }
+                semantic_type = "temporal"
+            else:
+                stats = {
+                    "min": kll.min if kll.count else None,
+                    "max": kll.max if kll.count else None,
+                    "mean": col_sketch.total / col_sketch.count if col_sketch.count else None,
+                }
+                extra["quantiles"] = {str(q): v for q, v in zip(SCHEMA_QUANTILES, quantiles)}
+                semantic_type = numeric_semantic_type(unique_count, sketch.row_count)
+            extra["quantile_rank_error"] = round(kll.rank_error, 4)
+
+        schema[col] = column_schema(
+            col, dtype, semantic_type, int(col_sketch.null_count), unique_count, stats, extra
+        )
+
+    return schema
+
+
+def timestamp_text(value: float | None, tz=None) -> str | None:
+    """Format sketched epoch nanoseconds like the exact temporal profile"""
+    if value is None:
+        return None
+    return str(pd.Timestamp(int(value), tz=tz))
+
+
+def profile_parquet_file(path: str, sample_df: pd.DataFrame) -> dict:
+    """
+    Profile a Parquet file out-of-core with DuckDB.
+
+    Used when a table is too large to hold in memory. `sample_df` (for example
+    the first chunk that was read) provides pandas dtypes and sample values.
+    Distinct counts use DuckDB's HyperLogLog estimate and are flagged with
+    "unique_count_approximate".
+    """
+    columns = sample_df.columns.tolist()
+    aggregates = ["COUNT(*)"]
+    for col in columns:
+        quoted = quote_identifier(col)
+        aggregates.append(f"COUNT({quoted})")
+        aggregates.append(f"approx_count_distinct({quoted})")
+        if pd.api.types.is_numeric_dtype(sample_df[col]):
+            aggregates.append(f"MIN({quoted})::DOUBLE")
+            aggregates.append(f"MAX({quoted})::DOUBLE")
+            aggregates.append(f"AVG({quoted})::DOUBLE")
+        elif pd.api.types.is_datetime64_any_dtype(sample_df[col]):
+            aggregates.append(f"MIN({quoted})::VARCHAR")
+            aggregates.append(f"MAX({quoted})::VARCHAR")
+
+    conn = duckdb.connect(":memory:")
+    try:
+        source = f"read_parquet('{escape_sql_string(path)}')"
+        result = list(conn.execute(f"SELECT {', '.join(aggregates)} FROM {source}").fetchone())
+
+        row_count = int(result.pop(0))
+        schema = {}
+        for col in columns:
+            quoted = quote_identifier(col)
+            null_count = row_count - int(result.pop(0))
+            unique_count = int(result.pop(0))
+            dtype = str(sample_df[col].dtype)
+            extra = {"unique_count_approximate": True}
+
+            if pd.api.types.is_numeric_dtype(sample_df[col]):
+                stats = {"min": result.pop(0), "max": result.pop(0), "mean": result.pop(0)}
+                semantic_type = numeric_semantic_type(unique_count, row_count)
+            elif pd.api.types.is_datetime64_any_dtype(sample_df[col]):
+                stats = {"min": result.pop(0), "max": result.pop(0)}
+                semantic_type = "temporal"
+            else:
+                stats = None
+                semantic_type = "nominal"
+                non_null = sample_df[col].dropna()
+                extra["sample_values"] = to_json_values(non_null.head(SAMPLE_VALUES_COUNT).tolist())
+                if unique_count <= UNIQUE_VALUES_LIMIT:
+                    distinct = conn.execute(
+                        f"SELECT DISTINCT {quoted} FROM {source} "
+                        f"WHERE {quoted} IS NOT NULL LIMIT {UNIQUE_VALUES_LIMIT + 1}"
+                    ).fetchall()
+                    extra["unique_values"] = to_json_values([row[0] for row in distinct])
+
+            schema[col] = column_schema(
+                col, dtype, semantic_type, null_count, unique_count, stats, extra
+            )
+    finally:
+        conn.close()
+
+    return schema
+
+
+def quote_identifier(name) -> str:
+    """Quote a column name for use in DuckDB SQL"""
+    return '"' + str(name).replace('"', '""') + '"'
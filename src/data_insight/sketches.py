@@ -0,0 +1,402 @@
+"""
+Mergeable streaming sketches for profiling tables too large to count exactly.
+
+- `HyperLogLog`: distinct counts (relative standard error 1.04 / sqrt(2^p))
+- `KLLSketch`: quantiles with a bounded rank error (about 1.3% at k=200)
+- `FrequentItems`: top values with Misra-Gries counts; every reported count
+  undercounts the true one by at most `max_error`
+
+Each sketch takes whole chunks (vectorized updates), keeps bounded memory
+regardless of the number of rows, and merges with a sketch of the same
+configuration built over other chunks, in another thread or in another
+process (sketches pickle as plain numpy arrays and Series).
+
+`TableSketch` bundles one sketch set per column; `schema_profiler.profile_sketch`
+turns it into the canonical schema with the error bounds attached.
+"""
+
+import math
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+
+# profile_schema switches from exact to sketch-based statistics at this size
+SKETCH_PROFILE_MIN_ROWS = 10_000_000
+
+# In-memory frames are sketched in slices of this many rows
+DEFAULT_SKETCH_CHUNK_ROWS = 1_000_000
+
+DEFAULT_HLL_PRECISION = 14
+DEFAULT_KLL_K = 200
+DEFAULT_FREQUENT_ITEMS = 256
+
+# Quantiles reported in the schema
+SCHEMA_QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.99)
+
+
+class HyperLogLog:
+    """Distinct-count sketch over 64-bit value hashes with 2^precision registers"""
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of `estimate`"""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Add values given as uint64 hashes"""
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes << np.uint64(p)
+
+        # Rank = leading zeros of the remaining bits + 1. The float log2 can
+        # round up just below a power of two, which the shift check corrects.
+        nonzero = rest != 0
+        bit_length = np.zeros(len(rest), dtype=np.int64)
+        with np.errstate(divide="ignore"):
+            bit_length[nonzero] = np.floor(np.log2(rest[nonzero].astype(np.float64))).astype(np.int64) + 1
+        too_long = nonzero & ((rest >> (bit_length.clip(1) - 1).astype(np.uint64)) == 0)
+        bit_length[too_long] -= 1
+        rank = np.where(nonzero, 64 - bit_length + 1, 64 - p + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Fold in a sketch of other values (same precision)"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+
+class KLLSketch:
+    """
+    Quantile sketch: a stack of compactors whose level h items weigh 2^h.
+
+    A level that outgrows its capacity is sorted and every other item (from
+    a random offset) moves up one level, which halves it while keeping ranks
+    unbiased.
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, seed: int | None = None):
+        self.k = k
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error of `quantiles` (99% confidence)"""
+        return 2.296 / self.k ** 0.9723
+
+    def update(self, values: np.ndarray) -> None:
+        """Add float values (NaNs must already be removed)"""
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(np.float64, copy=False)])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """Fold in a sketch of other values"""
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def quantiles(self, fractions) -> list[float | None]:
+        """Estimated values at each fraction in [0, 1]"""
+        if self.count == 0:
+            return [None for _ in fractions]
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 1 << level, dtype=np.int64)
+            for level, level_items in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+
+        results = []
+        for fraction in fractions:
+            if fraction <= 0:
+                results.append(self.min)
+            elif fraction >= 1:
+                results.append(self.max)
+            else:
+                position = np.searchsorted(cumulative, fraction * cumulative[-1], side="left")
+                results.append(float(items[min(position, len(items) - 1)]))
+        return results
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(8, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+
+            items = np.sort(items)
+            # An odd item stays behind so that the promoted half is exact
+            keep = items[:1] if len(items) % 2 else items[:0]
+            paired = items[len(keep):]
+            promoted = paired[int(self._rng.integers(2))::2]
+
+            self.levels[level] = keep
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            # New top levels shrink the capacities below, so rescan from the bottom
+            level = 0
+
+
+class FrequentItems:
+    """
+    Misra-Gries heavy-hitter summary with at most `capacity` counters.
+
+    Counts are exact until more than `capacity` distinct values have been
+    seen; after that each count is low by at most `max_error`.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_FREQUENT_ITEMS):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.max_error = 0
+
+    @property
+    def exact(self) -> bool:
+        """True while no counter has been decremented"""
+        return self.max_error == 0
+
+    def update(self, values: pd.Series) -> None:
+        """Add the non-null values of a chunk"""
+        try:
+            chunk_counts = values.value_counts(dropna=True)
+        except TypeError:
+            chunk_counts = values.astype(str).value_counts(dropna=True)
+        chunk_counts = chunk_counts[chunk_counts > 0]
+        chunk_counts.index = chunk_counts.index.astype(object)
+
+        # A chunk's exact counts are a summary of their own; reducing them first
+        # keeps the merge small and the combined error within n / (capacity + 1)
+        error = 0
+        if len(chunk_counts) > self.capacity:
+            error = int(chunk_counts.iloc[self.capacity])
+            chunk_counts = chunk_counts.iloc[:self.capacity] - error
+            chunk_counts = chunk_counts[chunk_counts > 0]
+        self._combine(chunk_counts, error)
+
+    def merge(self, other: "FrequentItems") -> None:
+        """Fold in a summary of other values"""
+        self._combine(other.counts, other.max_error)
+
+    def top(self, n: int) -> list[tuple]:
+        """The `n` most frequent (value, count) pairs"""
+        return list(self.counts.nlargest(n).items())
+
+    def _combine(self, counts: pd.Series, error: int) -> None:
+        if len(self.counts):
+            combined = self.counts.add(counts, fill_value=0).astype("int64")
+        else:
+            combined = counts.astype("int64")
+        self.max_error += error
+
+        if len(combined) > self.capacity:
+            # Subtract the (capacity + 1)-th largest count from every counter
+            threshold = int(combined.nlargest(self.capacity + 1).iloc[-1])
+            combined = combined - threshold
+            combined = combined[combined > 0]
+            self.max_error += threshold
+        self.counts = combined
+
+
+class ColumnSketch:
+    """Counts, extremes and sketches of one column, by semantic kind"""
+
+    def __init__(self, kind: str, dtype: str, seed: int | None = None):
+        self.kind = kind
+        self.dtype = dtype
+        self.count = 0
+        self.null_count = 0
+        self.total = 0.0
+        self.distinct = HyperLogLog()
+        self.quantile_sketch = KLLSketch(seed=seed) if kind != "nominal" else None
+        self.frequent = FrequentItems() if kind == "nominal" else None
+        self.sample_values: list = []
+
+    def update(self, series: pd.Series) -> None:
+        non_null = series.dropna()
+        self.null_count += len(series) - len(non_null)
+        self.count += len(non_null)
+        if len(non_null) == 0:
+            return
+
+        if self.kind == "numeric":
+            values = non_null.to_numpy(dtype=np.float64)
+            self.total += float(values.sum())
+            self.quantile_sketch.update(values)
+            self.distinct.update_hashes(pd.util.hash_array(values))
+        elif self.kind == "temporal":
+            values = temporal_values(non_null)
+            self.quantile_sketch.update(values.astype(np.float64))
+            self.distinct.update_hashes(pd.util.hash_array(values))
+        else:
+            self.frequent.update(non_null)
+            self.distinct.update_hashes(hash_values(non_null))
+            if len(self.sample_values) < 3:
+                self.sample_values.extend(non_null.head(3 - len(self.sample_values)).tolist())
+
+    def merge(self, other: "ColumnSketch") -> None:
+        self.count += other.count
+        self.null_count += other.null_count
+        self.total += other.total
+        self.distinct.merge(other.distinct)
+        if self.quantile_sketch is not None:
+            self.quantile_sketch.merge(other.quantile_sketch)
+        if self.frequent is not None:
+            self.frequent.merge(other.frequent)
+            if len(self.sample_values) < 3:
+                self.sample_values.extend(other.sample_values[:3 - len(self.sample_values)])
+
+    def distinct_count(self) -> tuple[int, bool]:
+        """(distinct count, approximate) - exact while the frequent-items summary is"""
+        if self.frequent is not None and self.frequent.exact:
+            return len(self.frequent.counts), False
+        # The estimate can overshoot when nearly every value is distinct
+        return min(self.distinct.estimate(), self.count), True
+
+
+class TableSketch:
+    """One `ColumnSketch` per column, built chunk by chunk"""
+
+    def __init__(self, seed: int | None = None):
+        self.row_count = 0
+        self.columns: dict[str, ColumnSketch] = {}
+        self.seed = seed
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Add a chunk of rows (columns unseen so far are added).
+
+        Raises ValueError when a column changes kind between chunks (numbers
+        that turn into strings), which a sketch cannot absorb.
+        """
+        self.row_count += len(df)
+        for col in df.columns:
+            sketch = self.columns.get(col)
+            if sketch is None:
+                sketch = self.columns[col] = ColumnSketch(column_kind(df[col]), str(df[col].dtype), self.seed)
+                # Rows of earlier chunks lacked this column
+                sketch.null_count = self.row_count - len(df)
+            elif column_kind(df[col]) != sketch.kind and df[col].notna().any():
+                raise ValueError(f"Column {col} changed from {sketch.kind} to {column_kind(df[col])} values")
+            sketch.update(df[col])
+        for col, sketch in self.columns.items():
+            if col not in df.columns:
+                sketch.null_count += len(df)
+
+    def merge(self, other: "TableSketch") -> None:
+        """Fold in a sketch of other rows of the same table"""
+        for col, sketch in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(sketch)
+            else:
+                sketch.null_count += self.row_count
+                self.columns[col] = sketch
+        for col, sketch in self.columns.items():
+            if col not in other.columns:
+                sketch.null_count += other.row_count
+        self.row_count += other.row_count
+
+
+def sketch_frame(df: pd.DataFrame, chunk_rows: int = DEFAULT_SKETCH_CHUNK_ROWS) -> TableSketch:
+    """Sketch an in-memory frame in one pass over row slices of bounded size"""
+    sketch = TableSketch()
+    for start in range(0, max(len(df), 1), chunk_rows):
+        sketch.update(df.iloc[start:start + chunk_rows])
+    return sketch
+
+
+def approximate_quantiles(
+    series: pd.Series,
+    fractions,
+    chunk_rows: int = DEFAULT_SKETCH_CHUNK_ROWS
+) -> tuple[list[float | None], float]:
+    """Quantiles of a numeric column from a KLL sketch, with the sketch's rank error"""
+    sketch = KLLSketch()
+    for start in range(0, len(series), chunk_rows):
+        values = series.iloc[start:start + chunk_rows].dropna().to_numpy(dtype=np.float64)
+        sketch.update(values)
+    return sketch.quantiles(fractions), sketch.rank_error
+
+
+def column_kind(series: pd.Series) -> str:
+    """Sketch kind of a column: "numeric", "temporal" or "nominal" (as in profile_schema)"""
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return "temporal"
+    return "nominal"
+
+
+def temporal_values(series: pd.Series) -> np.ndarray:
+    """Datetimes as int64 nanoseconds since the epoch (UTC for tz-aware columns)"""
+    return series.dt.as_unit("ns").astype("int64").to_numpy()
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    64-bit hashes of nominal values (categoricals hash their categories once).
+
+    Every value is hashed as text with DuckDB's vectorized hash, which is an
+    order of magnitude faster than hashing Python strings one by one. Using
+    one hash for every chunk matters: a value must hash identically whatever
+    the dtype of the chunk (or the worker) that saw it, or sketches merged
+    across chunks count it twice. Non-string values (mixed-type columns,
+    lists) are hashed by their string form.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        category_hashes = hash_values(pd.Series(series.cat.categories))
+        return category_hashes[series.cat.codes.to_numpy()]
+
+    if pd.api.types.infer_dtype(series, skipna=True) != "string":
+        series = series.astype(str)
+
+    conn = duckdb.connect(":memory:")
+    try:
+        conn.register("hash_input", pd.DataFrame({"value": series.to_numpy(dtype=object)}))
+        return conn.execute("SELECT hash(value::VARCHAR) AS h FROM hash_input").fetchnumpy()["h"]
+    finally:
+        conn.close()
@@ -0,0 +1,553 @@
+"""
+Encode and decode the `data_table` handle shared by every task.
+
+Three wire formats are supported:
+
+- rows (original): {"columns", "rows": [{col: value}, ...], "schema"}
+- columnar: {"format": "columnar", "columns", "data": {col: [values]},
+  "dtypes": {col: dtype}, "row_count", "schema"}
+- reference: {"format": "reference", "columns", "path", "file_format",
+  "content_hash", "row_count", "dtypes", "schema"} where `path` points to an
+  Arrow IPC (pyarrow installed) or Parquet file under the session directory.
+  The file is only opened when the table is decoded.
+
+Every encoded table carries a "fingerprint" (content hash). Decoded frames are
+kept in a per-process LRU cache keyed by that fingerprint, so tasks running in
+the same worker decode a given table only once.
+
+Tasks should never rebuild DataFrames from `data_table["rows"]` directly;
+use `decode_table` so that every format keeps working.
+"""
+
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+import duckdb
+import pandas as pd
+
+
+TABLE_FORMATS = ("rows", "columnar", "reference")
+
+# Tables smaller than this (in-memory bytes) stay inline even when a
+# reference is requested, so small flows behave exactly as before.
+INLINE_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+TABLES_SUBDIR = "tables"
+
+# Rows per batch when a table is streamed (iter_table_batches)
+DEFAULT_BATCH_ROWS = 256 * 1024
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Errors raised when a frame cannot be stored as (or read back from) a
+# columnar file: pyarrow's ArrowInvalid / ArrowTypeError /
+# ArrowNotImplementedError subclass the builtins (mixed-type object
+# columns), DuckDB raises its own, and broken files raise OSError
+TABLE_FILE_ERRORS = (OSError, ValueError, TypeError, NotImplementedError, duckdb.Error)
+
+
+class DataFrameCache:
+    """
+    Thread-safe LRU cache of decoded DataFrames with a memory cap.
+
+    Entries are evicted least-recently-used first once the summed in-memory
+    size exceeds `max_bytes`. Frames larger than the cap are never cached.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Return a read-only view of a cached frame, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return read_only_view(entry[0])
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """Cache a frame under `key`, evicting old entries to respect the memory cap"""
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        # Keep a private shallow copy so later changes by the caller never leak in
+        frame = read_only_view(df)
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (frame, size)
+            self._total_bytes += size
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the memory cap, evicting entries if needed"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _evict(self) -> None:
+        while self._entries and self._total_bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+
+
+_table_cache = DataFrameCache()
+
+
+def encode_table(
+    df: pd.DataFrame,
+    schema: dict,
+    table_format: str = "rows",
+    session_dir: str | None = None
+) -> dict:
+    """
+    Convert a DataFrame into a `data_table` handle.
+
+    Args:
+        df: DataFrame to encode
+        schema: Column schema to attach to the table
+        table_format: "rows" (list of records), "columnar" (column name -> values)
+            or "reference" (file under session_dir)
+        session_dir: Session directory used to store referenced tables
+
+    Returns:
+        Table dictionary in the requested wire format
+    """
+    if table_format not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported table format: {table_format}")
+
+    fingerprint = content_hash_of(df)
+
+    # Downstream tasks in this worker can reuse the frame without decoding
+    _table_cache.put(fingerprint, df)
+
+    if table_format == "reference":
+        if not session_dir:
+            raise ValueError("session_dir is required for the reference table format")
+        if int(df.memory_usage(deep=True).sum()) < INLINE_THRESHOLD_BYTES:
+            table_format = "columnar"
+        else:
+            try:
+                return write_table_reference(df, schema, session_dir, fingerprint)
+            except TABLE_FILE_ERRORS:
+                # Columns a columnar file cannot type (mixed-type objects)
+                # are still fine inline
+                table_format = "columnar"
+
+    if table_format == "rows":
+        return {
+            "columns": df.columns.tolist(),
+            "rows": df.to_dict("records"),
+            "schema": schema,
+            "fingerprint": fingerprint
+        }
+
+    return {
+        "format": "columnar",
+        "columns": df.columns.tolist(),
+        "data": {col: encode_column(df[col]) for col in df.columns},
+        "dtypes": {col: str(df[col].dtype) for col in df.columns},
+        "row_count": len(df),
+        "schema": schema,
+        "fingerprint": fingerprint
+    }
+
+
+def decode_table(table: dict) -> pd.DataFrame:
+    """
+    Convert a `data_table` handle of any supported format into a DataFrame.
+
+    Tables with a fingerprint are served from the per-process cache when
+    possible. The returned frame is a read-only view: with pandas
+    Copy-on-Write, modifying it copies the data instead of changing the cached
+    frame that other tasks share.
+    """
+    fingerprint = table_fingerprint(table)
+
+    if fingerprint:
+        cached = _table_cache.get(fingerprint)
+        if cached is not None:
+            return cached
+
+    df = decode_table_uncached(table)
+
+    if fingerprint:
+        _table_cache.put(fingerprint, df)
+        return read_only_view(df)
+
+    return df
+
+
+def decode_table_uncached(table: dict) -> pd.DataFrame:
+    """Decode a table without consulting the cache"""
+    table_format = table_format_of(table)
+
+    if table_format == "rows":
+        return pd.DataFrame(table.get("rows") or [])
+
+    if table_format == "columnar":
+        dtypes = table.get("dtypes", {})
+        data = table.get("data", {})
+        columns = table.get("columns") or list(data.keys())
+        return pd.DataFrame(
+            {col: decode_column(data[col], dtypes.get(col)) for col in columns},
+            columns=columns
+        )
+
+    if table_format == "reference":
+        return read_table_reference(table)
+
+    raise ValueError(f"Unsupported table format: {table_format}")
+
+
+def write_table_reference(
+    df: pd.DataFrame,
+    schema: dict,
+    session_dir: str,
+    content_hash: str | None = None
+) -> dict:
+    """
+    Write a DataFrame to a columnar file under `session_dir` and return a reference table.
+
+    Files are named by content hash, so writing identical data twice is a no-op.
+    Frames the file format cannot hold raise one of TABLE_FILE_ERRORS and
+    leave no file behind.
+    """
+    content_hash = content_hash or content_hash_of(df)
+    file_format = "arrow" if has_pyarrow() else "parquet"
+
+    tables_dir = os.path.join(session_dir, TABLES_SUBDIR)
+    os.makedirs(tables_dir, exist_ok=True)
+    path = os.path.join(tables_dir, f"{content_hash[:32]}.{file_format}")
+
+    if not os.path.exists(path):
+        # Write to a temporary file first so readers never see a partial file
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            if file_format == "arrow":
+                write_arrow_file(df, tmp_path)
+            else:
+                # DuckDB would silently store mixed columns as text; pyarrow
+                # raises for them instead
+                mixed = mixed_object_columns(df)
+                if mixed:
+                    raise ValueError(f"Columns mix value types: {', '.join(map(str, mixed))}")
+                write_parquet_file(df, tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+
+    return build_reference_table(
+        path,
+        file_format,
+        content_hash,
+        df.columns.tolist(),
+        len(df),
+        {col: str(df[col].dtype) for col in df.columns},
+        schema
+    )
+
+
+def build_reference_table(
+    path: str,
+    file_format: str,
+    content_hash: str,
+    columns: list,
+    row_count: int,
+    dtypes: dict,
+    schema: dict
+) -> dict:
+    """Build a reference table handle for a file that has already been written"""
+    return {
+        "format": "reference",
+        "columns": columns,
+        "path": path,
+        "file_format": file_format,
+        "content_hash": content_hash,
+        "row_count": row_count,
+        "dtypes": dtypes,
+        "schema": schema,
+        "fingerprint": content_hash
+    }
+
+
+def read_table_reference(table: dict) -> pd.DataFrame:
+    """Open a referenced table file (memory-mapped for Arrow IPC)"""
+    path = table["path"]
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Referenced table file not found: {path}")
+
+    if table.get("file_format") == "arrow":
+        import pyarrow as pa
+
+        with pa.memory_map(path, "r") as source:
+            df = pa.ipc.open_file(source).read_all().to_pandas()
+    else:
+        conn = duckdb.connect(":memory:")
+        try:
+            df = conn.execute("SELECT * FROM read_parquet(?)", [path]).df()
+        finally:
+            conn.close()
+
+    return restore_dtypes(df, table.get("dtypes", {}))
+
+
+def read_reference_head(table: dict, n: int) -> pd.DataFrame:
+    """Read only the first `n` rows of a referenced table file"""
+    path = table["path"]
+
+    if table.get("file_format") == "arrow":
+        import pyarrow as pa
+
+        with pa.memory_map(path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            batches = []
+            remaining = n
+            for i in range(reader.num_record_batches):
+                if remaining <= 0:
+                    break
+                batch = reader.get_batch(i).slice(0, remaining)
+                batches.append(batch)
+                remaining -= batch.num_rows
+            if not batches:
+                return pd.DataFrame(columns=table_columns(table))
+            df = pa.Table.from_batches(batches).to_pandas()
+    else:
+        conn = duckdb.connect(":memory:")
+        try:
+            df = conn.execute("SELECT * FROM read_parquet(?) LIMIT ?", [path, n]).df()
+        finally:
+            conn.close()
+
+    return restore_dtypes(df, table.get("dtypes", {}))
+
+
+def iter_table_batches(table: dict, batch_rows: int = DEFAULT_BATCH_ROWS):
+    """
+    Yield a table as DataFrames of at most `batch_rows` rows.
+
+    Reference tables are read from disk one batch at a time (memory-mapped
+    Arrow slices, or DuckDB chunks of a Parquet file), so memory stays
+    bounded however large the file is. Inline tables are already in memory
+    and are sliced.
+    """
+    if table_format_of(table) != "reference":
+        df = decode_table(table)
+        for start in range(0, len(df), batch_rows):
+            yield df.iloc[start:start + batch_rows]
+        return
+
+    path = table["path"]
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Referenced table file not found: {path}")
+    dtypes = table.get("dtypes", {})
+
+    if table.get("file_format") == "arrow":
+        import pyarrow as pa
+
+        with pa.memory_map(path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                for start in range(0, batch.num_rows, batch_rows):
+                    yield restore_dtypes(batch.slice(start, batch_rows).to_pandas(), dtypes)
+        return
+
+    conn = duckdb.connect(":memory:")
+    try:
+        result = conn.execute("SELECT * FROM read_parquet(?)", [path])
+        # DuckDB hands out chunks in vectors of 2048 rows
+        vectors = max(1, batch_rows // 2048)
+        while True:
+            chunk = result.fetch_df_chunk(vectors)
+            if chunk.empty:
+                break
+            yield restore_dtypes(chunk, dtypes)
+    finally:
+        conn.close()
+
+
+def write_arrow_file(df: pd.DataFrame, path: str) -> None:
+    """Write a DataFrame as an uncompressed Arrow IPC file (memory-mappable)"""
+    import pyarrow as pa
+
+    arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+
+
+def write_parquet_file(df: pd.DataFrame, path: str) -> None:
+    """Write a DataFrame as a Parquet file using DuckDB"""
+    conn = duckdb.connect(":memory:")
+    try:
+        conn.register("table_data", df)
+        conn.execute(f"COPY table_data TO '{escape_sql_string(path)}' (FORMAT PARQUET)")
+    finally:
+        conn.close()
+
+
+def mixed_object_columns(df: pd.DataFrame) -> list:
+    """Object columns whose values are not all of one kind (ints and strings, lists, ...)"""
+    return [
+        col for col in df.columns
+        if df[col].dtype == object
+        and pd.api.types.infer_dtype(df[col], skipna=True) in ("mixed", "mixed-integer")
+    ]
+
+
+def restore_dtypes(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """Cast columns back to their recorded dtypes where the file format lost them"""
+    for col, dtype in dtypes.items():
+        if col not in df.columns or str(df[col].dtype) == dtype:
+            continue
+        try:
+            df[col] = df[col].astype(dtype)
+        except (TypeError, ValueError):
+            pass
+    return df
+
+
+def content_hash_of(df: pd.DataFrame) -> str:
+    """Compute a content hash of a DataFrame (values, column names and dtypes)"""
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(repr([(str(col), str(df[col].dtype)) for col in df.columns]).encode())
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # Unhashable cell values (lists, dicts) are hashed by their string form
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+    digest.update(row_hashes.values.tobytes())
+    return digest.hexdigest()
+
+
+def table_fingerprint(table: dict) -> str | None:
+    """Return the cache key of a table (None for legacy tables without one)"""
+    return table.get("fingerprint") or table.get("content_hash")
+
+
+def read_only_view(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a shallow view of `df` that shares its buffers.
+
+    pandas Copy-on-Write guarantees that writes to the view copy the affected
+    columns first, so the original frame can never be modified through it.
+    """
+    return df.copy(deep=False)
+
+
+def configure_table_cache(max_bytes: int) -> None:
+    """Set the memory cap of the per-process DataFrame cache"""
+    _table_cache.resize(max_bytes)
+
+
+def clear_table_cache() -> None:
+    """Drop every cached DataFrame"""
+    _table_cache.clear()
+
+
+def has_pyarrow() -> bool:
+    """Check whether pyarrow is installed"""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def escape_sql_string(value: str) -> str:
+    """Escape a value for use inside a single-quoted SQL string"""
+    return value.replace("'", "''")
+
+
+def table_format_of(table: dict) -> str:
+    """Return the wire format of a table (tables without a marker are row-based)"""
+    return table.get("format", "rows")
+
+
+def table_columns(table: dict) -> list:
+    """Return column names without decoding the table"""
+    if table.get("columns"):
+        return list(table["columns"])
+    if table_format_of(table) == "columnar":
+        return list(table.get("data", {}).keys())
+    rows = table.get("rows") or []
+    return list(rows[0].keys()) if rows else []
+
+
+def table_row_count(table: dict) -> int:
+    """Return the number of rows without decoding the table"""
+    if not table:
+        return 0
+    if table_format_of(table) == "rows":
+        return len(table.get("rows") or [])
+    return int(table.get("row_count", 0))
+
+
+def table_head_records(table: dict, n: int) -> list[dict]:
+    """Return the first `n` rows as records without decoding the whole table"""
+    if table_format_of(table) == "rows":
+        return list((table.get("rows") or [])[:n])
+
+    if table_format_of(table) == "reference":
+        head_df = read_reference_head(table, n)
+        data = {col: encode_column(head_df[col]) for col in head_df.columns}
+    else:
+        data = table.get("data", {})
+
+    columns = table_columns(table)
+    count = min(n, table_row_count(table))
+    return [{col: data[col][i] for col in columns} for i in range(count)]
+
+
+def encode_column(series: pd.Series) -> list:
+    """Convert a column into a JSON-friendly list, mapping missing values to None"""
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series.map(lambda v: v.isoformat(), na_action="ignore")
+        return values.astype(object).where(series.notna(), None).tolist()
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+
+    if series.hasnans:
+        return series.astype(object).where(series.notna(), None).tolist()
+
+    return series.tolist()
+
+
+def decode_column(values: list, dtype: str | None) -> pd.Series:
+    """Rebuild a column from its encoded values, restoring the recorded dtype"""
+    if not dtype:
+        return pd.Series(values)
+
+    try:
+        if dtype.startswith("datetime64"):
+            series = pd.Series(pd.to_datetime(values, format="ISO8601"))
+            return series.astype(dtype)
+        return pd.Series(values, dtype=dtype)
+    except (TypeError, ValueError):
+        # Integer columns with missing values or unknown dtypes fall back to inference
+        return pd.Series(values)
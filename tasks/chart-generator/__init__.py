@@ -19,6 +19,11 @@ import pandas as pd
 import altair as alt
 import vl_convert as vlc
 import base64
+from data_insight import decode_table, table_row_count
+from data_insight.sampling import row_weights, sampling_note, table_sampling
+
+# Marks that stack the y values of rows sharing an x value
+STACKED_CHART_TYPES = ("bar", "area", "pie")
 
 async def main(params: Inputs, context: Context) -> Outputs:
     """
@@ -29,6 +34,10 @@ async def main(params: Inputs, context: Context) -> Outputs:
     2. From Chart Recommender output (from_recommendations + selection_index)
 
     Outputs both Vega-Lite spec and rendered PNG image.
+
+    Charts of tables sampled by data-loader carry an "approximate" subtitle.
+    Bar, area and pie charts that stack several rows per x value scale y by
+    the sampling weights, so the stacks estimate full-table totals.
     """
     data_table = params["data_table"]
 
@@ -64,7 +73,7 @@ async def main(params: Inputs, context: Context) -> Outputs:
         context.report_progress(10)
 
     # Validate inputs
-    if not data_table or not data_table.get("rows"):
+    if not data_table or table_row_count(data_table) == 0:
         raise ValueError("Data table is empty or invalid")
     if not chart_type:
         raise ValueError("chart_type is required")
@@ -72,7 +81,7 @@ async def main(params: Inputs, context: Context) -> Outputs:
         raise ValueError("x_field and y_field are required")
 
     # Convert to DataFrame
-    df = pd.DataFrame(data_table["rows"])
+    df = decode_table(data_table)
 
     # Validate field names
     if x_field not in df.columns:
@@ -87,6 +96,15 @@ async def main(params: Inputs, context: Context) -> Outputs:
     # Report progress
     context.report_progress(20)
 
+    sampling = table_sampling(data_table)
+    y_title = None
+    if (
+        sampling and chart_type in STACKED_CHART_TYPES
+        and pd.api.types.is_numeric_dtype(df[y_field]) and df[x_field].duplicated().any()
+    ):
+        df = df.assign(**{y_field: df[y_field] * row_weights(df, sampling)})
+        y_title = f"{y_field} (estimated total)"
+
     # Detect field types
     field_types = detect_field_types(df)
 
@@ -100,7 +118,9 @@ async def main(params: Inputs, context: Context) -> Outputs:
         y_field=y_field,
         color_field=color_field,
         size_field=size_field,
-        field_types=field_types
+        field_types=field_types,
+        subtitle=sampling_note(sampling) or None,
+        y_title=y_title
     )
 
     # Convert to Vega-Lite spec
@@ -165,16 +185,22 @@ def build_chart(
     y_field: str,
     color_field: str | None,
     size_field: str | None,
-    field_types: dict
+    field_types: dict,
+    subtitle: str | None = None,
+    y_title: str | None = None
 ) -> alt.Chart:
     """
     Build Altair chart based on parameters.
     """
+    title = f"{chart_type.capitalize()} Chart"
+    if subtitle:
+        title = alt.TitleParams(title, subtitle=subtitle)
+
     # Base chart
     base = alt.Chart(df).properties(
         width=600,
         height=400,
-        title=f"{chart_type.capitalize()} Chart"
+        title=title
     )
 
     # Build encoding
@@ -186,7 +212,7 @@ def build_chart(
     y_encoding = alt.Y(
         y_field,
         type=field_types.get(y_field, "quantitative"),
-        title=y_field
+        title=y_title or y_field
     )
 
     # Color encoding
@@ -20,6 +20,7 @@ from openai import OpenAI
 import json
 import re
 import pandas as pd
+from data_insight import decode_table
 
 
 CHART_RECOMMENDATION_SYSTEM_PROMPT = """You are an expert data visualization consultant. Recommend the most effective chart types for the given data.
@@ -185,7 +186,7 @@ async def main(params: Inputs, context: Context) -> Outputs:
     llm = params["llm"]
 
     # Build DataFrame
-    df = pd.DataFrame(data_table["rows"])
+    df = decode_table(data_table)
     schema = data_table.get("schema", {})
 
     context.report_progress(20)
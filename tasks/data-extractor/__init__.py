@@ -15,6 +15,7 @@ from openai import OpenAI
 import json
 import re
 import pandas as pd
+from data_insight import profile_schema
 
 
 # Prompt templates for different source types
@@ -115,46 +116,6 @@ def extract_json_from_response(text: str) -> dict:
         raise ValueError(f"Failed to parse JSON from LLM response: {e}\n\nResponse text: {text}")
 
 
-def infer_schema(df: pd.DataFrame) -> dict:
-    """Infer schema information from DataFrame"""
-    schema = {}
-
-    for col in df.columns:
-        dtype = df[col].dtype
-        col_info = {"name": col}
-
-        if pd.api.types.is_numeric_dtype(dtype):
-            unique_count = df[col].nunique()
-            if unique_count < 20 and unique_count < len(df) * 0.5:
-                col_info["type"] = "ordinal"
-            else:
-                col_info["type"] = "quantitative"
-
-            col_info["stats"] = {
-                "min": float(df[col].min()),
-                "max": float(df[col].max()),
-                "mean": float(df[col].mean()),
-            }
-
-        elif pd.api.types.is_datetime64_any_dtype(dtype):
-            col_info["type"] = "temporal"
-            col_info["stats"] = {
-                "min": str(df[col].min()),
-                "max": str(df[col].max()),
-            }
-
-        else:
-            col_info["type"] = "nominal"
-            unique_vals = df[col].unique()
-            if len(unique_vals) <= 10:
-                col_info["unique_values"] = unique_vals.tolist()
-            col_info["unique_count"] = len(unique_vals)
-
-        schema[col] = col_info
-
-    return schema
-
-
 async def main(params: Inputs, context: Context) -> Outputs:
     """Extract structured table data from images, text, or HTML using LLM"""
 
@@ -242,7 +203,7 @@ async def main(params: Inputs, context: Context) -> Outputs:
 
     # Build DataFrame for schema inference
     df = pd.DataFrame(result["rows"])
-    schema = infer_schema(df)
+    schema = profile_schema(df)
 
     context.report_progress(80)
 
@@ -1,17 +1,90 @@
 #region generated meta
 import typing
 class Inputs(typing.TypedDict):
-    source_type: typing.Literal["csv", "excel", "json", "mysql", "postgresql", "sqlite"]
+    source_type: typing.Literal["csv", "excel", "json", "jsonl", "parquet", "feather", "arrow_ipc", "mysql", "postgresql", "sqlite"]
     file_path: str | None
+    columns: list[str] | None
+    filter: str | None
     database_config: str | None
+    table_format: typing.Literal["rows", "columnar", "reference"]
+    load_options: dict | None
 class Outputs(typing.TypedDict):
     data_table: typing.NotRequired[dict]
     preview_html: typing.NotRequired[str]
+    sheet_tables: typing.NotRequired[dict | None]
+    member_tables: typing.NotRequired[dict | None]
+    dtype_report: typing.NotRequired[dict | None]
 #endregion
 
 from oocana import Context
+import asyncio
+import html
+import os
 import pandas as pd
 import json
+from data_insight import encode_table, profile_schema, table_row_count
+from data_insight.chunked_ingest import ingest_chunks
+from data_insight.compressed_input import (
+    COMPRESSED_SOURCE_TYPES,
+    detect_compression,
+    read_zip_members,
+)
+from data_insight.csv_ingest import ingest_csv_chunked, read_csv_fast
+from data_insight.db_engines import build_connection_url, configure_engine_registry, get_engine
+from data_insight.db_ingest import read_partitioned, stream_query
+from data_insight.dtype_optimizer import DEFAULT_CATEGORY_RATIO, downcast_numeric_columns, optimize_dtypes
+from data_insight.duckdb_scan import iter_scan_file, scan_file
+from data_insight.excel_ingest import read_excel_sheets, resolve_sheet_names
+from data_insight.file_peek import DEFAULT_PEEK_ROWS, peek_file
+from data_insight.file_readers import (
+    iter_arrow_ipc_file,
+    iter_jsonl_file,
+    iter_parquet_file,
+    read_arrow_ipc_file,
+    read_jsonl_file,
+    read_parquet_file,
+)
+from data_insight.incremental_load import (
+    IncrementalSnapshot,
+    read_new_database_rows,
+    read_new_file_rows,
+)
+from data_insight.load_cache import (
+    DEFAULT_LOAD_CACHE_MAX_BYTES,
+    cache_key as hash_identity,
+    database_cache_key,
+    file_cache_key,
+    file_set_cache_key,
+    get_load_cache,
+)
+from data_insight.multi_file import (
+    MULTI_FILE_SOURCE_TYPES,
+    dataset_root,
+    expand_file_paths,
+    is_multi_file_path,
+    iter_file_set,
+    read_file_set,
+)
+from data_insight.sampling import (
+    SAMPLING_METHODS,
+    sample_frame,
+    sample_reference_table,
+    sampling_note,
+    target_sample_size,
+)
+
+
+FILE_SOURCE_TYPES = ["csv", "excel", "json", "jsonl", "parquet", "feather", "arrow_ipc"]
+DATABASE_SOURCE_TYPES = ["mysql", "postgresql", "sqlite"]
+
+# load_options that only control caching and never change the loaded table
+CACHE_OPTION_KEYS = {"cache", "bypass_cache", "cache_dir", "cache_max_bytes", "cache_content_hash"}
+
+# Files at least this large get a first-look preview before the full parse
+PROGRESSIVE_PREVIEW_MIN_BYTES = 8 * 1024 * 1024
+
+# load_options that sample the loaded table (cached snapshots hold the full table)
+SAMPLE_OPTION_KEYS = {"sample_method", "sample_size", "sample_fraction", "stratify_by", "sample_seed"}
 
 
 async def main(params: Inputs, context: Context) -> Outputs:
@@ -19,44 +92,119 @@ async def main(params: Inputs, context: Context) -> Outputs:
     Load tabular data from various sources.
 
     Supports:
-    - File formats: CSV, Excel, JSON
+    - File formats: CSV, Excel, JSON, JSON Lines, Parquet, Feather/Arrow IPC
     - Databases: MySQL, PostgreSQL, SQLite
 
     Converts data to a standard table format with schema inference.
+
+    CSV files can be parsed with explicit or inferred dtypes. CSV, JSON Lines,
+    Parquet and Feather/Arrow IPC files can be streamed in chunks into a
+    Parquet snapshot (see `load_options`), and database results can be streamed
+    the same way through a server-side cursor; chunked loads always return a
+    reference table.
+
+    A `filter` expression (or `load_options.duckdb_scan`) loads files through
+    DuckDB instead, pushing the column projection and row filter into the
+    scan so only matching data is materialized.
+
+    In-memory loads are cached as columnar snapshots keyed by the file
+    fingerprint (or connection and query), so unchanged sources skip parsing
+    and profiling on later runs (see `load_options.cache`).
+
+    Excel workbooks load the sheets named in `load_options.sheets`, parsed
+    in parallel and cached per sheet. The first sheet becomes `data_table`;
+    with several sheets every sheet is also returned in `sheet_tables`.
+
+    Compressed CSV/JSON/JSON Lines files (gzip, bz2, xz, zstd) are
+    decompressed while parsing. Zip archives load every CSV/JSON member,
+    concatenated into one table or, with `load_options.zip_members` set to
+    "separate", returned one per member in `member_tables`.
+
+    A glob pattern or directory as `file_path` loads every matching shard,
+    parsed in parallel worker processes and combined into one table (columns
+    unioned, dtypes reconciled, Hive `key=value` folders added as columns).
+
+    With `load_options.incremental` only rows past the stored watermark (a
+    byte offset / row count for files, a monotonic column for databases) are
+    read and appended to a persistent snapshot of the source.
+
+    With `load_options.sample_size` or `sample_fraction` the loaded table is
+    replaced by a uniform (reservoir), stratified or first-N sample, and the
+    table's "sampling" metadata tells downstream tasks that their results
+    are approximate. Chunked loads are sampled out-of-core from their snapshot.
+
+    Large files are previewed progressively: the first rows and a schema
+    estimated from them are published within moments, then the full load
+    runs in a worker thread and its preview (with the final schema) replaces
+    the first look. `load_options.progressive_preview` turns this off.
+
+    `load_options.optimize_dtypes` shrinks in-memory tables after loading
+    (masked nullable columns, lossless numeric downcasts, categorical
+    strings), stopping once `memory_budget` is met; the bytes saved are
+    reported in `dtype_report` (cache hits were stored optimized and report
+    nothing).
     """
     source_type = params["source_type"]
     file_path = params.get("file_path")
+    columns = params.get("columns") or None
+    filter_expr = (params.get("filter") or "").strip() or None
     database_config = params.get("database_config")
+    table_format = params.get("table_format") or "rows"
+    load_options = params.get("load_options") or {}
 
     context.report_progress(0)
 
-    # Load data based on source type
-    try:
-        if source_type in ["csv", "excel", "json"]:
-            # File-based sources
-            if not file_path:
-                raise ValueError(f"File path is required for {source_type} source")
+    # Set when a loader already produced the final table (chunked loads)
+    data_table = None
+
+    # Known up front for cache hits, Excel sheets and zip members (profiled one by one)
+    schema = None
 
-            context.report_progress(20)
+    # Several tables from one source (Excel sheets, zip members), keyed by name
+    parts, parts_output = None, None
 
-            if source_type == "csv":
-                df = pd.read_csv(file_path)
-            elif source_type == "excel":
-                df = pd.read_excel(file_path)
-            elif source_type == "json":
-                df = pd.read_json(file_path)
+    # Rows appended by an incremental load
+    new_row_count = None
 
-        elif source_type in ["mysql", "postgresql", "sqlite"]:
-            # Database sources
-            if not database_config:
-                raise ValueError(f"Database configuration is required for {source_type} source")
+    # Snapshot cache (unchanged sources skip parsing and profiling)
+    load_cache, cache_key, cached = None, None, None
 
-            context.report_progress(20)
+    # Sampling metadata of a sampled load
+    sampling = None
 
-            df = await load_from_database(source_type, database_config)
+    # Bytes saved by the dtype optimization pass
+    dtype_report = None
 
+    # Load data based on source type
+    try:
+        compression = None
+        if source_type in COMPRESSED_SOURCE_TYPES and file_path and os.path.isfile(file_path):
+            compression = detect_compression(file_path)
+        separate_members = compression == "zip" and load_options.get("zip_members") == "separate"
+
+        if use_progressive_preview(source_type, file_path, filter_expr, load_options):
+            publish_first_look(source_type, file_path, columns, compression, load_options, context)
+
+        if use_load_cache(source_type, load_options):
+            load_cache = open_load_cache(load_options, context)
+            # Excel sheets are cached one by one; separate zip members are not cached
+            if source_type != "excel" and not separate_members:
+                cache_key = load_cache_key(
+                    source_type, file_path, database_config, columns, filter_expr, load_options
+                )
+            if cache_key and not load_options.get("bypass_cache"):
+                cached = load_cache.get(cache_key)
+
+        if cached is not None:
+            df, schema = cached
         else:
-            raise ValueError(f"Unsupported source type: {source_type}")
+            # Parsing is CPU-bound; a worker thread keeps the event loop free to
+            # deliver the first-look preview and progress while it runs
+            df, data_table, schema, parts, parts_output, new_row_count = await asyncio.to_thread(
+                load_source,
+                source_type, file_path, columns, filter_expr, database_config,
+                load_options, context, compression, separate_members, load_cache
+            )
 
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
@@ -65,12 +213,55 @@ async def main(params: Inputs, context: Context) -> Outputs:
 
     context.report_progress(60)
 
-    # Validate loaded data
-    if df.empty:
-        raise ValueError("Loaded data is empty")
+    sample_options = sampling_options(load_options)
+    if sample_options:
+        if data_table is not None:
+            population = table_row_count(data_table)
+            if target_sample_size(population, sample_options["size"], sample_options["fraction"]) < population:
+                df, sampling = sample_reference_table(data_table, **sample_options)
+                data_table, schema = None, None
+        elif parts:
+            parts = {
+                name: sample_part(part_df, part_schema, sample_options)
+                for name, (part_df, part_schema) in parts.items()
+            }
+            df, schema, sampling = next(iter(parts.values()))
+        else:
+            df, sampling = sample_frame(df, **sample_options)
+            if sampling:
+                schema = None
+
+    # Cache hits were optimized before they were stored
+    if load_options.get("optimize_dtypes") and data_table is None and cached is None:
+        optimize_options = {
+            "memory_budget": int(load_options["memory_budget"]) if load_options.get("memory_budget") else None,
+            "category_ratio": float(load_options.get("category_ratio") or DEFAULT_CATEGORY_RATIO),
+        }
+        if parts:
+            reports = {}
+            for name, part in parts.items():
+                parts[name], reports[name] = optimize_part(part, optimize_options)
+            df, schema = next(iter(parts.values()))[:2]
+            dtype_report = next(iter(reports.values()))
+        else:
+            df, dtype_report = optimize_dtypes(df, **optimize_options)
+            if dtype_report["columns"]:
+                schema = None
+
+    if data_table is None:
+        # Validate loaded data
+        if df.empty:
+            raise ValueError("Loaded data is empty")
+
+        if schema is None:
+            # Infer schema
+            schema = profile_schema(df)
+
+            # A sample is not worth caching; the full table of a cache hit already is
+            if cache_key and sampling is None:
+                load_cache.put(cache_key, df, schema)
 
-    # Infer schema
-    schema = infer_schema(df)
+    row_count = table_row_count(data_table) if data_table else len(df)
 
     context.report_progress(80)
 
@@ -78,17 +269,218 @@ async def main(params: Inputs, context: Context) -> Outputs:
     preview_html = df.head(10).to_html(index=False, classes="data-table")
 
     # Determine source display text
-    if source_type in ["csv", "excel", "json"]:
+    if source_type in FILE_SOURCE_TYPES:
         source_display = f"{source_type.upper()} file: {file_path}"
+        if parts_output == "sheet_tables":
+            source_display += f" (sheets: {', '.join(parts)})"
+        elif parts_output == "member_tables":
+            source_display += f" (members: {', '.join(parts)})"
     else:
         db_config = database_config or {}
         db_name = db_config.get("database", "unknown")
         source_display = f"{source_type.upper()} database: {db_name}"
+    if new_row_count is not None:
+        source_display += f" (incremental: {new_row_count} new rows)"
+    sampling_display = f"<br><strong>Sampling:</strong> {sampling_note(sampling)}" if sampling else ""
+    if dtype_report:
+        sampling_display += (
+            f"<br><strong>Memory:</strong> {format_bytes(dtype_report['bytes_before'])} → "
+            f"{format_bytes(dtype_report['bytes_after'])} "
+            f"({format_bytes(dtype_report['bytes_saved'])} saved)"
+        )
+
+    # Preview the data (replaces the first-look preview of progressive loads)
+    context.preview({
+        "type": "html",
+        "data": render_preview(
+            source_display,
+            f"{row_count} rows × {len(df.columns)} columns{sampling_display}",
+            preview_html,
+            schema_table_html(schema or data_table["schema"]),
+            "Schema"
+        )
+    })
+
+    context.report_progress(100)
+
+    # Convert to standard format
+    if data_table is None:
+        data_table = encode_table(df, schema, table_format, context.session_dir)
+    if sampling:
+        data_table["sampling"] = sampling
+
+    outputs = {
+        "data_table": data_table,
+        "preview_html": preview_html,
+        "sheet_tables": None,
+        "member_tables": None,
+        "dtype_report": dtype_report
+    }
+
+    # Every selected sheet / zip member as its own table
+    if parts and len(parts) > 1:
+        outputs[parts_output] = {}
+        for name, (part_df, part_schema, *part_sampling) in parts.items():
+            part_table = encode_table(part_df, part_schema, table_format, context.session_dir)
+            if part_sampling and part_sampling[0]:
+                part_table["sampling"] = part_sampling[0]
+            outputs[parts_output][name] = part_table
+
+    return outputs
+
+
+def load_source(
+    source_type: str,
+    file_path: str | None,
+    columns: list | None,
+    filter_expr: str | None,
+    database_config: dict | None,
+    load_options: dict,
+    context: Context,
+    compression: str | None,
+    separate_members: bool,
+    load_cache
+) -> tuple:
+    """
+    Load a source that was not served from the snapshot cache.
+
+    Returns:
+        (DataFrame, data_table, schema, parts, parts_output, new_row_count) -
+        data_table is set when a loader already produced the final table,
+        schema when it profiled the data itself, parts for several tables
+        from one source (Excel sheets, zip members) and new_row_count for
+        incremental loads
+    """
+    data_table, schema, parts, parts_output, new_row_count = None, None, None, None, None
+
+    if load_options.get("incremental"):
+        context.report_progress(20)
+
+        df, new_row_count = load_incremental(
+            source_type, file_path, database_config, columns, load_options, context
+        )
+
+    elif source_type == "excel" and not (filter_expr or load_options.get("duckdb_scan")):
+        if not file_path:
+            raise ValueError(f"File path is required for {source_type} source")
+
+        context.report_progress(20)
+
+        parts = load_excel_sheets(file_path, columns, load_options, load_cache)
+        parts_output = "sheet_tables"
+        df, schema = next(iter(parts.values()))
+
+    elif compression == "zip" and not (filter_expr or load_options.get("duckdb_scan")):
+        context.report_progress(20)
+
+        members = load_zip_members(file_path, source_type, columns, load_options)
+        if separate_members:
+            parts = {name: (frame, profile_schema(frame)) for name, frame in members.items()}
+            parts_output = "member_tables"
+            df, schema = next(iter(parts.values()))
+        else:
+            df = pd.concat(members.values(), ignore_index=True)
+
+    elif (
+        source_type in MULTI_FILE_SOURCE_TYPES
+        and file_path and is_multi_file_path(file_path)
+    ):
+        context.report_progress(20)
+
+        df, data_table = load_from_file_set(
+            source_type, file_path, columns, filter_expr, load_options, context
+        )
+
+    elif source_type in FILE_SOURCE_TYPES:
+        # File-based sources
+        if not file_path:
+            raise ValueError(f"File path is required for {source_type} source")
+
+        context.report_progress(20)
+
+        df, data_table = load_from_file(
+            source_type, file_path, columns, filter_expr, load_options, context, compression
+        )
+
+    elif source_type in DATABASE_SOURCE_TYPES:
+        # Database sources
+        if not database_config:
+            raise ValueError(f"Database configuration is required for {source_type} source")
+
+        context.report_progress(20)
+
+        df, data_table = load_from_database(
+            source_type, database_config, load_options, context
+        )
+
+    else:
+        raise ValueError(f"Unsupported source type: {source_type}")
+
+    return df, data_table, schema, parts, parts_output, new_row_count
+
+
+def use_progressive_preview(
+    source_type: str,
+    file_path: str | None,
+    filter_expr: str | None,
+    load_options: dict
+) -> bool:
+    """
+    Check whether a load publishes a first-look preview before the full parse.
+
+    Only large files and multi-file datasets qualify; small files load
+    faster than a second preview would help. Filtered loads are skipped,
+    since the first rows of the file need not match the filter.
+    """
+    if not load_options.get("progressive_preview", True) or filter_expr:
+        return False
+    if source_type not in FILE_SOURCE_TYPES or not file_path:
+        return False
+    if source_type in MULTI_FILE_SOURCE_TYPES and is_multi_file_path(file_path):
+        return True
+    return os.path.isfile(file_path) and os.path.getsize(file_path) >= PROGRESSIVE_PREVIEW_MIN_BYTES
+
+
+def publish_first_look(
+    source_type: str,
+    file_path: str,
+    columns: list | None,
+    compression: str | None,
+    load_options: dict,
+    context: Context
+) -> None:
+    """Preview the first rows of a file and the schema estimated from them"""
+    sheets = load_options.get("sheets") or []
+    sheet = sheets[0] if sheets and sheets[0] != "*" else 0
+    try:
+        head = peek_file(file_path, source_type, DEFAULT_PEEK_ROWS, columns, compression, sheet)
+    except Exception:
+        # The full load reports real problems with the file
+        return
+    if head is None or head.empty:
+        return
 
-    # Preview the data
     context.preview({
         "type": "html",
-        "data": f"""
+        "data": render_preview(
+            f"{source_type.upper()} file: {file_path}",
+            f"first {len(head)} rows × {len(head.columns)} columns (loading the full data...)",
+            head.head(10).to_html(index=False, classes="data-table"),
+            schema_table_html(profile_schema(head)),
+            f"Estimated schema (first {len(head)} rows)"
+        )
+    })
+
+
+def render_preview(
+    source_display: str,
+    data_display: str,
+    preview_html: str,
+    schema_html: str,
+    schema_title: str
+) -> str:
+    """Build the preview HTML shared by the first-look and the final preview"""
+    return f"""
         <style>
             .data-table {{
                 border-collapse: collapse;
@@ -120,115 +512,445 @@ async def main(params: Inputs, context: Context) -> Outputs:
         </style>
         <div class="info-box">
             <strong>Source:</strong> {source_display}<br>
-            <strong>Data:</strong> {len(df)} rows × {len(df.columns)} columns
+            <strong>Data:</strong> {data_display}
         </div>
         <h3>Data Preview (First 10 rows)</h3>
         {preview_html}
+        <details>
+            <summary>{schema_title}</summary>
+            {schema_html}
+        </details>
         """
-    })
 
-    context.report_progress(100)
 
-    # Convert to standard format
-    data_table = {
-        "columns": df.columns.tolist(),
-        "rows": df.to_dict("records"),
-        "schema": schema
+def schema_table_html(schema: dict) -> str:
+    """Render column names, dtypes and semantic types as an HTML table"""
+    rows = "".join(
+        f"<tr><td>{html.escape(str(col))}</td><td>{info['dtype']}</td>"
+        f"<td>{info['semantic_type']}</td><td>{info['null_count']}</td></tr>"
+        for col, info in schema.items()
+    )
+    return (
+        '<table class="data-table"><tr><th>Column</th><th>Dtype</th>'
+        f"<th>Type</th><th>Nulls</th></tr>{rows}</table>"
+    )
+
+
+def load_from_file(
+    source_type: str,
+    file_path: str,
+    columns: list | None,
+    filter_expr: str | None,
+    load_options: dict,
+    context: Context,
+    compression: str | None = None
+) -> tuple[pd.DataFrame, dict | None]:
+    """
+    Load a file source (`compression` is the detected compression of text files).
+
+    Returns:
+        (DataFrame, None) for in-memory loads, or (first chunk, reference table)
+        when `load_options.chunk_size` streams the file into a snapshot
+    """
+    chunk_size = int(load_options.get("chunk_size") or 0)
+    row_groups = load_options.get("row_groups") or None
+
+    if filter_expr or load_options.get("duckdb_scan"):
+        if chunk_size:
+            chunks = iter_scan_file(
+                file_path, source_type, chunk_size, columns, filter_expr, compression
+            )
+            return ingest_chunks(chunks, context.session_dir)
+        df = scan_file(file_path, source_type, columns, filter_expr, compression)
+        if load_options.get("downcast"):
+            df = downcast_numeric_columns(df)
+        return df, None
+
+    if source_type == "csv":
+        if chunk_size:
+            return ingest_csv_chunked(
+                file_path,
+                context.session_dir,
+                chunk_size,
+                columns=columns,
+                on_progress=lambda fraction: context.report_progress(20 + fraction * 40),
+                compression=compression,
+                **csv_dtype_options(load_options)
+            )
+        df = read_csv_fast(
+            file_path,
+            downcast=bool(load_options.get("downcast", False)),
+            fast_parse=bool(load_options.get("fast_parse", False)),
+            columns=columns,
+            compression=compression,
+            **csv_dtype_options(load_options)
+        )
+        return df, None
+
+    if chunk_size and source_type in ["jsonl", "parquet", "feather", "arrow_ipc"]:
+        if source_type == "jsonl":
+            chunks = iter_jsonl_file(file_path, chunk_size, columns, compression)
+        elif source_type == "parquet":
+            chunks = iter_parquet_file(file_path, chunk_size, columns, row_groups)
+        else:
+            chunks = iter_arrow_ipc_file(file_path, columns)
+        return ingest_chunks(chunks, context.session_dir)
+
+    if source_type == "json":
+        df = pd.read_json(file_path, compression=compression or "infer")
+        if columns:
+            df = df[columns]
+    elif source_type == "jsonl":
+        df = read_jsonl_file(file_path, columns, compression=compression)
+    elif source_type == "parquet":
+        df = read_parquet_file(file_path, columns, row_groups)
+    elif source_type in ["feather", "arrow_ipc"]:
+        df = read_arrow_ipc_file(file_path, columns)
+    else:
+        raise ValueError(f"Unsupported source type: {source_type}")
+
+    return df, None
+
+
+def load_from_file_set(
+    source_type: str,
+    file_path: str,
+    columns: list | None,
+    filter_expr: str | None,
+    load_options: dict,
+    context: Context
+) -> tuple[pd.DataFrame, dict | None]:
+    """
+    Load every shard selected by a glob pattern or directory as one table.
+
+    Returns:
+        (DataFrame, None), or (first shard, reference table) when
+        `load_options.chunk_size` streams the shards into a snapshot
+    """
+    paths = expand_file_paths(file_path, source_type)
+    root = dataset_root(file_path)
+    chunk_size = int(load_options.get("chunk_size") or 0)
+    max_workers = int(load_options.get("max_workers") or 0) or None
+
+    if filter_expr or load_options.get("duckdb_scan"):
+        # DuckDB reads the shard list itself (union by name, Hive partitions)
+        if chunk_size:
+            chunks = iter_scan_file(paths, source_type, chunk_size, columns, filter_expr)
+            return ingest_chunks(chunks, context.session_dir)
+        return scan_file(paths, source_type, columns, filter_expr), None
+
+    if chunk_size:
+        # Shards are written out as they arrive; the merge unions columns by name
+        def report_shards():
+            shards = iter_file_set(paths, source_type, columns, root, max_workers)
+            for index, shard in enumerate(shards):
+                yield shard
+                context.report_progress(20 + 40 * (index + 1) / len(paths))
+
+        return ingest_chunks(report_shards(), context.session_dir)
+
+    return read_file_set(paths, source_type, columns, root, max_workers), None
+
+
+def load_incremental(
+    source_type: str,
+    file_path: str | None,
+    database_config: dict | None,
+    columns: list | None,
+    load_options: dict,
+    context: Context
+) -> tuple[pd.DataFrame, int]:
+    """
+    Read the rows appended since the last run and return the whole snapshot.
+
+    The snapshot lives in the package data directory, or in the session
+    directory when `load_options.incremental_scope` is "session".
+
+    Returns:
+        (every stored row, number of rows added by this run)
+    """
+    if load_options.get("incremental_scope") == "session":
+        state_dir = os.path.join(context.session_dir, "incremental")
+    else:
+        state_dir = os.path.join(context.pkg_data_dir, "incremental")
+
+    if source_type in DATABASE_SOURCE_TYPES:
+        if not database_config or not database_config.get("query"):
+            raise ValueError("SQL query is required in database_config")
+        watermark_column = load_options.get("watermark_column")
+        if not watermark_column:
+            raise ValueError("Incremental database loads require load_options.watermark_column")
+        target = build_connection_url(source_type, database_config).render_as_string(hide_password=True)
+        identity = {"target": target, "query": database_config["query"], "column": watermark_column}
+    else:
+        if not file_path:
+            raise ValueError(f"File path is required for {source_type} source")
+        identity = {"path": os.path.abspath(file_path), "columns": columns}
+
+    snapshot = IncrementalSnapshot(
+        state_dir, hash_identity({"kind": "incremental", "source_type": source_type, **identity})
+    )
+    if load_options.get("reset_incremental"):
+        snapshot.reset()
+
+    state = snapshot.load_state()
+    watermark = state["watermark"] if state else None
+
+    if source_type in DATABASE_SOURCE_TYPES:
+        engine = get_engine(source_type, database_config)
+        new_rows, watermark, full_reload = read_new_database_rows(
+            engine, database_config["query"], watermark_column, watermark
+        )
+    else:
+        new_rows, watermark, full_reload = read_new_file_rows(
+            file_path, source_type, watermark, columns
+        )
+
+    snapshot.append(new_rows, watermark, replace=full_reload)
+    return snapshot.read(), len(new_rows)
+
+
+def load_zip_members(
+    file_path: str,
+    source_type: str,
+    columns: list | None,
+    load_options: dict
+) -> dict[str, pd.DataFrame]:
+    """Parse every CSV/JSON member of a zip archive (members are streamed, never extracted)"""
+    dtypes = load_options.get("dtypes") or None
+
+    def read_member(handle, member_type: str) -> pd.DataFrame:
+        if member_type == "csv":
+            return pd.read_csv(handle, dtype=dtypes, usecols=columns)
+        if member_type == "jsonl":
+            return read_jsonl_file(handle, columns)
+        frame = pd.read_json(handle)
+        return frame[columns] if columns else frame
+
+    return read_zip_members(file_path, source_type, read_member)
+
+
+def load_excel_sheets(
+    file_path: str,
+    columns: list | None,
+    load_options: dict,
+    load_cache
+) -> dict[str, tuple[pd.DataFrame, dict]]:
+    """
+    Load the selected sheets of a workbook, reusing cached sheets.
+
+    Returns:
+        Sheet name -> (DataFrame, schema), in selection order
+    """
+    sheet_names = resolve_sheet_names(file_path, load_options.get("sheets"))
+
+    results = {}
+    cache_keys = {}
+    if load_cache:
+        for name in sheet_names:
+            cache_keys[name] = file_cache_key(
+                file_path,
+                {"source_type": "excel", "sheet": name, "columns": columns},
+                bool(load_options.get("cache_content_hash", False))
+            )
+            if not load_options.get("bypass_cache"):
+                cached = load_cache.get(cache_keys[name])
+                if cached is not None:
+                    results[name] = cached
+
+    missing = [name for name in sheet_names if name not in results]
+    frames = read_excel_sheets(
+        file_path, missing, columns, int(load_options.get("max_workers") or 0) or None
+    )
+    for name, sheet_df in frames.items():
+        sheet_schema = profile_schema(sheet_df)
+        if load_cache and not sheet_df.empty:
+            load_cache.put(cache_keys[name], sheet_df, sheet_schema)
+        results[name] = (sheet_df, sheet_schema)
+
+    return {name: results[name] for name in sheet_names}
+
+
+def open_load_cache(load_options: dict, context: Context):
+    """Return the snapshot cache selected by `load_options` (package data directory by default)"""
+    return get_load_cache(
+        load_options.get("cache_dir") or os.path.join(context.pkg_data_dir, "load-cache"),
+        int(load_options.get("cache_max_bytes") or DEFAULT_LOAD_CACHE_MAX_BYTES)
+    )
+
+
+def use_load_cache(source_type: str, load_options: dict) -> bool:
+    """
+    Check whether a load goes through the snapshot cache.
+
+    File loads are cached by default. Database loads are opt-in, since table
+    contents can change without any fingerprint we could check. Chunked and
+    incremental loads already keep their own snapshots and are never cached.
+    """
+    if load_options.get("chunk_size") or load_options.get("incremental"):
+        return False
+    return bool(load_options.get("cache", source_type in FILE_SOURCE_TYPES))
+
+
+def load_cache_key(
+    source_type: str,
+    file_path: str | None,
+    database_config: dict | None,
+    columns: list | None,
+    filter_expr: str | None,
+    load_options: dict
+) -> str | None:
+    """Build the snapshot cache key of a load (None when the source is incomplete)"""
+    params = {
+        "source_type": source_type,
+        "columns": columns,
+        "filter": filter_expr,
+        "load_options": {
+            key: value for key, value in load_options.items()
+            if key not in CACHE_OPTION_KEYS and key not in SAMPLE_OPTION_KEYS
+        },
     }
 
+    if source_type in FILE_SOURCE_TYPES:
+        content_hash = bool(load_options.get("cache_content_hash", False))
+        if file_path and source_type in MULTI_FILE_SOURCE_TYPES and is_multi_file_path(file_path):
+            paths = expand_file_paths(file_path, source_type)
+            return file_set_cache_key(paths, params, content_hash)
+        if not file_path or not os.path.isfile(file_path):
+            return None
+        return file_cache_key(file_path, params, content_hash)
+
+    if not database_config or not database_config.get("query"):
+        return None
+    target = build_connection_url(source_type, database_config).render_as_string(hide_password=True)
+    return database_cache_key(target, database_config["query"], params)
+
+
+def sampling_options(load_options: dict) -> dict | None:
+    """Extract the sampling arguments of `load_options` (None when sampling is off)"""
+    size = int(load_options.get("sample_size") or 0) or None
+    fraction = float(load_options.get("sample_fraction") or 0) or None
+    if not size and not fraction:
+        return None
+
+    method = load_options.get("sample_method") or "reservoir"
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"Unsupported sample method: {method} (supported: {', '.join(SAMPLING_METHODS)})")
+    seed = load_options.get("sample_seed")
     return {
-        "data_table": data_table,
-        "preview_html": preview_html
+        "method": method,
+        "size": size,
+        "fraction": fraction,
+        "stratify_by": load_options.get("stratify_by") or None,
+        "seed": int(seed) if seed is not None else None,
     }
 
 
-async def load_from_database(db_type: str, config: dict) -> pd.DataFrame:
+def sample_part(part_df: pd.DataFrame, part_schema: dict, sample_options: dict) -> tuple:
+    """Sample one Excel sheet / zip member, returning (DataFrame, schema, sampling)"""
+    sample_df, part_sampling = sample_frame(part_df, **sample_options)
+    if part_sampling is None:
+        return part_df, part_schema, None
+    return sample_df, profile_schema(sample_df), part_sampling
+
+
+def optimize_part(part: tuple, optimize_options: dict) -> tuple[tuple, dict]:
+    """Optimize one Excel sheet / zip member, reprofiling it when anything changed"""
+    part_df, part_schema, *rest = part
+    part_df, report = optimize_dtypes(part_df, **optimize_options)
+    if report["columns"]:
+        part_schema = profile_schema(part_df)
+    return (part_df, part_schema, *rest), report
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for the preview"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def csv_dtype_options(load_options: dict) -> dict:
+    """Extract the CSV dtype options shared by the in-memory and chunked paths"""
+    options = {
+        "dtypes": load_options.get("dtypes") or None,
+        "infer_dtypes": bool(load_options.get("infer_dtypes", False)),
+    }
+    if load_options.get("sample_rows"):
+        options["sample_rows"] = int(load_options["sample_rows"])
+    if load_options.get("category_ratio") is not None:
+        options["category_ratio"] = float(load_options["category_ratio"])
+    return options
+
+
+def load_from_database(
+    db_type: str,
+    config: dict,
+    load_options: dict,
+    context: Context
+) -> tuple[pd.DataFrame, dict | None]:
     """
     Load data from a database using SQLAlchemy.
 
+    Engines are pooled per process (see `data_insight.db_engines`), so
+    repeated runs against the same database reuse warm connections.
+
+    With `load_options.chunk_size` the result is read through a server-side
+    cursor in batches that are written straight to a Parquet snapshot.
+
+    With `partition_column` and `num_partitions` in the config the query is
+    split into key ranges that run concurrently over pooled connections.
+
     Args:
         db_type: Database type (mysql, postgresql, sqlite)
-        config: Database configuration with host, port, database, username, password, query
+        config: Database configuration with host, port, database, username,
+            password, query and optional pool settings
+        load_options: Load options (chunk_size)
+        context: Task context (session directory, progress reporting)
 
     Returns:
-        DataFrame with query results
+        (DataFrame with query results, None), or (first batch, reference
+        table) when streaming
     """
-    import sqlalchemy
-
-    # Build connection string based on database type
-    if db_type == "sqlite":
-        # SQLite uses file path
-        database_path = config.get("database", ":memory:")
-        connection_string = f"sqlite:///{database_path}"
-    else:
-        # MySQL and PostgreSQL use host/port/credentials
-        host = config.get("host", "localhost")
-        port = config.get("port")
-        database = config.get("database")
-        username = config.get("username")
-        password = config.get("password")
-
-        # Set default ports
-        if not port:
-            port = 3306 if db_type == "mysql" else 5432
-
-        # Validate required fields
-        if not all([database, username]):
-            raise ValueError(f"Database name and username are required for {db_type}")
-
-        # Build connection string
-        if db_type == "mysql":
-            # Use pymysql driver for MySQL
-            connection_string = f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
-        elif db_type == "postgresql":
-            # Use psycopg2 driver for PostgreSQL
-            connection_string = f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database}"
-        else:
-            raise ValueError(f"Unsupported database type: {db_type}")
-
     # Get SQL query
     query = config.get("query")
     if not query:
         raise ValueError("SQL query is required in database_config")
 
-    # Create engine and execute query
-    try:
-        engine = sqlalchemy.create_engine(connection_string)
-        df = pd.read_sql(query, engine)
-        engine.dispose()
-        return df
-    except Exception as e:
-        raise RuntimeError(f"Database query failed: {str(e)}")
-
-
-def infer_schema(df: pd.DataFrame) -> dict:
-    """
-    Infer schema from DataFrame.
-
-    Returns a dictionary mapping column names to their types and statistics.
-    """
-    schema = {}
-
-    for col in df.columns:
-        col_info = {
-            "name": col,
-            "type": str(df[col].dtype),
-            "nullable": bool(df[col].isnull().any()),
-            "unique_count": int(df[col].nunique())
-        }
+    if config.get("max_connections") or config.get("idle_timeout"):
+        configure_engine_registry(
+            max_connections=config.get("max_connections") or None,
+            idle_timeout=config.get("idle_timeout") or None
+        )
 
-        # Add type-specific info
-        if pd.api.types.is_numeric_dtype(df[col]):
-            col_info["semantic_type"] = "quantitative"
-            col_info["min"] = float(df[col].min()) if not df[col].isnull().all() else None
-            col_info["max"] = float(df[col].max()) if not df[col].isnull().all() else None
-            col_info["mean"] = float(df[col].mean()) if not df[col].isnull().all() else None
-        elif pd.api.types.is_datetime64_any_dtype(df[col]):
-            col_info["semantic_type"] = "temporal"
-        else:
-            col_info["semantic_type"] = "nominal"
-            col_info["sample_values"] = df[col].dropna().head(3).tolist()
+    partition_column = config.get("partition_column")
+    num_partitions = int(config.get("num_partitions") or 0)
+    partitioned = bool(partition_column) and num_partitions > 1
+    if partitioned and not config.get("pool_size"):
+        # One pooled connection per partition query
+        config = {**config, "pool_size": num_partitions}
 
-        schema[col] = col_info
+    engine = get_engine(db_type, config)
+    chunk_size = int(load_options.get("chunk_size") or 0)
 
-    return schema
+    # Execute query on a pooled connection
+    try:
+        if partitioned:
+            frames = read_partitioned(engine, query, partition_column, num_partitions)
+            if chunk_size:
+                return ingest_chunks(frames, context.session_dir)
+            return pd.concat(list(frames), ignore_index=True), None
+        if chunk_size:
+            # The total row count is unknown while streaming, so progress
+            # approaches (but never reaches) the end of the load phase
+            def report_batch(row_count: int) -> None:
+                batches = row_count / chunk_size
+                context.report_progress(20 + 40 * batches / (batches + 10))
+
+            return ingest_chunks(
+                stream_query(engine, query, chunk_size), context.session_dir, report_batch
+            )
+        return pd.read_sql(query, engine), None
+    except Exception as e:
+        raise RuntimeError(f"Database query failed: {str(e)}")
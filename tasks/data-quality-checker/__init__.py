@@ -4,6 +4,7 @@ from oocana import LLMModelOptions
 class Inputs(typing.TypedDict):
     data_table: dict
     auto_clean: bool
+    table_format: typing.Literal["rows", "columnar", "reference"]
     llm: LLMModelOptions
 class Outputs(typing.TypedDict):
     quality_report: typing.NotRequired[dict]
@@ -20,6 +21,9 @@ import json
 import altair as alt
 import vl_convert as vlc
 import base64
+from data_insight import decode_table, encode_table, profile_schema
+from data_insight.sampling import row_weights, sampling_note, table_sampling
+from data_insight.sketches import SKETCH_PROFILE_MIN_ROWS, approximate_quantiles
 
 
 def analyze_missing_values(df: pd.DataFrame) -> dict:
@@ -36,13 +40,24 @@ def analyze_missing_values(df: pd.DataFrame) -> dict:
 
 
 def detect_outliers(df: pd.DataFrame) -> dict:
-    """Detect outliers using IQR method"""
+    """
+    Detect outliers using IQR method
+
+    Quartiles of huge tables come from a KLL sketch; the bounds are then
+    flagged with their rank error.
+    """
     outliers = {}
     numeric_cols = df.select_dtypes(include=['number']).columns
+    sketched = len(df) >= SKETCH_PROFILE_MIN_ROWS
 
     for col in numeric_cols:
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
+        if sketched:
+            (Q1, Q3), rank_error = approximate_quantiles(df[col], (0.25, 0.75))
+            if Q1 is None:
+                continue
+        else:
+            Q1 = df[col].quantile(0.25)
+            Q3 = df[col].quantile(0.75)
         IQR = Q3 - Q1
 
         # Outliers are values outside [Q1 - 1.5*IQR, Q3 + 1.5*IQR]
@@ -59,6 +74,9 @@ def detect_outliers(df: pd.DataFrame) -> dict:
                 "lower_bound": float(lower_bound),
                 "upper_bound": float(upper_bound)
             }
+            if sketched:
+                outliers[col]["bounds_approximate"] = True
+                outliers[col]["quantile_rank_error"] = round(rank_error, 4)
 
     return outliers
 
@@ -108,6 +126,23 @@ def calculate_quality_score(missing: dict, outliers: dict, duplicates: int, tota
     return max(0, score)
 
 
+def add_population_estimates(
+    df: pd.DataFrame,
+    missing: dict,
+    outliers: dict,
+    sampling: dict
+) -> None:
+    """Add estimated population counts to missing-value and outlier findings on a sample"""
+    weights = pd.Series(row_weights(df, sampling), index=df.index)
+
+    for col, info in missing.items():
+        info["estimated_count"] = int(round(weights[df[col].isnull()].sum()))
+
+    for col, info in outliers.items():
+        mask = (df[col] < info["lower_bound"]) | (df[col] > info["upper_bound"])
+        info["estimated_count"] = int(round(weights[mask].sum()))
+
+
 def create_quality_visualization(df: pd.DataFrame, missing: dict, outliers: dict) -> str:
     """Create a visualization showing data quality issues"""
     if not missing and not outliers:
@@ -189,46 +224,6 @@ def clean_dataframe(df: pd.DataFrame, missing: dict, outliers: dict) -> pd.DataF
     return cleaned_df
 
 
-def infer_schema(df: pd.DataFrame) -> dict:
-    """Infer schema from cleaned dataframe"""
-    schema = {}
-
-    for col in df.columns:
-        dtype = df[col].dtype
-        col_info = {"name": col}
-
-        if pd.api.types.is_numeric_dtype(dtype):
-            unique_count = df[col].nunique()
-            if unique_count < 20 and unique_count < len(df) * 0.5:
-                col_info["type"] = "ordinal"
-            else:
-                col_info["type"] = "quantitative"
-
-            col_info["stats"] = {
-                "min": float(df[col].min()),
-                "max": float(df[col].max()),
-                "mean": float(df[col].mean()),
-            }
-
-        elif pd.api.types.is_datetime64_any_dtype(dtype):
-            col_info["type"] = "temporal"
-            col_info["stats"] = {
-                "min": str(df[col].min()),
-                "max": str(df[col].max()),
-            }
-
-        else:
-            col_info["type"] = "nominal"
-            unique_vals = df[col].unique()
-            if len(unique_vals) <= 10:
-                col_info["unique_values"] = unique_vals.tolist()
-            col_info["unique_count"] = len(unique_vals)
-
-        schema[col] = col_info
-
-    return schema
-
-
 async def main(params: Inputs, context: Context) -> Outputs:
     """
     Analyze data quality and provide cleaning recommendations.
@@ -240,15 +235,22 @@ async def main(params: Inputs, context: Context) -> Outputs:
     - Type inconsistencies
 
     Provides AI-powered cleaning suggestions.
+
+    On tables sampled by data-loader, percentages are sample estimates,
+    missing-value and outlier counts are scaled to the full table and the
+    report is marked approximate. Duplicates are counted within the sample
+    only (a sample holds fewer duplicate pairs than the full table).
     """
     data_table = params["data_table"]
     auto_clean = params["auto_clean"]
+    table_format = params.get("table_format") or "rows"
     llm = params["llm"]
 
     context.report_progress(10)
 
     # Convert to DataFrame
-    df = pd.DataFrame(data_table["rows"])
+    df = decode_table(data_table)
+    sampling = table_sampling(data_table)
 
     if df.empty:
         raise ValueError("Input data table is empty")
@@ -271,6 +273,9 @@ async def main(params: Inputs, context: Context) -> Outputs:
 
     context.report_progress(60)
 
+    if sampling:
+        add_population_estimates(df, missing, outliers, sampling)
+
     # Build quality report
     quality_report = {
         "overall_score": quality_score,
@@ -279,12 +284,17 @@ async def main(params: Inputs, context: Context) -> Outputs:
         "type_issues": type_issues,
         "duplicate_rows": duplicate_count
     }
+    if sampling:
+        quality_report["approximate"] = True
+        quality_report["sampling_note"] = sampling_note(sampling)
+        quality_report["estimated_total_rows"] = sampling["population_row_count"]
 
     # Generate AI cleaning suggestions
     context.report_progress(70)
 
+    approximate_line = f"- {sampling_note(sampling)} (counts are estimates, duplicates are within the sample)\n" if sampling else ""
     summary = f"""Data Quality Analysis:
-- Total rows: {len(df)}
+{approximate_line}- Total rows: {len(df)}
 - Overall quality score: {quality_score:.1f}/100
 - Missing values: {len(missing)} columns affected
 - Outliers: {len(outliers)} columns affected
@@ -330,13 +340,14 @@ Be concise and actionable."""
     # Auto-clean if enabled
     if auto_clean:
         cleaned_df = clean_dataframe(df, missing, outliers)
-        cleaned_schema = infer_schema(cleaned_df)
+        cleaned_schema = profile_schema(cleaned_df)
 
-        cleaned_table = {
-            "columns": cleaned_df.columns.tolist(),
-            "rows": cleaned_df.to_dict("records"),
-            "schema": cleaned_schema
-        }
+        cleaned_table = encode_table(
+            cleaned_df, cleaned_schema, table_format, context.session_dir
+        )
+        if sampling:
+            # Still a sample of the same source
+            cleaned_table["sampling"] = sampling
 
         rows_removed = len(df) - len(cleaned_df)
     else:
@@ -348,11 +359,16 @@ Be concise and actionable."""
 
     # Generate preview
     score_color = "#22c55e" if quality_score >= 80 else "#eab308" if quality_score >= 60 else "#ef4444"
+    approximate_html = (
+        f'<div style="font-size: 13px; color: #6b7280; margin-bottom: 10px;">{sampling_note(sampling)}</div>'
+        if sampling else ""
+    )
 
     preview_html = f"""
 <div style="font-family: system-ui, -apple-system, sans-serif; padding: 20px;">
     <div style="margin-bottom: 20px;">
         <h3 style="margin: 0 0 10px 0; color: #1f2937;">Data Quality Report</h3>
+        {approximate_html}
         <div style="display: flex; align-items: center; gap: 15px; margin-bottom: 15px;">
             <div style="font-size: 36px; font-weight: bold; color: {score_color};">
                 {quality_score:.1f}
@@ -25,6 +25,8 @@ import json
 import altair as alt
 import vl_convert as vlc
 import base64
+from data_insight import decode_table, profile_schema, table_row_count
+from data_insight.sketches import SKETCH_PROFILE_MIN_ROWS
 
 
 EXPLORATION_SYSTEM_PROMPT = """You are an expert data analyst conducting exploratory data analysis.
@@ -95,6 +97,9 @@ def extract_json_from_response(content: str) -> dict:
 
 def summarize_table(df: pd.DataFrame) -> str:
     """Create a summary of table structure and sample data"""
+    if len(df) >= SKETCH_PROFILE_MIN_ROWS:
+        return summarize_large_table(df)
+
     summary_parts = []
 
     # Schema
@@ -120,6 +125,42 @@ def summarize_table(df: pd.DataFrame) -> str:
     return "\n".join(summary_parts)
 
 
+def summarize_large_table(df: pd.DataFrame) -> str:
+    """Summarize a huge table from its sketch-based profile instead of exact counts"""
+    schema = profile_schema(df)
+    summary_parts = ["Table Schema (approximate statistics from sketches):"]
+    for col, info in schema.items():
+        approx = "~" if info.get("unique_count_approximate") else ""
+        summary_parts.append(
+            f"  - {col} ({info['dtype']}): {approx}{info['unique_count']} unique values, "
+            f"{info['null_count']} nulls"
+        )
+
+    summary_parts.append("\nSample rows (first 5):")
+    summary_parts.append(df.head(5).to_string())
+
+    numeric = {
+        col: info for col, info in schema.items()
+        if info.get("quantiles") and "mean" in (info.get("stats") or {})
+    }
+    if numeric:
+        rank_error = max(info["quantile_rank_error"] for info in numeric.values())
+        summary_parts.append(f"\nNumeric column statistics (quantiles within ±{rank_error:.1%} rank):")
+        stats = pd.DataFrame({
+            col: {
+                "count": len(df) - info["null_count"],
+                "mean": info["stats"]["mean"],
+                "min": info["stats"]["min"],
+                **{f"{float(q):.0%}": value for q, value in info["quantiles"].items()},
+                "max": info["stats"]["max"],
+            }
+            for col, info in numeric.items()
+        })
+        summary_parts.append(stats.to_string())
+
+    return "\n".join(summary_parts)
+
+
 async def execute_sql_query(df: pd.DataFrame, sql_query: str, table_name: str = "data") -> pd.DataFrame:
     """Execute SQL query on dataframe using DuckDB"""
     conn = duckdb.connect(":memory:")
@@ -240,13 +281,13 @@ async def main(params: Inputs, context: Context) -> Outputs:
     max_iterations = params.get("max_iterations") or 3
     llm = params["llm"]
 
-    if not input_table.get("rows"):
+    if table_row_count(input_table) == 0:
         raise ValueError("Input table has no data rows")
 
     context.report_progress(5)
 
     # Initialize
-    df = pd.DataFrame(input_table["rows"])
+    df = decode_table(input_table)
     exploration_steps = []
     current_df = df
 
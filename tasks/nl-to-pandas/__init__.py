@@ -4,6 +4,7 @@ from oocana import LLMModelOptions
 class Inputs(typing.TypedDict):
     input_table: dict
     instruction: str
+    table_format: typing.Literal["rows", "columnar", "reference"]
     llm: LLMModelOptions
 class Outputs(typing.TypedDict):
     python_code: typing.NotRequired[str]
@@ -21,6 +22,7 @@ from sklearn import preprocessing, decomposition, cluster
 import sys
 import io
 from contextlib import redirect_stdout, redirect_stderr
+from data_insight import decode_table, encode_table, profile_schema
 
 
 PANDAS_SYSTEM_PROMPT = """You are an expert Python data analyst. Generate Pandas code to transform data according to user instructions.
@@ -78,9 +80,8 @@ def extract_json_from_response(text: str) -> dict:
         raise ValueError(f"Failed to parse JSON from LLM response: {e}\n\nResponse: {text}")
 
 
-def summarize_table(table: dict) -> str:
+def summarize_table(table: dict, df: pd.DataFrame) -> str:
     """Create a summary of the table for LLM context"""
-    df = pd.DataFrame(table["rows"])
     summary_parts = []
 
     summary_parts.append(f"Table shape: {len(df)} rows × {len(df.columns)} columns")
@@ -222,38 +223,6 @@ Please fix the code to handle this error. Return the corrected code in the same
     return result["python_code"]
 
 
-def infer_schema(df: pd.DataFrame) -> dict:
-    """Infer schema from DataFrame"""
-    schema = {}
-    for col in df.columns:
-        dtype = df[col].dtype
-        col_info = {"name": col}
-
-        if pd.api.types.is_numeric_dtype(dtype):
-            unique_count = df[col].nunique()
-            if unique_count < 20 and unique_count < len(df) * 0.5:
-                col_info["type"] = "ordinal"
-            else:
-                col_info["type"] = "quantitative"
-            col_info["stats"] = {
-                "min": float(df[col].min()),
-                "max": float(df[col].max()),
-                "mean": float(df[col].mean()),
-            }
-        elif pd.api.types.is_datetime64_any_dtype(dtype):
-            col_info["type"] = "temporal"
-        else:
-            col_info["type"] = "nominal"
-            unique_count = df[col].nunique()
-            if unique_count <= 10:
-                col_info["unique_values"] = df[col].unique().tolist()
-            col_info["unique_count"] = unique_count
-
-        schema[col] = col_info
-
-    return schema
-
-
 async def main(params: Inputs, context: Context) -> Outputs:
     """Transform data using natural language instructions converted to Pandas code"""
 
@@ -261,15 +230,16 @@ async def main(params: Inputs, context: Context) -> Outputs:
 
     input_table = params["input_table"]
     instruction = params["instruction"]
+    table_format = params.get("table_format") or "rows"
     llm = params["llm"]
 
     # Prepare input DataFrame
-    df = pd.DataFrame(input_table["rows"])
+    df = decode_table(input_table)
 
     context.report_progress(10)
 
     # Generate table summary for LLM
-    table_summary = summarize_table(input_table)
+    table_summary = summarize_table(input_table, df)
 
     # Build prompt
     user_prompt = f"""Input Table:
@@ -350,12 +320,10 @@ Generate Pandas code to accomplish this transformation."""
     context.report_progress(80)
 
     # Build output
-    schema = infer_schema(result_df)
-    result_table = {
-        "columns": result_df.columns.tolist(),
-        "rows": result_df.to_dict("records"),
-        "schema": schema,
-    }
+    schema = profile_schema(result_df)
+    result_table = encode_table(
+        result_df, schema, table_format, context.session_dir
+    )
 
     # Generate preview
     preview_df = result_df.head(20)
@@ -4,6 +4,7 @@ from oocana import LLMModelOptions
 class Inputs(typing.TypedDict):
     input_table: dict
     instruction: str
+    table_format: typing.Literal["rows", "columnar", "reference"]
     llm: LLMModelOptions
 class Outputs(typing.TypedDict):
     sql_query: typing.NotRequired[str]
@@ -17,6 +18,14 @@ import pandas as pd
 import duckdb
 import json
 import re
+from data_insight import (
+    decode_table,
+    encode_table,
+    profile_schema,
+    table_columns,
+    table_head_records,
+    table_row_count,
+)
 
 async def main(params: Inputs, context: Context) -> Outputs:
     """
@@ -27,12 +36,13 @@ async def main(params: Inputs, context: Context) -> Outputs:
     """
     input_table = params["input_table"]
     instruction = params["instruction"]
+    table_format = params.get("table_format") or "rows"
     llm_config = params["llm"]
 
     # Validate inputs
     if not instruction:
         raise ValueError("Instruction is required")
-    if not input_table or not input_table.get("rows"):
+    if not input_table or table_row_count(input_table) == 0:
         raise ValueError("Input table is empty or invalid")
 
     # Report progress
@@ -109,7 +119,7 @@ Output JSON format: {{"sql_query": "...", "explanation": "..."}}"""
     # Execute SQL query
     try:
         # Create DataFrame from input table
-        df = pd.DataFrame(input_table["rows"])
+        df = decode_table(input_table)
 
         # Convert data types to DuckDB-compatible types
         df = convert_to_duckdb_types(df)
@@ -187,16 +197,14 @@ Output JSON format: {{"sql_query": "...", "explanation": "..."}}"""
     context.report_progress(100)
 
     # Infer schema for result table
-    result_schema = infer_schema_from_df(result_df)
+    result_schema = profile_schema(result_df)
 
     # Return results
     return {
         "sql_query": sql_query,
-        "result_table": {
-            "columns": result_df.columns.tolist(),
-            "rows": result_df.to_dict("records"),
-            "schema": result_schema
-        },
+        "result_table": encode_table(
+            result_df, result_schema, table_format, context.session_dir
+        ),
         "explanation": explanation
     }
 
@@ -205,12 +213,12 @@ def summarize_table(table: dict) -> str:
     """
     Create a concise summary of the table for LLM context.
     """
-    columns = table.get("columns", [])
+    columns = table_columns(table)
     schema = table.get("schema", {})
-    rows = table.get("rows", [])
+    rows = table_head_records(table, 2)
 
     summary_parts = [
-        f"Table: input_data ({len(rows)} rows)",
+        f"Table: input_data ({table_row_count(table)} rows)",
         "Columns:"
     ]
 
@@ -219,7 +227,7 @@ def summarize_table(table: dict) -> str:
         col_type = col_info.get("semantic_type", "unknown")
         col_summary = f"  - {col} ({col_type})"
 
-        if col_type == "quantitative":
+        if col_type in ("quantitative", "ordinal"):
             min_val = col_info.get("min")
             max_val = col_info.get("max")
             if min_val is not None and max_val is not None:
@@ -233,8 +241,8 @@ def summarize_table(table: dict) -> str:
     # Add sample data (first 2 rows)
     if rows:
         summary_parts.append("\nSample data (first 2 rows):")
-        for i, row in enumerate(rows[:2]):
-            summary_parts.append(f"  Row {i+1}: {json.dumps(row)}")
+        for i, row in enumerate(rows):
+            summary_parts.append(f"  Row {i+1}: {json.dumps(row, default=str)}")
 
     return "\n".join(summary_parts)
 
@@ -286,39 +294,3 @@ def convert_to_duckdb_types(df: pd.DataFrame) -> pd.DataFrame:
             df[col] = df[col].astype('float64')  # Use float to handle nulls
 
     return df
-
-
-def infer_schema_from_df(df: pd.DataFrame) -> dict:
-    """
-    Infer schema from DataFrame for compatibility with Chart Recommender.
-
-    Returns schema compatible with Data Loader output format.
-    """
-    schema = {}
-
-    for col in df.columns:
-        col_schema = {}
-
-        # Determine semantic type
-        if pd.api.types.is_numeric_dtype(df[col]):
-            col_schema["type"] = "quantitative"
-            col_schema["stats"] = {
-                "min": float(df[col].min()) if not df[col].isna().all() else None,
-                "max": float(df[col].max()) if not df[col].isna().all() else None,
-                "mean": float(df[col].mean()) if not df[col].isna().all() else None,
-            }
-        elif pd.api.types.is_datetime64_any_dtype(df[col]):
-            col_schema["type"] = "temporal"
-        else:
-            col_schema["type"] = "nominal"
-
-        # Add unique count
-        col_schema["unique_count"] = int(df[col].nunique())
-
-        # Add sample values for categorical fields
-        if col_schema["type"] == "nominal" and col_schema["unique_count"] <= 10:
-            col_schema["unique_values"] = df[col].dropna().unique().tolist()
-
-        schema[col] = col_schema
-
-    return schema
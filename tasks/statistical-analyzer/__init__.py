@@ -3,22 +3,65 @@ import typing
 from oocana import LLMModelOptions
 class Inputs(typing.TypedDict):
     data_table: dict
-    analysis_type: typing.Literal["correlation", "t_test", "descriptive_stats", "normality_test"]
+    analysis_type: typing.Literal["correlation", "t_test", "group_comparison", "descriptive_stats", "normality_test", "all"]
     variables: str | None
     llm: LLMModelOptions
 class Outputs(typing.TypedDict):
     test_result: typing.NotRequired[dict]
     interpretation: typing.NotRequired[str]
     visualization: typing.NotRequired[str | None]
+    visualizations: typing.NotRequired[dict]
 #endregion
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
 from oocana import Context
 from openai import OpenAI
 import pandas as pd
 import numpy as np
 from scipy import stats
 import json
-import matplotlib.pyplot as plt
+import base64
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from data_insight import decode_table, table_row_count
+from data_insight.correlation import CORRELATION_METHODS, KENDALL_MAX_ROWS, correlation_matrices, significant_pairs
+from data_insight.group_tests import (
+    group_summaries,
+    kruskal_wallis,
+    one_way_anova,
+    pairwise_tests,
+    welch_anova,
+)
+from data_insight.normality import normality_tests
+from data_insight.online_stats import summarize_batches
+from data_insight.sampling import row_weights, sampling_note, scale_count, table_sampling
+from data_insight.table_codec import iter_table_batches, table_format_of
+
+
+HEATMAP_ANNOTATION_LIMIT = 20
+
+# Significant pairs included in the interpretation prompt
+PROMPT_CORRELATION_LIMIT = 30
+
+# Post-hoc pairs included in the interpretation prompt
+PROMPT_POST_HOC_LIMIT = 30
+
+# Box plots show the largest groups only
+BOX_PLOT_GROUP_LIMIT = 30
+
+# Threads accumulating streamed descriptive statistics
+STATS_WORKERS = min(4, os.cpu_count() or 1)
+
+# Threads rendering figures
+PLOT_WORKERS = 4
+
+PLOT_DPI = 150
+
+HISTOGRAM_BINS = 30
 
 
 async def main(params: Inputs, context: Context) -> Outputs:
@@ -26,10 +69,22 @@ async def main(params: Inputs, context: Context) -> Outputs:
     Perform statistical analysis on data with AI-powered interpretation.
 
     Supports:
-    - Correlation analysis (Pearson, Spearman)
+    - Correlation analysis (Pearson, Spearman, Kendall with FDR-corrected p-values)
     - T-test (two sample comparison)
+    - Group comparison (ANOVA, Welch's ANOVA, Kruskal-Wallis with
+      Holm/FDR-adjusted pairwise post-hoc tests)
     - Descriptive statistics
-    - Normality tests (Shapiro-Wilk)
+    - Normality tests (Shapiro-Wilk on small samples, D'Agostino-Pearson on
+      large ones; Anderson-Darling and Jarque-Bera on request)
+    - "all": several of the above (`variables.analyses`, by default
+      descriptive stats, correlation - with at least two numeric columns -,
+      normality and - when dependent and group_column are given - group
+      comparison) over one decoded frame, with one combined interpretation.
+      An analysis that does not apply to the table is reported as
+      {"error": ...} without failing the others
+
+    Tables sampled by data-loader are analyzed as-is; counts are scaled to
+    estimated population counts and the result is marked approximate.
     """
     context.report_progress(0)
 
@@ -38,147 +93,334 @@ async def main(params: Inputs, context: Context) -> Outputs:
     variables = params.get("variables") or {}
     llm = params["llm"]
 
-    # Build DataFrame
-    df = pd.DataFrame(data_table["rows"])
+    # One shared frame for every analysis requested in this invocation; the
+    # table is only decoded once an analysis needs its rows
+    shared = SharedFrame(data_table)
+    sampling = table_sampling(data_table)
 
-    if df.empty:
+    if shared.empty:
         raise ValueError("Data table is empty")
 
     context.report_progress(20)
 
-    # Perform analysis based on type
+    if analysis_type == "all":
+        analyses = variables.get("analyses") or default_analyses(variables, shared)
+    else:
+        analyses = [analysis_type]
+
+    # Every analysis but descriptive statistics reads the decoded rows; when
+    # one runs, descriptive statistics come from that frame too instead of a
+    # separate streamed pass over the file
+    if any(name != "descriptive_stats" for name in analyses):
+        shared.decode()
+
+    results, plots = {}, {}
+    for name in analyses:
+        try:
+            results[name], plots[name] = run_analysis(name, shared, variables)
+        except ValueError as e:
+            if analysis_type != "all":
+                raise
+            # One inapplicable analysis does not cost the others their results
+            results[name], plots[name] = {"error": str(e)}, None
+            continue
+        if sampling:
+            results[name] = mark_approximate(results[name], shared, sampling, variables)
+
+    if all("error" in result for result in results.values()):
+        raise ValueError("; ".join(f"{name}: {result['error']}" for name, result in results.items()))
+
+    context.report_progress(60)
+
+    # Plots render in worker threads while the LLM writes the interpretation
+    # (submitted right away)
+    rendering = asyncio.get_running_loop().run_in_executor(None, render_plots, plots, context)
+
+    if analysis_type == "all":
+        test_result = {"analyses": results}
+        if sampling:
+            test_result.update(approximate=True, sampling_note=sampling_note(sampling))
+    else:
+        test_result = results[analysis_type]
+
+    # Generate AI interpretation (one call for every analysis)
+    interpretation = await generate_interpretation(
+        analysis_type, test_result, llm, context
+    )
+
+    context.report_progress(90)
+
+    visualizations = await rendering
+    preview_plots([path for path in visualizations.values() if path], context)
+
+    context.report_progress(100)
+
+    return {
+        "test_result": test_result,
+        "interpretation": interpretation,
+        "visualization": next((path for path in visualizations.values() if path), None),
+        "visualizations": visualizations
+    }
+
+
+class SharedFrame:
+    """
+    The input table plus views computed at most once per invocation.
+
+    The table is decoded on first access to `df` (or `decode`). Descriptive
+    statistics of a reference table that has not been decoded are streamed
+    from disk in record batches through mergeable online accumulators
+    instead, so they need constant memory (`online_stats` is then set).
+    """
+
+    def __init__(self, table: dict | None = None, df: pd.DataFrame | None = None):
+        self.table = table
+        self.online_stats = None
+        if df is not None:
+            self.df = df
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        return decode_table(self.table)
+
+    @property
+    def decoded(self) -> bool:
+        return "df" in self.__dict__
+
+    def decode(self) -> pd.DataFrame:
+        """Decode the table now, so later views are computed from the frame"""
+        return self.df
+
+    @property
+    def streamable(self) -> bool:
+        return not self.decoded and table_format_of(self.table) == "reference"
+
+    @property
+    def empty(self) -> bool:
+        return table_row_count(self.table) == 0 if self.streamable else self.df.empty
+
+    @property
+    def row_count(self) -> int:
+        return table_row_count(self.table) if self.streamable else len(self.df)
+
+    @cached_property
+    def numeric(self) -> pd.DataFrame:
+        return self.df.select_dtypes(include=[np.number])
+
+    @cached_property
+    def summary(self) -> pd.DataFrame:
+        """describe() of the numeric columns (count, mean, std, min, quartiles, max)"""
+        if self.streamable:
+            self.online_stats = summarize_batches(iter_table_batches(self.table), workers=STATS_WORKERS)
+            return self.online_stats.describe()
+        if self.numeric.empty:
+            return pd.DataFrame()
+        return self.numeric.describe()
+
+
+def default_analyses(variables: dict, shared: SharedFrame) -> list:
+    """
+    Analyses of the "all" mode: correlation only with at least two numeric
+    columns, group comparison only when groups are named
+    """
+    analyses = ["descriptive_stats"]
+    if len(variables.get("independent") or shared.numeric.columns) >= 2:
+        analyses.append("correlation")
+    analyses.append("normality_test")
+    if variables.get("dependent") and variables.get("group_column"):
+        analyses.append("group_comparison")
+    return analyses
+
+
+def run_analysis(analysis_type: str, shared: SharedFrame, variables: dict) -> tuple[dict, tuple | None]:
+    """
+    Compute one analysis.
+
+    Returns (test result, plot) - the plot is a (function, *arguments) tuple
+    rendered later by `render_plots`, or None.
+    """
     if analysis_type == "descriptive_stats":
-        test_result = compute_descriptive_stats(df)
-        visualization = None
+        return compute_descriptive_stats(shared), None
 
-    elif analysis_type == "correlation":
+    df = shared.df
+
+    if analysis_type == "correlation":
         independent_vars = variables.get("independent", [])
         if not independent_vars:
             # Auto-select numeric columns
-            independent_vars = df.select_dtypes(include=[np.number]).columns.tolist()
+            independent_vars = shared.numeric.columns.tolist()
 
         if len(independent_vars) < 2:
             raise ValueError("Correlation analysis requires at least 2 numeric variables")
 
-        test_result = compute_correlation(df, independent_vars)
-        visualization = create_correlation_heatmap(df, independent_vars, context)
+        test_result = compute_correlation(
+            df,
+            independent_vars,
+            methods=variables.get("methods") or CORRELATION_METHODS,
+            alpha=variables.get("alpha") or 0.05,
+            kendall_max_rows=variables.get("kendall_max_rows", KENDALL_MAX_ROWS)
+        )
+        plot = (create_correlation_heatmap, pd.DataFrame(test_result["correlation_matrix"]), test_result["method"])
+        return test_result, plot
 
-    elif analysis_type == "t_test":
+    if analysis_type in ("t_test", "group_comparison"):
         dependent_var = variables.get("dependent")
         group_col = variables.get("group_column")
 
         if not dependent_var or not group_col:
-            raise ValueError("T-test requires 'dependent' variable and 'group_column' in variables")
+            label = "T-test" if analysis_type == "t_test" else "Group comparison"
+            raise ValueError(f"{label} requires 'dependent' variable and 'group_column' in variables")
 
-        test_result = compute_t_test(df, dependent_var, group_col)
-        visualization = create_box_plot(df, dependent_var, group_col, context)
+        if analysis_type == "t_test":
+            test_result = compute_t_test(df, dependent_var, group_col, variables)
+        else:
+            test_result = compute_group_comparison(df, dependent_var, group_col, variables)
+        return test_result, (create_box_plot, df, dependent_var, group_col)
 
-    elif analysis_type == "normality_test":
+    if analysis_type == "normality_test":
         dependent_var = variables.get("dependent")
-        if not dependent_var:
-            # Auto-select first numeric column
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        test_options = {
+            "test": variables.get("normality_test") or "auto",
+            "max_sample": variables.get("max_sample"),
+            "seed": variables.get("sample_seed", 0),
+            "alpha": variables.get("alpha") or 0.05,
+        }
+        if dependent_var:
+            test_result = compute_normality_test(df, dependent_var, **test_options)
+            plotted_var = dependent_var
+        else:
+            # Test every numeric column in one batch
+            numeric_cols = shared.numeric.columns.tolist()
             if not numeric_cols:
                 raise ValueError("No numeric columns found for normality test")
-            dependent_var = numeric_cols[0]
+            test_result = compute_normality_tests(df, numeric_cols, shared, **test_options)
+            plotted_var = numeric_cols[0]
 
-        test_result = compute_normality_test(df, dependent_var)
-        visualization = create_distribution_plot(df, dependent_var, context)
+        return test_result, (create_distribution_plot, df, plotted_var)
 
-    else:
-        raise ValueError(f"Unsupported analysis type: {analysis_type}")
+    raise ValueError(f"Unsupported analysis type: {analysis_type}")
 
-    context.report_progress(60)
 
-    # Generate AI interpretation
-    interpretation = await generate_interpretation(
-        analysis_type, test_result, llm, context
-    )
-
-    context.report_progress(90)
-
-    # No need for separate preview - plt.show() already displayed charts
-    context.report_progress(100)
+def render_plots(plots: dict, context: Context) -> dict:
+    """
+    Render the plots of every analysis concurrently; returns {analysis: PNG path or None}.
 
-    return {
-        "test_result": test_result,
-        "interpretation": interpretation,
-        "visualization": visualization
-    }
+    Each plot builds its own Figure on an Agg canvas (no pyplot state), so
+    figures can be drawn in parallel threads. Files are named after their
+    analysis, so plots of the same kind (t-test and group comparison box
+    plots) never overwrite each other.
+    """
+    pending = {name: plot for name, plot in plots.items() if plot}
+    paths = {name: None for name in plots}
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(len(pending), PLOT_WORKERS)) as pool:
+            futures = {name: pool.submit(plot[0], *plot[1:], context, name) for name, plot in pending.items()}
+            paths.update({name: future.result() for name, future in futures.items()})
+    return paths
 
 
-def compute_descriptive_stats(df: pd.DataFrame) -> dict:
-    """Compute descriptive statistics for all numeric columns"""
-    numeric_df = df.select_dtypes(include=[np.number])
+def compute_descriptive_stats(shared: SharedFrame) -> dict:
+    """Compute descriptive statistics for all numeric columns (streamed for reference tables)"""
+    summary = shared.summary
 
-    if numeric_df.empty:
+    if summary.empty:
         raise ValueError("No numeric columns found in data")
 
     stats_dict = {
-        "summary": numeric_df.describe().to_dict(),
-        "columns": numeric_df.columns.tolist(),
-        "row_count": len(df)
+        "summary": summary.to_dict(),
+        "columns": summary.columns.tolist(),
+        "row_count": shared.row_count
     }
 
+    if shared.online_stats is not None:
+        # Moments are exact; quartiles come from mergeable KLL sketches
+        stats_dict["streamed"] = True
+        stats_dict["quantiles_approximate"] = True
+        stats_dict["quantile_rank_error"] = round(shared.online_stats.rank_error, 4)
+
     return stats_dict
 
 
-def compute_correlation(df: pd.DataFrame, variables: list) -> dict:
-    """Compute correlation matrix (Pearson)"""
+def compute_correlation(
+    df: pd.DataFrame,
+    variables: list,
+    methods=CORRELATION_METHODS,
+    alpha: float = 0.05,
+    kendall_max_rows: int | None = KENDALL_MAX_ROWS
+) -> dict:
+    """
+    Compute correlation and p-value matrices for each method.
+
+    Missing values are handled pairwise. Significant pairs are those whose
+    Benjamini-Hochberg adjusted p-value is below `alpha` (each method is its
+    own family of tests). Kendall on tables longer than `kendall_max_rows`
+    (0 or None: never) is estimated on a row sample and flagged as such.
+    """
     subset = df[variables]
 
     # Remove non-numeric columns
     subset = subset.select_dtypes(include=[np.number])
 
-    corr_matrix = subset.corr(method="pearson")
-
-    return {
-        "method": "Pearson",
-        "correlation_matrix": corr_matrix.to_dict(),
-        "variables": variables,
-        "significant_correlations": find_significant_correlations(corr_matrix)
+    matrices = correlation_matrices(subset, methods, kendall_max_rows=kendall_max_rows)
+    significant, adjusted = significant_pairs(matrices, alpha=alpha, p_adjust="fdr_bh")
+    primary = next(iter(matrices))
+
+    result = {
+        "method": primary.title(),
+        "methods": list(matrices),
+        "correlation_matrix": matrices[primary]["r"].to_dict(),
+        "correlation_matrices": {method: matrix["r"].to_dict() for method, matrix in matrices.items()},
+        "p_value_matrices": {method: matrix["p"].to_dict() for method, matrix in matrices.items()},
+        "adjusted_p_value_matrices": {method: matrix.to_dict() for method, matrix in adjusted.items()},
+        "pair_counts": matrices[primary]["n"].to_dict(),
+        "pair_count_matrices": {method: matrix["n"].to_dict() for method, matrix in matrices.items()},
+        "p_adjust": "fdr_bh",
+        "alpha": alpha,
+        "variables": subset.columns.tolist(),
+        "significant_correlations": significant
     }
+    if matrices.get("kendall", {}).get("sampled"):
+        kendall = matrices["kendall"]
+        result["kendall_rows_used"] = kendall["rows_used"]
+        result["kendall_sampling"] = {
+            "sampled": True,
+            "rows_used": kendall["rows_used"],
+            "total_rows": kendall["total_rows"],
+            "note": (
+                f"Kendall coefficients and p-values were computed on a random sample of "
+                f"{kendall['rows_used']} of {kendall['total_rows']} rows"
+            )
+        }
+    return result
+
+
+def compute_t_test(df: pd.DataFrame, dependent_var: str, group_col: str, variables: dict | None = None) -> dict:
+    """
+    Perform independent t-test between two groups
 
+    Group statistics come from one groupby pass. More than two groups are
+    compared with `compute_group_comparison` instead.
+    """
+    summary = group_summaries(df, dependent_var, group_col)
 
-def find_significant_correlations(corr_matrix: pd.DataFrame, threshold: float = 0.5) -> list:
-    """Find variable pairs with correlation > threshold"""
-    significant = []
-
-    for i in range(len(corr_matrix.columns)):
-        for j in range(i + 1, len(corr_matrix.columns)):
-            var1 = corr_matrix.columns[i]
-            var2 = corr_matrix.columns[j]
-            corr_value = corr_matrix.iloc[i, j]
-
-            if abs(corr_value) >= threshold:
-                significant.append({
-                    "var1": var1,
-                    "var2": var2,
-                    "correlation": float(corr_value),
-                    "strength": "strong" if abs(corr_value) >= 0.7 else "moderate"
-                })
-
-    return significant
-
-
-def compute_t_test(df: pd.DataFrame, dependent_var: str, group_col: str) -> dict:
-    """Perform independent t-test between two groups"""
-    groups = df[group_col].unique()
-
-    if len(groups) != 2:
-        raise ValueError(f"T-test requires exactly 2 groups, found {len(groups)}")
+    if len(summary) > 2:
+        return compute_group_comparison(df, dependent_var, group_col, variables or {})
+    if len(summary) != 2:
+        raise ValueError(f"T-test requires exactly 2 groups, found {len(summary)}")
 
-    group1_data = df[df[group_col] == groups[0]][dependent_var].dropna()
-    group2_data = df[df[group_col] == groups[1]][dependent_var].dropna()
+    (name1, group1), (name2, group2) = summary.iterrows()
+    std1, std2 = np.sqrt(group1["var"]), np.sqrt(group2["var"])
+    n1, n2 = group1["count"], group2["count"]
 
-    # Perform t-test
-    statistic, p_value = stats.ttest_ind(group1_data, group2_data)
+    # Perform t-test (Student's, plus Welch's for unequal variances)
+    statistic, p_value = stats.ttest_ind_from_stats(group1["mean"], std1, n1, group2["mean"], std2, n2)
+    welch_statistic, welch_p_value = stats.ttest_ind_from_stats(
+        group1["mean"], std1, n1, group2["mean"], std2, n2, equal_var=False
+    )
 
     # Compute effect size (Cohen's d)
-    mean_diff = group1_data.mean() - group2_data.mean()
-    pooled_std = np.sqrt(((len(group1_data) - 1) * group1_data.std() ** 2 +
-                           (len(group2_data) - 1) * group2_data.std() ** 2) /
-                          (len(group1_data) + len(group2_data) - 2))
+    mean_diff = group1["mean"] - group2["mean"]
+    pooled_std = np.sqrt(((n1 - 1) * std1 ** 2 + (n2 - 1) * std2 ** 2) / (n1 + n2 - 2))
     cohens_d = mean_diff / pooled_std if pooled_std != 0 else 0
 
     return {
@@ -186,51 +428,186 @@ def compute_t_test(df: pd.DataFrame, dependent_var: str, group_col: str) -> dict
         "dependent_variable": dependent_var,
         "group_variable": group_col,
         "groups": {
-            str(groups[0]): {
-                "mean": float(group1_data.mean()),
-                "std": float(group1_data.std()),
-                "n": int(len(group1_data))
+            str(name1): {
+                "mean": float(group1["mean"]),
+                "std": float(std1),
+                "n": int(n1)
             },
-            str(groups[1]): {
-                "mean": float(group2_data.mean()),
-                "std": float(group2_data.std()),
-                "n": int(len(group2_data))
+            str(name2): {
+                "mean": float(group2["mean"]),
+                "std": float(std2),
+                "n": int(n2)
             }
         },
         "t_statistic": float(statistic),
         "p_value": float(p_value),
+        "welch_t_statistic": float(welch_statistic),
+        "welch_p_value": float(welch_p_value),
         "cohens_d": float(cohens_d),
         "significant": p_value < 0.05
     }
 
 
-def compute_normality_test(df: pd.DataFrame, variable: str) -> dict:
-    """Perform Shapiro-Wilk normality test"""
+def compute_group_comparison(df: pd.DataFrame, dependent_var: str, group_col: str, variables: dict) -> dict:
+    """
+    Compare two or more groups with ANOVA, Welch's ANOVA and Kruskal-Wallis.
+
+    All group statistics (counts, means, variances, mean ranks) come from
+    one groupby pass, so the cost stays linear in the row count for any
+    number of groups. Pairwise post-hoc tests (Welch t-tests, or Dunn's
+    test with `post_hoc: "dunn"`) are adjusted with Holm by default
+    (`p_adjust: "fdr_bh"` for false discovery rate).
+    """
+    alpha = variables.get("alpha") or 0.05
+    post_hoc = variables.get("post_hoc") or "welch_t"
+    p_adjust = variables.get("p_adjust") or "holm"
+
+    summary = group_summaries(df, dependent_var, group_col, ranks=True)
+    if len(summary) < 2:
+        raise ValueError(f"Group comparison requires at least 2 groups, found {len(summary)}")
+    if (summary["count"] < 2).any():
+        raise ValueError("Group comparison requires at least 2 values in every group")
+
+    values = df.loc[df[group_col].notna(), dependent_var].dropna()
+    anova = one_way_anova(summary)
+    welch = welch_anova(summary)
+    kruskal = kruskal_wallis(summary, values)
+    pairs = pairwise_tests(summary, post_hoc, p_adjust, values)
+
+    return {
+        "test": "Group Comparison",
+        "dependent_variable": dependent_var,
+        "group_variable": group_col,
+        "group_count": int(len(summary)),
+        "groups": {
+            str(name): {
+                "mean": float(group["mean"]),
+                "std": float(np.sqrt(group["var"])),
+                "n": int(group["count"]),
+                "mean_rank": float(group["mean_rank"])
+            }
+            for name, group in summary.iterrows()
+        },
+        "anova": anova,
+        "welch_anova": welch,
+        "kruskal_wallis": kruskal,
+        "post_hoc": {
+            "method": post_hoc,
+            "p_adjust": p_adjust,
+            "pairs": pairs,
+            "significant_pairs": [pair for pair in pairs if pair["adjusted_p_value"] < alpha]
+        },
+        "alpha": alpha,
+        # Welch's ANOVA does not assume equal variances across groups
+        "p_value": welch["p_value"],
+        "significant": welch["p_value"] < alpha
+    }
+
+
+def compute_normality_test(df: pd.DataFrame, variable: str, **test_options) -> dict:
+    """Test one variable for normality (the test is chosen by sample size unless given)"""
     data = df[variable].dropna()
 
     if len(data) < 3:
         raise ValueError("Normality test requires at least 3 data points")
 
-    statistic, p_value = stats.shapiro(data)
+    result = normality_tests(df[[variable]].astype(float), **test_options)[variable]
+    if "error" in result:
+        raise ValueError(f"Normality test failed: {result['error']}")
 
     return {
-        "test": "Shapiro-Wilk Normality Test",
+        **result,
+        "test": f"{result['test']} Normality Test",
         "variable": variable,
-        "statistic": float(statistic),
-        "p_value": float(p_value),
-        "is_normal": p_value >= 0.05,
-        "sample_size": int(len(data)),
         "mean": float(data.mean()),
         "std": float(data.std())
     }
 
 
-def create_correlation_heatmap(df: pd.DataFrame, variables: list, context: Context) -> str:
-    """Create correlation heatmap visualization"""
-    subset = df[variables].select_dtypes(include=[np.number])
-    corr_matrix = subset.corr()
+def compute_normality_tests(
+    df: pd.DataFrame,
+    variables: list,
+    shared: SharedFrame | None = None,
+    **test_options
+) -> dict:
+    """Test several variables for normality in one batched call (moments from the shared summary)"""
+    shared = shared or SharedFrame(df=df)
+    results = normality_tests(df[variables].astype(float), **test_options)
+    for variable, result in results.items():
+        if "error" not in result:
+            result["mean"] = float(shared.summary.at["mean", variable])
+            result["std"] = float(shared.summary.at["std", variable])
+
+    return {
+        "test": "Normality Tests",
+        "variables": variables,
+        "alpha": test_options.get("alpha", 0.05),
+        "results": results,
+        "non_normal_variables": [
+            variable for variable, result in results.items() if result.get("is_normal") is False
+        ]
+    }
+
+
+def mark_approximate(test_result: dict, shared: SharedFrame, sampling: dict, variables: dict) -> dict:
+    """Add estimated population counts and the sampling details to a result computed on a sample"""
+    result = {
+        **test_result,
+        "approximate": True,
+        "sampling_note": sampling_note(sampling),
+        "sampling": {key: value for key, value in sampling.items() if key != "strata"},
+        "estimated_population_rows": sampling["population_row_count"],
+    }
+
+    if "summary" in result:
+        result["estimated_counts"] = {
+            col: scale_count(int(col_stats["count"]), sampling)
+            for col, col_stats in result["summary"].items()
+        }
+
+    if "groups" in result:
+        # Stratified samples weigh each group by its strata (summed in one groupby)
+        df = shared.df
+        weights = pd.Series(row_weights(df, sampling), index=df.index)
+        group_col, dependent_var = variables["group_column"], variables["dependent"]
+        observed = df[dependent_var].notna()
+        group_weights = weights[observed].groupby(df.loc[observed, group_col].astype(str)).sum()
+        result["groups"] = {
+            name: {
+                **group,
+                "estimated_population_n": int(round(group_weights.get(name, 0.0)))
+            }
+            for name, group in result["groups"].items()
+        }
+
+    if "sample_size" in result:
+        result["estimated_population_n"] = scale_count(
+            result.get("population_size", result["sample_size"]), sampling
+        )
+
+    if "results" in result:
+        result["results"] = {
+            variable: {
+                **column_result,
+                "estimated_population_n": scale_count(
+                    column_result.get("population_size", column_result["sample_size"]), sampling
+                )
+            }
+            for variable, column_result in result["results"].items()
+        }
+
+    return result
+
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+def create_correlation_heatmap(
+    corr_matrix: pd.DataFrame,
+    method: str,
+    context: Context,
+    analysis: str = "correlation"
+) -> str:
+    """Create correlation heatmap visualization from a computed matrix"""
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
     im = ax.imshow(corr_matrix, cmap='RdBu_r', vmin=-1, vmax=1, aspect='auto')
 
     # Set ticks
@@ -240,66 +617,105 @@ def create_correlation_heatmap(df: pd.DataFrame, variables: list, context: Conte
     ax.set_yticklabels(corr_matrix.columns)
 
     # Add colorbar
-    plt.colorbar(im, ax=ax)
-
-    # Add correlation values
-    for i in range(len(corr_matrix.columns)):
-        for j in range(len(corr_matrix.columns)):
-            text = ax.text(j, i, f'{corr_matrix.iloc[i, j]:.2f}',
-                          ha="center", va="center", color="black", fontsize=9)
+    fig.colorbar(im, ax=ax)
 
-    ax.set_title("Correlation Matrix")
-    plt.tight_layout()
+    # Add correlation values (unreadable beyond a few dozen cells per side)
+    if len(corr_matrix.columns) <= HEATMAP_ANNOTATION_LIMIT:
+        for i in range(len(corr_matrix.columns)):
+            for j in range(len(corr_matrix.columns)):
+                ax.text(j, i, f'{corr_matrix.iloc[i, j]:.2f}',
+                        ha="center", va="center", color="black", fontsize=9)
 
-    # Save to PNG file
-    output_path = f"{context.session_dir}/correlation_heatmap.png"
-    plt.savefig(output_path, format='png', dpi=150, bbox_inches='tight')
+    ax.set_title(f"Correlation Matrix ({method})")
 
-    # Show for preview
-    plt.show()
-    plt.close()
-
-    return output_path
+    return save_figure(fig, f"{analysis}_heatmap.png", context)
 
 
-def create_box_plot(df: pd.DataFrame, dependent_var: str, group_col: str, context: Context) -> str:
-    """Create box plot for group comparison"""
-    fig, ax = plt.subplots(figsize=(8, 6))
+def create_box_plot(
+    df: pd.DataFrame,
+    dependent_var: str,
+    group_col: str,
+    context: Context,
+    analysis: str = "group_comparison"
+) -> str:
+    """Create box plot for group comparison (the largest groups when there are many)"""
+    box_stats, group_count = box_plot_stats(df, dependent_var, group_col, BOX_PLOT_GROUP_LIMIT)
 
-    groups = df[group_col].unique()
-    data_by_group = [df[df[group_col] == g][dependent_var].dropna() for g in groups]
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
 
-    ax.boxplot(data_by_group, labels=groups)
+    # Boxes are drawn from precomputed statistics, not from the raw values
+    ax.bxp(box_stats, showfliers=False)
+    if len(box_stats) > 8:
+        ax.tick_params(axis='x', labelrotation=90)
     ax.set_xlabel(group_col)
     ax.set_ylabel(dependent_var)
-    ax.set_title(f'{dependent_var} by {group_col}')
+    title = f'{dependent_var} by {group_col}'
+    if group_count > len(box_stats):
+        title += f' (largest {len(box_stats)} groups)'
+    ax.set_title(title)
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    # Save to PNG file
-    output_path = f"{context.session_dir}/box_plot.png"
-    plt.savefig(output_path, format='png', dpi=150, bbox_inches='tight')
+    return save_figure(fig, f"{analysis}_box_plot.png", context)
 
-    # Show for preview
-    plt.show()
-    plt.close()
-
-    return output_path
 
+def box_plot_stats(df: pd.DataFrame, value_col: str, group_col: str, limit: int) -> tuple[list, int]:
+    """
+    Box statistics (quartiles, 1.5 IQR whiskers) of the `limit` largest groups.
 
-def create_distribution_plot(df: pd.DataFrame, variable: str, context: Context) -> str:
+    Rows are grouped once by factorized group codes; each group's quartiles
+    and whiskers come from NumPy over its contiguous slice. Returns (stats
+    in the format of `Axes.bxp`, total number of groups).
+    """
+    data = df[[group_col, value_col]].dropna()
+    codes, names = pd.factorize(data[group_col])
+    values = data[value_col].to_numpy(dtype=float)
+    counts = np.bincount(codes, minlength=len(names))
+
+    kept = np.sort(np.argsort(-counts, kind="stable")[:limit])
+    order = np.argsort(codes, kind="stable")
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+
+    box_stats = []
+    for code in kept:
+        group_values = values[order[bounds[code]:bounds[code + 1]]]
+        q1, med, q3 = np.quantile(group_values, [0.25, 0.5, 0.75])
+        # Whiskers reach the most extreme values within 1.5 IQR of the box
+        iqr = q3 - q1
+        within = group_values[(group_values >= q1 - 1.5 * iqr) & (group_values <= q3 + 1.5 * iqr)]
+        box_stats.append({
+            "label": str(names[code]),
+            "q1": q1,
+            "med": med,
+            "q3": q3,
+            "whislo": within.min(),
+            "whishi": within.max(),
+        })
+    return box_stats, len(names)
+
+
+def create_distribution_plot(
+    df: pd.DataFrame,
+    variable: str,
+    context: Context,
+    analysis: str = "normality_test"
+) -> str:
     """Create histogram with normal distribution overlay"""
-    data = df[variable].dropna()
+    data = df[variable].dropna().to_numpy(dtype=float)
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+    # Bin once with NumPy; drawing 30 bars costs the same for any row count
+    density, edges = np.histogram(data, bins=HISTOGRAM_BINS, density=True)
+    mu, sigma = data.mean(), data.std(ddof=1)
+
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
 
     # Histogram
-    ax.hist(data, bins=30, density=True, alpha=0.7, color='steelblue', edgecolor='black')
+    ax.stairs(density, edges, fill=True, alpha=0.7, color='steelblue')
+    ax.stairs(density, edges, color='black', linewidth=0.5)
 
     # Overlay normal distribution
-    mu, sigma = data.mean(), data.std()
-    x = np.linspace(data.min(), data.max(), 100)
+    x = np.linspace(edges[0], edges[-1], 100)
     ax.plot(x, stats.norm.pdf(x, mu, sigma), 'r-', linewidth=2, label='Normal Distribution')
 
     ax.set_xlabel(variable)
@@ -308,27 +724,36 @@ def create_distribution_plot(df: pd.DataFrame, variable: str, context: Context)
     ax.legend()
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    # Save to PNG file
-    output_path = f"{context.session_dir}/distribution_plot.png"
-    plt.savefig(output_path, format='png', dpi=150, bbox_inches='tight')
+    return save_figure(fig, f"{analysis}_distribution_plot.png", context)
 
-    # Show for preview
-    plt.show()
-    plt.close()
 
+def save_figure(fig: Figure, filename: str, context: Context) -> str:
+    """Render a figure with the Agg canvas and save it as PNG in the session directory"""
+    FigureCanvasAgg(fig)
+    fig.tight_layout()
+    output_path = f"{context.session_dir}/{filename}"
+    fig.savefig(output_path, format='png', dpi=PLOT_DPI, bbox_inches='tight')
     return output_path
 
 
-async def generate_interpretation(
-    analysis_type: str,
-    test_result: dict,
-    llm: dict,
-    context: Context
-) -> str:
-    """Generate AI interpretation of statistical results"""
+def preview_plots(paths: list, context: Context) -> None:
+    """Show the rendered PNGs in the block preview"""
+    images = []
+    for path in paths:
+        with open(path, "rb") as f:
+            images.append(f"data:image/png;base64,{base64.b64encode(f.read()).decode()}")
+
+    if len(images) == 1:
+        context.preview({"type": "image", "data": images[0]})
+    elif images:
+        context.preview({
+            "type": "html",
+            "data": "".join(f'<img src="{image}" style="max-width:100%">' for image in images)
+        })
+
 
+def analysis_prompt(analysis_type: str, test_result: dict) -> str:
+    """Prompt section interpreting one analysis result"""
     # Build prompt based on analysis type
     if analysis_type == "descriptive_stats":
         prompt = f"""Interpret these descriptive statistics:
@@ -341,14 +766,46 @@ Provide a concise summary (2-3 sentences) highlighting:
 3. Any notable patterns or outliers"""
 
     elif analysis_type == "correlation":
-        prompt = f"""Interpret this correlation analysis:
-
-{json.dumps(test_result, indent=2)}
+        # The full matrices grow with the square of the column count
+        summary = {
+            key: value for key, value in test_result.items()
+            if not key.endswith("_matrix") and not key.endswith("_matrices") and key != "pair_counts"
+        }
+        summary["significant_correlations"] = test_result["significant_correlations"][:PROMPT_CORRELATION_LIMIT]
+        summary["significant_pair_count"] = len(test_result["significant_correlations"])
+        sampled_note = ""
+        if "kendall_sampling" in test_result:
+            sampled_note = f"\nNote: {test_result['kendall_sampling']['note']}. Say that the Kendall results are estimates from that sample.\n"
+        prompt = f"""Interpret this correlation analysis (significant pairs have FDR-adjusted p-values below alpha, strongest first):
+
+{json.dumps(summary, indent=2, default=str)}
 
 Provide a concise interpretation (2-3 sentences) including:
 1. Strength and direction of significant correlations
 2. What these relationships might indicate
-3. Any notable patterns"""
+3. Any notable patterns{sampled_note}"""
+
+    elif test_result.get("test") == "Group Comparison":
+        # Also t-tests over more than 2 groups; pair lists grow with the square of the group count
+        summary = {key: value for key, value in test_result.items() if key != "post_hoc"}
+        post_hoc = test_result["post_hoc"]
+        summary["post_hoc"] = {
+            "method": post_hoc["method"],
+            "p_adjust": post_hoc["p_adjust"],
+            "pair_count": len(post_hoc["pairs"]),
+            "significant_pair_count": len(post_hoc["significant_pairs"]),
+            "strongest_significant_pairs": sorted(
+                post_hoc["significant_pairs"], key=lambda pair: abs(pair["statistic"]), reverse=True
+            )[:PROMPT_POST_HOC_LIMIT]
+        }
+        prompt = f"""Interpret this group comparison:
+
+{json.dumps(summary, indent=2, default=str)}
+
+Provide a concise interpretation (3-4 sentences) including:
+1. Whether the groups differ overall (Welch's ANOVA; Kruskal-Wallis if the data are skewed)
+2. How much of the variation the groups explain (eta squared)
+3. Which pairs of groups differ after the multiple-comparison correction"""
 
     elif analysis_type == "t_test":
         prompt = f"""Interpret this t-test result:
@@ -368,11 +825,50 @@ Provide a concise interpretation (2-3 sentences) including:
 Provide a concise interpretation (2-3 sentences) including:
 1. Whether data is normally distributed (p-value >= 0.05)
 2. Implications for further analysis
-3. Recommendations if non-normal"""
+3. Recommendations if non-normal
+
+On very large samples tiny deviations are significant; weigh skewness and excess kurtosis for practical relevance."""
 
     else:
         prompt = f"Interpret these statistical results:\n\n{json.dumps(test_result, indent=2)}"
 
+    return prompt
+
+
+async def generate_interpretation(
+    analysis_type: str,
+    test_result: dict,
+    llm: dict,
+    context: Context
+) -> str:
+    """Generate AI interpretation of statistical results ("all": one prompt covering every analysis)"""
+
+    if analysis_type == "all":
+        sections = [
+            f"## {name.replace('_', ' ').title()}\n\n{analysis_prompt(name, result)}"
+            for name, result in test_result["analyses"].items()
+            if "error" not in result
+        ]
+        skipped = [
+            f"- {name.replace('_', ' ').title()}: {result['error']}"
+            for name, result in test_result["analyses"].items()
+            if "error" in result
+        ]
+        prompt = (
+            "The following analyses were run on the same table. Interpret each section as asked, "
+            "then add 1-2 sentences on how the results relate to each other.\n\n"
+            + "\n\n".join(sections)
+        )
+        if skipped:
+            prompt += "\n\nThese analyses could not be run on this table (mention briefly):\n" + "\n".join(skipped)
+    else:
+        prompt = analysis_prompt(analysis_type, test_result)
+
+    if test_result.get("approximate"):
+        prompt += f"""
+
+Note: {test_result["sampling_note"]}. Say that the results are approximate estimates from a sample."""
+
     # Call LLM
     client = OpenAI(
         base_url=context.oomol_llm_env.get("base_url_v1"),
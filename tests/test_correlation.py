@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from data_insight.correlation import correlation_matrices, significant_pairs
+from data_insight.multiple_testing import adjust_p_values
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=300)
+    return pd.DataFrame({
+        "x": x,
+        "y": 0.6 * x + rng.normal(size=300),
+        "z": rng.exponential(size=300),
+        "w": np.round(rng.normal(size=300), 1),  # ties
+    })
+
+
+@pytest.fixture
+def frame_with_gaps(frame) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    return frame.mask(rng.random(frame.shape) < 0.1)
+
+
+def pairwise_reference(df, a, b, test):
+    both = df[[a, b]].dropna()
+    return test(both[a], both[b]), len(both)
+
+
+@pytest.mark.parametrize("data", ["frame", "frame_with_gaps"])
+@pytest.mark.parametrize("method,test", [
+    ("pearson", stats.pearsonr),
+    ("spearman", stats.spearmanr),
+])
+def test_pearson_spearman_match_pandas_and_scipy(request, data, method, test):
+    df = request.getfixturevalue(data)
+    result = correlation_matrices(df, [method])[method]
+
+    pd.testing.assert_frame_equal(result["r"], df.corr(method=method), atol=1e-10)
+    for a, b in [("x", "y"), ("x", "z"), ("y", "w")]:
+        reference, n = pairwise_reference(df, a, b, test)
+        assert result["n"].loc[a, b] == n
+        assert result["r"].loc[a, b] == pytest.approx(reference.statistic, rel=1e-9)
+        assert result["p"].loc[a, b] == pytest.approx(reference.pvalue, rel=1e-6)
+
+
+def test_spearman_matches_scipy_nan_policy_omit(frame_with_gaps):
+    result = correlation_matrices(frame_with_gaps, ["spearman"])["spearman"]
+    reference = stats.spearmanr(frame_with_gaps["x"], frame_with_gaps["z"], nan_policy="omit")
+    assert result["r"].loc["x", "z"] == pytest.approx(reference.statistic, rel=1e-9)
+
+
+@pytest.mark.parametrize("data", ["frame", "frame_with_gaps"])
+def test_kendall_matches_scipy(request, data):
+    df = request.getfixturevalue(data)
+    result = correlation_matrices(df, ["kendall"])["kendall"]
+
+    pd.testing.assert_frame_equal(result["r"], df.corr(method="kendall"), atol=1e-10)
+    both = df[["x", "y"]].dropna()
+    reference = stats.kendalltau(both["x"], both["y"], method="asymptotic")
+    assert result["p"].loc["x", "y"] == pytest.approx(reference.pvalue, rel=1e-6)
+
+
+def test_kendall_samples_long_tables():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(rng.normal(size=(3000, 3)), columns=list("abc"))
+    result = correlation_matrices(df, ["kendall"], seed=5)["kendall"]
+    assert result["sampled"] is True
+    assert result["rows_used"] == 1000
+    assert result["total_rows"] == 3000
+    assert result["n"].loc["a", "b"] == 1000
+
+    pairs, _ = significant_pairs({"kendall": result}, alpha=1.0)
+    assert all(pair["sampled"] and pair["rows_used"] == 1000 for pair in pairs)
+
+    exact = correlation_matrices(df.head(1500), ["kendall"], kendall_max_rows=None)["kendall"]
+    assert "sampled" not in exact
+    assert exact["n"].loc["a", "b"] == 1500
+
+
+def test_significant_pairs(frame):
+    matrices = correlation_matrices(frame, ["pearson"])
+    pairs, adjusted = significant_pairs(matrices, alpha=0.05)
+
+    assert [(pair["var1"], pair["var2"]) for pair in pairs] == [("x", "y")]
+    assert pairs[0]["strength"] == "moderate"
+    assert pairs[0]["adjusted_p_value"] == adjusted["pearson"].loc["x", "y"]
+    assert np.isnan(adjusted["pearson"].loc["y", "x"])
+
+
+def test_adjust_p_values_known_vectors():
+    p = [0.01, 0.04, 0.03, 0.005]
+    np.testing.assert_allclose(adjust_p_values(p, "fdr_bh"), [0.02, 0.04, 0.04, 0.02])
+    np.testing.assert_allclose(adjust_p_values(p, "holm"), [0.03, 0.06, 0.06, 0.02])
+
+
+def test_adjust_p_values_matches_scipy_bh():
+    p = np.random.default_rng(3).uniform(size=200) ** 3
+    np.testing.assert_allclose(adjust_p_values(p, "fdr_bh"), stats.false_discovery_control(p))
+
+
+def test_adjust_p_values_keeps_shape_and_nans():
+    p = np.array([[0.01, np.nan], [0.5, 0.02]])
+    adjusted = adjust_p_values(p, "holm")
+    assert adjusted.shape == p.shape
+    assert np.isnan(adjusted[0, 1])
+    # Family of three valid p-values
+    np.testing.assert_allclose(adjusted[~np.isnan(p)], [0.03, 0.5, 0.04])
+
+    with pytest.raises(ValueError):
+        adjust_p_values(p, "bonferroni")
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from data_insight.dtype_optimizer import is_low_cardinality_string, optimize_dtypes
+
+
+def test_report_matches_measured_memory():
+    df = pd.DataFrame({
+        "amount": np.arange(1000, dtype=np.float64),
+        "city": [f"city{i % 3}" for i in range(1000)],
+        "count": pd.Series([1.0, np.nan] * 500),
+    })
+    optimized, report = optimize_dtypes(df)
+
+    assert report["bytes_before"] == df.memory_usage(deep=True).sum()
+    assert report["bytes_after"] == optimized.memory_usage(deep=True).sum()
+    assert report["bytes_saved"] == report["bytes_before"] - report["bytes_after"]
+    assert optimized["city"].dtype == "category"
+    assert str(optimized["count"].dtype) == "UInt8"
+    pd.testing.assert_frame_equal(optimized.astype({"city": "str"}), df, check_dtype=False)
+
+
+def test_category_ratio_threshold():
+    repeated = pd.Series(["a", "b"] * 50, dtype=object)
+    distinct = pd.Series([f"value{i}" for i in range(100)], dtype=object)
+
+    assert is_low_cardinality_string(repeated, 0.5)
+    assert not is_low_cardinality_string(distinct, 0.5)
+    assert not is_low_cardinality_string(repeated, 0.01)
+
+
+def test_mixed_object_columns_are_not_categorized():
+    mixed = pd.Series([1, "a", 2.5] * 50, dtype=object)
+    assert not is_low_cardinality_string(mixed, 0.5)
+
+    optimized, report = optimize_dtypes(pd.DataFrame({"mixed": mixed}))
+    assert optimized["mixed"].dtype == object
+    assert report["columns"] == {}
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from data_insight.file_readers import read_jsonl_file
+from data_insight.incremental_load import read_new_file_rows
+
+
+@pytest.fixture
+def jsonl_path(tmp_path):
+    path = tmp_path / "events.jsonl"
+    # "extra" only appears in a later chunk
+    path.write_text(
+        '{"id": 1, "value": 10}\n'
+        '{"id": 2, "value": 20}\n'
+        '{"id": 3, "value": 30, "extra": "x"}\n'
+    )
+    return str(path)
+
+
+def test_jsonl_projection(jsonl_path):
+    df = read_jsonl_file(jsonl_path, columns=["value", "extra"], chunk_rows=2)
+    assert df.columns.tolist() == ["value", "extra"]
+    assert df["value"].tolist() == [10, 20, 30]
+    assert df["extra"].isna().tolist() == [True, True, False]
+
+
+def test_jsonl_projection_rejects_unknown_columns(jsonl_path):
+    with pytest.raises(ValueError, match="valeu"):
+        read_jsonl_file(jsonl_path, columns=["id", "valeu"], chunk_rows=2)
+
+
+def test_incremental_jsonl_rejects_unknown_columns(jsonl_path):
+    with pytest.raises(ValueError, match="valeu"):
+        read_new_file_rows(jsonl_path, "jsonl", None, ["valeu"])
+
+    df, _, full = read_new_file_rows(jsonl_path, "jsonl", None, ["value"])
+    assert full and df["value"].tolist() == [10, 20, 30]
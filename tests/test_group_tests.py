@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from data_insight.group_tests import (
+    group_summaries,
+    kruskal_wallis,
+    one_way_anova,
+    pairwise_tests,
+    welch_anova,
+)
+from data_insight.multiple_testing import adjust_p_values
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    sizes = {"a": 40, "b": 60, "c": 25, "d": 80}
+    parts = [
+        pd.DataFrame({"group": name, "value": rng.normal(loc=i * 0.3, scale=1 + i, size=n)})
+        for i, (name, n) in enumerate(sizes.items())
+    ]
+    df = pd.concat(parts, ignore_index=True)
+    df.loc[[3, 70], "value"] = np.nan
+    return df.sample(frac=1, random_state=1, ignore_index=True)
+
+
+def samples(df):
+    data = df.dropna()
+    return {name: values.to_numpy() for name, values in data.groupby("group", sort=False)["value"]}
+
+
+def test_group_summaries(frame):
+    summary = group_summaries(frame, "value", "group", ranks=True)
+    groups = samples(frame)
+
+    assert summary.index.tolist() == list(groups)
+    for name, values in groups.items():
+        assert summary.loc[name, "count"] == len(values)
+        assert summary.loc[name, "mean"] == pytest.approx(values.mean())
+        assert summary.loc[name, "var"] == pytest.approx(values.var(ddof=1))
+
+
+def test_one_way_anova_matches_scipy(frame):
+    result = one_way_anova(group_summaries(frame, "value", "group"))
+    reference = stats.f_oneway(*samples(frame).values())
+    assert result["f_statistic"] == pytest.approx(reference.statistic)
+    assert result["p_value"] == pytest.approx(reference.pvalue)
+    assert 0 < result["eta_squared"] < 1
+
+
+def test_welch_anova_matches_scipy(frame):
+    groups = list(samples(frame).values())
+    result = welch_anova(group_summaries(frame, "value", "group"))
+
+    reference = stats.f_oneway(*groups, equal_var=False)
+    assert result["f_statistic"] == pytest.approx(reference.statistic)
+    assert result["p_value"] == pytest.approx(reference.pvalue)
+    # Alexander-Govern tests the same hypothesis under unequal variances
+    assert result["p_value"] == pytest.approx(stats.alexandergovern(*groups).pvalue, rel=0.5)
+
+
+def test_kruskal_wallis_matches_scipy(frame):
+    # Rounded values create ties
+    frame = frame.assign(value=frame["value"].round(1))
+    data = frame.dropna()
+    summary = group_summaries(frame, "value", "group", ranks=True)
+    result = kruskal_wallis(summary, data["value"])
+
+    reference = stats.kruskal(*samples(frame).values())
+    assert result["h_statistic"] == pytest.approx(reference.statistic)
+    assert result["p_value"] == pytest.approx(reference.pvalue)
+    assert result["df"] == 3
+
+
+@pytest.mark.parametrize("p_adjust", ["holm", "fdr_bh"])
+def test_pairwise_welch_t(frame, p_adjust):
+    groups = samples(frame)
+    pairs = pairwise_tests(group_summaries(frame, "value", "group"), "welch_t", p_adjust)
+
+    names = list(groups)
+    assert [(pair["group1"], pair["group2"]) for pair in pairs] == [
+        (names[i], names[j]) for i in range(len(names)) for j in range(i + 1, len(names))
+    ]
+    raw = []
+    for pair in pairs:
+        reference = stats.ttest_ind(groups[pair["group1"]], groups[pair["group2"]], equal_var=False)
+        assert pair["statistic"] == pytest.approx(reference.statistic)
+        assert pair["p_value"] == pytest.approx(reference.pvalue)
+        assert pair["difference"] == pytest.approx(groups[pair["group1"]].mean() - groups[pair["group2"]].mean())
+        raw.append(reference.pvalue)
+    np.testing.assert_allclose([pair["adjusted_p_value"] for pair in pairs], adjust_p_values(raw, p_adjust))
+
+
+def test_pairwise_dunn(frame):
+    data = frame.dropna()
+    summary = group_summaries(frame, "value", "group", ranks=True)
+    pairs = pairwise_tests(summary, "dunn", "holm", data["value"])
+
+    # Continuous values: no ties, so the textbook formula applies directly
+    ranks = pd.Series(stats.rankdata(data["value"]), index=data.index).groupby(data["group"])
+    total = len(data)
+    for pair in pairs:
+        first, second = ranks.get_group(pair["group1"]), ranks.get_group(pair["group2"])
+        z = (first.mean() - second.mean()) / np.sqrt(total * (total + 1) / 12 * (1 / len(first) + 1 / len(second)))
+        assert pair["statistic"] == pytest.approx(z)
+        assert pair["p_value"] == pytest.approx(2 * stats.norm.sf(abs(z)))
+        assert pair["p_value"] <= pair["adjusted_p_value"] <= 1
+
+    with pytest.raises(ValueError):
+        pairwise_tests(summary, "dunn")
+    with pytest.raises(ValueError):
+        pairwise_tests(summary, "tukey")
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from data_insight.incremental_load import read_new_file_rows
+
+
+def write_parquet(path, values, row_group_size=None):
+    pd.DataFrame({"value": values}).to_parquet(path, row_group_size=row_group_size)
+
+
+def test_parquet_reads_only_appended_rows(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    write_parquet(path, list(range(8)), row_group_size=4)
+    df, watermark, full = read_new_file_rows(path, "parquet", None)
+    assert full and df["value"].tolist() == list(range(8))
+
+    # Same leading rows in a rewritten file with more rows
+    write_parquet(path, list(range(12)), row_group_size=4)
+    df, watermark, full = read_new_file_rows(path, "parquet", watermark)
+    assert not full and df["value"].tolist() == [8, 9, 10, 11]
+
+
+def test_parquet_append_inside_a_row_group(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    write_parquet(path, list(range(6)))
+    _, watermark, _ = read_new_file_rows(path, "parquet", None)
+
+    write_parquet(path, list(range(9)))
+    df, _, full = read_new_file_rows(path, "parquet", watermark)
+    assert not full and df["value"].tolist() == [6, 7, 8]
+
+
+def test_parquet_rewrite_reloads_fully(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    write_parquet(path, list(range(8)))
+    _, watermark, _ = read_new_file_rows(path, "parquet", None)
+
+    write_parquet(path, list(range(100, 108)))
+    df, watermark, full = read_new_file_rows(path, "parquet", watermark)
+    assert full and df["value"].tolist() == list(range(100, 108))
+
+    write_parquet(path, list(range(200, 210)))
+    df, _, full = read_new_file_rows(path, "parquet", watermark)
+    assert full and df["value"].tolist() == list(range(200, 210))
+
+
+def test_parquet_watermark_without_fingerprint_reloads(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    write_parquet(path, list(range(4)))
+    df, _, full = read_new_file_rows(path, "parquet", {"kind": "row_count", "rows": 4})
+    assert full and len(df) == 4
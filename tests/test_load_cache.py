@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from data_insight import table_codec
+from data_insight.load_cache import LoadCache
+
+
+@pytest.fixture
+def cache(tmp_path) -> LoadCache:
+    return LoadCache(str(tmp_path / "cache"))
+
+
+def test_put_and_get(cache):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    cache.put("key", df, {"a": "int"})
+
+    cached_df, schema = cache.get("key")
+    pd.testing.assert_frame_equal(cached_df, df)
+    assert schema == {"a": "int"}
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_mixed_type_column_is_not_cached(cache, monkeypatch, arrow):
+    # As parsed from [{"a": 1, "b": 2}, {"a": "x", "b": 3}]
+    monkeypatch.setattr(table_codec, "has_pyarrow", lambda: arrow)
+    df = pd.DataFrame({"a": pd.Series([1, "x"], dtype=object), "b": [2, 3]})
+
+    cache.put("key", df, {})
+
+    assert cache.get("key") is None
+
+
+def test_corrupt_snapshot_is_a_miss(cache):
+    cache.put("key", pd.DataFrame({"a": range(100)}), {})
+    path = cache._read_index()["key"]["table"]["path"]
+    with open(path, "wb") as f:
+        f.write(b"not a snapshot")
+
+    assert cache.get("key") is None
+    assert "key" not in cache._read_index()
+
+    cache.put("key", pd.DataFrame({"a": range(3)}), {})
+    assert cache.get("key")[0]["a"].tolist() == [0, 1, 2]
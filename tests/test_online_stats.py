@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_insight.online_stats import OnlineStats, summarize_batches
+
+
+EXACT_ROWS = ["count", "mean", "std", "min", "max"]
+QUARTILES = {"25%": 0.25, "50%": 0.5, "75%": 0.75}
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 200_000
+    df = pd.DataFrame({
+        "a": rng.normal(5, 2, n),
+        "b": rng.integers(0, 100, n),
+        "c": pd.array(rng.integers(0, 9, n), dtype="Int64"),
+        "label": rng.choice(["x", "y"], n),
+    })
+    df.loc[::7, "a"] = np.nan
+    df.loc[::11, "c"] = pd.NA
+    return df
+
+
+def batches(df, rows=10_000):
+    return (df.iloc[start:start + rows] for start in range(0, len(df), rows))
+
+
+def assert_matches_describe(stats: OnlineStats, df: pd.DataFrame):
+    result = stats.describe()
+    expected = df.describe()
+
+    assert result.columns.tolist() == expected.columns.tolist()
+    pd.testing.assert_frame_equal(
+        result.loc[EXACT_ROWS].astype(float), expected.loc[EXACT_ROWS].astype(float), rtol=1e-9
+    )
+    for col in expected.columns:
+        values = np.sort(df[col].dropna().to_numpy(dtype=float))
+        for row, fraction in QUARTILES.items():
+            low = np.searchsorted(values, result.loc[row, col], side="left") / len(values)
+            high = np.searchsorted(values, result.loc[row, col], side="right") / len(values)
+            # The true rank of the estimate lies within the rank error of the fraction
+            assert low - stats.rank_error <= fraction <= high + stats.rank_error
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_summarize_batches_matches_describe(frame, workers):
+    assert_matches_describe(summarize_batches(batches(frame), workers=workers), frame)
+
+
+def test_merge_of_disjoint_accumulators(frame):
+    parts = [OnlineStats(seed=i) for i in range(3)]
+    for i, batch in enumerate(batches(frame, 25_000)):
+        parts[i % 3].update(batch)
+    merged = parts[0]
+    merged.merge(parts[1])
+    merged.merge(parts[2])
+    assert_matches_describe(merged, frame)
+
+
+def test_columns_missing_from_some_batches():
+    first = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    second = pd.DataFrame({"a": [4.0], "b": [10.0]})
+    stats = summarize_batches([first, second])
+    result = stats.describe()
+
+    assert result.loc["count"].tolist() == [4, 1]
+    assert result.loc["mean", "a"] == pytest.approx(2.5)
+    assert np.isnan(result.loc["std", "b"])
+
+
+def test_empty_batches():
+    stats = summarize_batches([pd.DataFrame({"a": pd.Series([], dtype=float)})])
+    result = stats.describe()
+    assert result.loc["count", "a"] == 0
+    assert result.loc[["mean", "min", "max", "50%"], "a"].isna().all()
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_insight.sampling import sample_reference_table
+from data_insight.table_codec import write_table_reference
+
+
+@pytest.fixture(params=["arrow", "parquet"])
+def reference_table(request, tmp_path, monkeypatch):
+    monkeypatch.setattr("data_insight.table_codec.has_pyarrow", lambda: request.param == "arrow")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "region": rng.choice(["north", "south", "east"], 20000),
+        "value": np.arange(20000),
+    })
+    return write_table_reference(df, {}, str(tmp_path))
+
+
+def test_stratified_reference_sample_is_reproducible(reference_table):
+    first, metadata = sample_reference_table(reference_table, "stratified", fraction=0.1, stratify_by="region", seed=42)
+    second, _ = sample_reference_table(reference_table, "stratified", fraction=0.1, stratify_by="region", seed=42)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert first.columns.tolist() == ["region", "value"]
+    for stratum in metadata["strata"].values():
+        assert stratum["sample"] == -(-stratum["population"] // 10)
+
+
+def test_stratified_reference_sample_depends_on_seed(reference_table):
+    # Seeds that agree modulo 1000 must still draw different samples
+    first, _ = sample_reference_table(reference_table, "stratified", fraction=0.1, stratify_by="region", seed=42)
+    second, _ = sample_reference_table(reference_table, "stratified", fraction=0.1, stratify_by="region", seed=1042)
+    assert set(first["value"]) != set(second["value"])
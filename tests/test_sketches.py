@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_insight.sketches import (
+    FrequentItems,
+    HyperLogLog,
+    KLLSketch,
+    TableSketch,
+    hash_values,
+)
+
+
+def test_hyperloglog_within_error_bound():
+    values = pd.Series([f"user{i}" for i in range(200_000)])
+    sketch = HyperLogLog()
+    sketch.update_hashes(hash_values(values))
+    # Four standard errors
+    assert abs(sketch.estimate() - 200_000) <= 4 * sketch.relative_error * 200_000
+
+
+def test_hyperloglog_small_cardinality_is_nearly_exact():
+    sketch = HyperLogLog()
+    sketch.update_hashes(hash_values(pd.Series([f"v{i % 100}" for i in range(10_000)])))
+    assert abs(sketch.estimate() - 100) <= 2
+
+
+def test_hyperloglog_merge_equals_single_pass():
+    values = pd.Series([f"user{i}" for i in range(50_000)])
+    single, first, second = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    single.update_hashes(hash_values(values))
+    first.update_hashes(hash_values(values[:30_000]))
+    second.update_hashes(hash_values(values[20_000:]))
+    first.merge(second)
+    np.testing.assert_array_equal(first.registers, single.registers)
+
+
+def test_hash_is_independent_of_chunk_dtype():
+    # A later chunk with mixed types must not rehash the values seen before
+    strings = pd.Series(["a", "b", "c"])
+    mixed = pd.Series(["a", "b", "c", 1], dtype=object)
+    categories = pd.Series(["c", "a", "b"]).astype("category")
+    np.testing.assert_array_equal(hash_values(mixed)[:3], hash_values(strings))
+    np.testing.assert_array_equal(hash_values(categories), hash_values(pd.Series(["c", "a", "b"])))
+
+    sketch = TableSketch()
+    sketch.update(pd.DataFrame({"code": [f"k{i}" for i in range(1000)] * 2}))
+    sketch.update(pd.DataFrame({"code": pd.Series([f"k{i}" for i in range(1000)] + [7], dtype=object)}))
+    assert sketch.columns["code"].distinct.estimate() == pytest.approx(1001, abs=5)
+
+
+@pytest.mark.parametrize("chunks", [1, 8])
+def test_kll_quantiles_within_rank_error(chunks):
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=400_000)
+    sketches = [KLLSketch(seed=i) for i in range(chunks)]
+    for sketch, part in zip(sketches, np.array_split(values, chunks)):
+        for batch in np.array_split(part, 10):
+            sketch.update(batch)
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+
+    fractions = [0.01, 0.25, 0.5, 0.75, 0.99]
+    ordered = np.sort(values)
+    assert sketch.count == len(values)
+    for fraction, estimate in zip(fractions, sketch.quantiles(fractions)):
+        rank = np.searchsorted(ordered, estimate) / len(values)
+        assert abs(rank - fraction) <= sketch.rank_error
+    assert sketch.quantiles([0, 1]) == [values.min(), values.max()]
+
+
+def test_frequent_items_error_bound():
+    rng = np.random.default_rng(1)
+    heavy = np.repeat([f"top{i}" for i in range(5)], [5000, 4000, 3000, 2000, 1000])
+    tail = np.array([f"rare{i}" for i in rng.integers(0, 50_000, 60_000)])
+    values = pd.Series(rng.permutation(np.concatenate([heavy, tail])))
+    truth = values.value_counts()
+
+    first, second = FrequentItems(capacity=64), FrequentItems(capacity=64)
+    for part, sketch in ((values[:40_000], first), (values[40_000:], second)):
+        for start in range(0, len(part), 7000):
+            sketch.update(part.iloc[start:start + 7000])
+    first.merge(second)
+
+    assert not first.exact
+    assert first.max_error <= len(values) / (first.capacity + 1)
+    for value, count in first.counts.items():
+        assert truth[value] - first.max_error <= count <= truth[value]
+    # Every value more frequent than the error bound survives
+    assert [value for value, _ in first.top(5)] == [f"top{i}" for i in range(5)]
+
+
+def test_frequent_items_exact_below_capacity():
+    sketch = FrequentItems(capacity=10)
+    sketch.update(pd.Series(["a", "b", "a", None, "c", "a"]))
+    assert sketch.exact
+    assert sketch.counts.to_dict() == {"a": 3, "b": 1, "c": 1}
@@ -0,0 +1,71 @@
+import asyncio
+import importlib.util
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("oocana")
+pytest.importorskip("openai")
+
+from data_insight import encode_table  # noqa: E402
+
+
+TASK_PATH = pathlib.Path(__file__).parents[1] / "tasks" / "statistical-analyzer" / "__init__.py"
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    spec = importlib.util.spec_from_file_location("statistical_analyzer", TASK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeContext:
+    def __init__(self, session_dir):
+        self.session_dir = session_dir
+
+    def report_progress(self, progress):
+        pass
+
+    def preview(self, payload):
+        pass
+
+
+def run_all(analyzer, monkeypatch, df, session_dir, variables=None):
+    async def interpretation(*args):
+        return ""
+
+    monkeypatch.setattr(analyzer, "generate_interpretation", interpretation)
+    params = {
+        "data_table": encode_table(df, {}),
+        "analysis_type": "all",
+        "variables": variables,
+        "llm": {},
+    }
+    return asyncio.run(analyzer.main(params, FakeContext(str(session_dir))))
+
+
+def test_all_mode_with_a_single_numeric_column(analyzer, monkeypatch, tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"value": rng.normal(size=200), "label": rng.choice(["a", "b"], 200)})
+
+    analyses = run_all(analyzer, monkeypatch, df, tmp_path)["test_result"]["analyses"]
+
+    assert list(analyses) == ["descriptive_stats", "normality_test"]
+    assert "error" not in analyses["descriptive_stats"]
+    assert "error" not in analyses["normality_test"]
+
+
+def test_all_mode_keeps_results_of_other_analyses(analyzer, monkeypatch, tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"value": rng.normal(size=200)})
+
+    result = run_all(analyzer, monkeypatch, df, tmp_path, {"analyses": ["descriptive_stats", "correlation"]})
+    analyses = result["test_result"]["analyses"]
+
+    assert "summary" in analyses["descriptive_stats"]
+    assert "at least 2 numeric" in analyses["correlation"]["error"]
+    assert result["visualizations"]["correlation"] is None
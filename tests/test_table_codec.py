@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_insight import table_codec
+from data_insight.table_codec import (
+    DataFrameCache,
+    content_hash_of,
+    decode_table,
+    decode_table_uncached,
+    encode_table,
+    iter_table_batches,
+    table_row_count,
+    write_table_reference,
+)
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "price": [1.5, np.nan, 3.25, 4.0],
+        "name": ["a", "b", None, "d"],
+        "when": pd.to_datetime(["2024-01-01", "2024-01-02", None, "2024-01-04"]),
+        "flag": [True, False, True, False],
+    })
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    table_codec.clear_table_cache()
+    yield
+    table_codec.clear_table_cache()
+
+
+@pytest.mark.parametrize("table_format", ["rows", "columnar"])
+def test_inline_round_trip(frame, table_format):
+    table = encode_table(frame, {}, table_format)
+    decoded = decode_table_uncached(table)
+
+    assert decoded.columns.tolist() == frame.columns.tolist()
+    assert table_row_count(table) == len(frame)
+    assert decoded["id"].tolist() == frame["id"].tolist()
+    assert decoded["price"].isna().tolist() == frame["price"].isna().tolist()
+    assert decoded["name"].isna().tolist() == frame["name"].isna().tolist()
+
+
+def test_columnar_restores_dtypes(frame):
+    decoded = decode_table_uncached(encode_table(frame, {}, "columnar"))
+    pd.testing.assert_frame_equal(decoded, frame, check_dtype=True)
+
+
+def test_reference_round_trip(frame, tmp_path):
+    table = write_table_reference(frame, {"id": "int"}, str(tmp_path))
+
+    assert table["format"] == "reference"
+    assert table["row_count"] == len(frame)
+    pd.testing.assert_frame_equal(decode_table_uncached(table), frame)
+
+    batches = list(iter_table_batches(table, batch_rows=3))
+    assert [len(batch) for batch in batches] == [3, 1]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), frame)
+
+
+def test_small_reference_stays_inline(frame, tmp_path):
+    table = encode_table(frame, {}, "reference", str(tmp_path))
+    assert table["format"] == "columnar"
+
+
+def test_fingerprint_is_stable_and_content_based(frame):
+    assert content_hash_of(frame) == content_hash_of(frame.copy())
+    assert encode_table(frame, {}, "rows")["fingerprint"] == encode_table(frame, {}, "columnar")["fingerprint"]
+
+    changed = frame.copy()
+    changed.loc[0, "price"] = 9.0
+    assert content_hash_of(changed) != content_hash_of(frame)
+    assert content_hash_of(frame.astype({"id": "float64"})) != content_hash_of(frame)
+
+
+def test_decode_is_served_from_cache(frame):
+    table = encode_table(frame, {}, "rows")
+    # A cache hit never looks at the rows
+    table["rows"] = []
+    assert len(decode_table(table)) == len(frame)
+
+
+def test_cached_frame_cannot_be_modified_through_a_view(frame):
+    table = encode_table(frame, {}, "columnar")
+    view = decode_table(table)
+    view.loc[0, "id"] = 100
+    assert decode_table(table).loc[0, "id"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    df = pd.DataFrame({"x": np.arange(1000, dtype=np.int64)})
+    size = int(df.memory_usage(deep=True).sum())
+    cache = DataFrameCache(max_bytes=2 * size)
+
+    cache.put("a", df)
+    cache.put("b", df)
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", df)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.total_bytes == 2 * size
+
+
+def test_cache_skips_frames_over_the_cap():
+    df = pd.DataFrame({"x": np.arange(1000, dtype=np.int64)})
+    cache = DataFrameCache(max_bytes=100)
+    cache.put("a", df)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_reference_falls_back_inline_for_mixed_object_columns(tmp_path, monkeypatch, arrow):
+    monkeypatch.setattr(table_codec, "INLINE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(table_codec, "has_pyarrow", lambda: arrow)
+    df = pd.DataFrame({"a": pd.Series([1, "x", [2]], dtype=object), "b": [2, 3, 4]})
+
+    table = encode_table(df, {}, "reference", str(tmp_path))
+
+    assert table["format"] == "columnar"
+    assert decode_table_uncached(table)["a"].tolist() == [1, "x", [2]]
+    assert not list((tmp_path / "tables").glob("*"))